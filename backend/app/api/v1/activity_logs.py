@@ -5,7 +5,8 @@
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.core.dependencies import get_firebase_uid
 from app.schemas.activity_log import (
@@ -14,13 +15,18 @@ from app.schemas.activity_log import (
     ActivityLogFilter,
     ActivityLogResponse,
 )
-from app.services.activity_log_service import activity_log_service
+from app.services.activity_log_service import (
+    activity_log_buffer,
+    activity_log_service,
+)
 
-router = APIRouter()
+# 활동 로그 조회는 폭이 넓은 레코드를 대량으로 반환하므로
+# C 구현 직렬화기(orjson)로 JSON 인코딩 비용을 줄입니다.
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 
-@router.post("/", response_model=ActivityLogResponse, summary="활동 로그 생성")
+@router.post("/", status_code=status.HTTP_202_ACCEPTED, summary="활동 로그 생성")
 def create_activity_log(
     log_data: ActivityLogCreate, firebase_uid: str = Depends(get_firebase_uid)
 ):
@@ -30,16 +36,18 @@ def create_activity_log(
     - What2Eat에서 사용자 행동 발생 시 호출
     - Firebase ID Token으로 인증
     - ML 추천 모델 학습용 데이터 수집
+    - 버퍼에 적재 후 즉시 202 반환 (DB 왕복은 배치 flush 스레드가 담당)
     """
     # Firebase UID 검증 (요청한 사용자와 로그의 사용자가 일치하는지)
     if log_data.firebase_uid != firebase_uid:
         logger.warning(
             f"Firebase UID mismatch: {firebase_uid} vs {log_data.firebase_uid}"
         )
-        # 보안을 위해 요청한 사용자의 UID로 강제 설정
-        log_data.firebase_uid = firebase_uid
+        # 보안을 위해 요청한 사용자의 UID로 강제 설정 (모델은 frozen)
+        log_data = log_data.model_copy(update={"firebase_uid": firebase_uid})
 
-    return activity_log_service.create_log(log_data)
+    activity_log_buffer.enqueue(log_data)
+    return {"status": "accepted"}
 
 
 @router.get(
@@ -130,10 +138,17 @@ def export_logs_for_ml(export_params: ActivityLogExport):
     ML 학습용 데이터 추출
 
     - 관리자 전용 (추후 권한 체크 추가 필요)
-    - JSON 또는 CSV 형식으로 추출
+    - JSON 또는 CSV 형식으로 추출 (CSV는 스트리밍으로 내려감)
     - 날짜 범위 및 이벤트 타입 필터링
     """
     # TODO: 관리자 권한 체크 추가
+    if export_params.format == "csv":
+        # CSV는 전체 결과를 메모리에 올리지 않고 조각 단위로 스트리밍
+        return StreamingResponse(
+            activity_log_service.iter_export_csv(export_params),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="activity_logs.csv"'},
+        )
     return activity_log_service.export_logs_for_ml(export_params)
 
 
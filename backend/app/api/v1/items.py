@@ -4,7 +4,13 @@ from fastapi import APIRouter, HTTPException, Query, status
 
 from app.core.db import db
 from app.database import base_queries
-from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
+from app.database.review_queries import GET_AVERAGE_RATING_BY_ITEM
+from app.schemas.item import (
+    ItemCreate,
+    ItemRatingResponse,
+    ItemResponse,
+    ItemUpdate,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -137,6 +143,44 @@ def get_item(item_id: int):
         )
 
 
+@router.get(
+    "/{item_id}/rating",
+    response_model=ItemRatingResponse,
+    tags=["items"],
+    summary="아이템 평점 조회",
+)
+def get_item_rating(item_id: int):
+    """특정 아이템의 평균 평점/리뷰 수 조회
+
+    리뷰 전체를 집계하는 대신 트리거가 유지하는 items.avg_rating /
+    review_count 컬럼을 단일 행 PK 조회로 읽습니다.
+    """
+    try:
+        with db.get_cursor() as (cursor, conn):
+            cursor.execute(GET_AVERAGE_RATING_BY_ITEM, (item_id,))
+
+            result = cursor.fetchone()
+            if not result:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Item not found"
+                )
+
+            return ItemRatingResponse(
+                item_id=item_id,
+                average_rating=result["average_rating"],
+                review_count=result["review_count"],
+            )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting item rating: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+
 @router.put(
     "/{item_id}", response_model=ItemResponse, tags=["items"], summary="아이템 수정"
 )
@@ -48,6 +48,18 @@ def list_reviewers(
     )
 
 
+# /top은 /{reviewer_id}보다 먼저 등록해야 경로 매칭에서 가려지지 않습니다
+@router.get(
+    "/top",
+    response_model=list[KakaoReviewerResponse],
+    tags=["kakao-reviewers"],
+    summary="상위 리뷰어 리더보드 조회",
+)
+def list_top_reviewers(limit: int = Query(100, ge=1, le=1000)):
+    """리뷰 수 기준 상위 리뷰어 리더보드 조회 (구체화 뷰 기반)"""
+    return reviewer_service.get_top_reviewers(limit=limit)
+
+
 @router.get(
     "/{reviewer_id}",
     response_model=KakaoReviewerResponse,
@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi.responses import ORJSONResponse
 
 from app.schemas.recommendation import (
     InitModelResponse,
@@ -54,7 +55,10 @@ async def get_personalized_ranked_diners(request: PersonalRecRequest):
         firebase_uid=request.firebase_uid,
         diner_ids=request.diner_ids,
     )
-    return PersonalRecResponse(diner_ids=diner_ids, scores=scores)
+    # 점수/id 리스트는 벡터 DB에서 이미 원시 int/float로 나오므로
+    # 모델 구성 + 응답 재검증 대신 orjson 한 번으로 바로 직렬화합니다.
+    # (response_model 선언은 OpenAPI 문서용으로 유지)
+    return ORJSONResponse({"diner_ids": diner_ids, "scores": scores})
 
 
 @router.post(
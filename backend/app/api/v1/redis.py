@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Body, HTTPException, status
+from fastapi.responses import ORJSONResponse
 
 from app.core.redis_db import redis_db
 from app.schemas.redis_schemas import (
@@ -11,9 +12,17 @@ from app.schemas.redis_schemas import (
 )
 from app.services.redis_service import RedisService
 
-router = APIRouter()
+# 핸들러가 ORJSONResponse를 직접 반환하지 않는 경로도 orjson으로
+# 직렬화되도록 라우터 기본 응답 클래스를 고정해 둡니다.
+router = APIRouter(default_response_class=ORJSONResponse)
 redis_service = RedisService(redis_client=None)
 
+# 응답은 success/message/data/stats 형태의 단순 봉투(dict[str, Any])라서
+# pydantic이 깊게 검증할 내용이 없습니다. 핸들러에서 ORJSONResponse를
+# 직접 반환하면 응답 모델 재검증과 jsonable_encoder 순회를 건너뛰고
+# orjson 한 번으로 인코딩합니다. response_model 선언은 OpenAPI 문서용으로
+# 유지합니다.
+
 
 @router.post(
     "/",
@@ -36,13 +45,16 @@ async def create_redis_keys(request: RedisCreateRequest):
     succeeded = sum(1 for v in results.values() if v)
     failed = len(results) - succeeded
 
-    return RedisResponse(
-        success=failed == 0,
-        message=f"Created {succeeded} key(s)"
-        if failed == 0
-        else f"Created {succeeded}/{len(results)} key(s)",
-        data=results,
-        stats={"total": len(results), "succeeded": succeeded, "failed": failed},
+    return ORJSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content={
+            "success": failed == 0,
+            "message": f"Created {succeeded} key(s)"
+            if failed == 0
+            else f"Created {succeeded}/{len(results)} key(s)",
+            "data": results,
+            "stats": {"total": len(results), "succeeded": succeeded, "failed": failed},
+        },
     )
 
 
@@ -65,13 +77,15 @@ async def read_redis_keys(request: RedisReadRequest = Body(...)):
     found = sum(1 for v in results.values() if v is not None)
     not_found = len(results) - found
 
-    return RedisReadResponse(
-        success=True,
-        message=f"Read {found} key(s)"
-        if not_found == 0
-        else f"Read {found}/{len(results)} key(s)",
-        data=results,
-        stats={"total": len(results), "found": found, "not_found": not_found},
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": f"Read {found} key(s)"
+            if not_found == 0
+            else f"Read {found}/{len(results)} key(s)",
+            "data": results,
+            "stats": {"total": len(results), "found": found, "not_found": not_found},
+        }
     )
 
 
@@ -95,13 +109,15 @@ async def update_redis_keys(request: RedisUpdateRequest):
     succeeded = sum(1 for v in results.values() if v)
     failed = len(results) - succeeded
 
-    return RedisResponse(
-        success=failed == 0,
-        message=f"Updated {succeeded} key(s)"
-        if failed == 0
-        else f"Updated {succeeded}/{len(results)} key(s)",
-        data=results,
-        stats={"total": len(results), "succeeded": succeeded, "failed": failed},
+    return ORJSONResponse(
+        {
+            "success": failed == 0,
+            "message": f"Updated {succeeded} key(s)"
+            if failed == 0
+            else f"Updated {succeeded}/{len(results)} key(s)",
+            "data": results,
+            "stats": {"total": len(results), "succeeded": succeeded, "failed": failed},
+        }
     )
 
 
@@ -124,13 +140,15 @@ async def delete_redis_keys(request: RedisDeleteRequest = Body(...)):
     succeeded = sum(1 for v in results.values() if v)
     failed = len(results) - succeeded
 
-    return RedisResponse(
-        success=failed == 0,
-        message=f"Deleted {succeeded} key(s)"
-        if failed == 0
-        else f"Deleted {succeeded}/{len(results)} key(s)",
-        data=results,
-        stats={"total": len(results), "succeeded": succeeded, "failed": failed},
+    return ORJSONResponse(
+        {
+            "success": failed == 0,
+            "message": f"Deleted {succeeded} key(s)"
+            if failed == 0
+            else f"Deleted {succeeded}/{len(results)} key(s)",
+            "data": results,
+            "stats": {"total": len(results), "succeeded": succeeded, "failed": failed},
+        }
     )
 
 
@@ -211,9 +229,11 @@ async def redis_health_check():
             detail="Redis is not available",
         )
 
-    return RedisResponse(
-        success=True,
-        message="Redis is healthy",
-        data={"status": "connected"},
-        is_bulk=False,
+    return ORJSONResponse(
+        {
+            "success": True,
+            "message": "Redis is healthy",
+            "data": {"status": "connected"},
+            "stats": {},
+        }
     )
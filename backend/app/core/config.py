@@ -63,6 +63,12 @@ class Settings(BaseSettings):
     # 데이터베이스 마이그레이션 설정
     run_migrations: bool = True  # 기본값: True (마이그레이션 실행)
 
+    # 마이그레이션 실행 방식
+    # - async: 백그라운드 태스크로 실행 (서버가 즉시 트래픽 수신, 기본값)
+    # - sync: 기존처럼 기동 전에 완료될 때까지 대기
+    # - skip: DDL/마이그레이션 전체 생략 (스키마가 준비된 이미지용)
+    migration_mode: str = "async"
+
     # config path
     config_root_path: str = "/app/config/beta"
     node2vec_config_path: str = "/app/config/beta/models/graph/node2vec.yaml"
@@ -79,6 +85,14 @@ class Settings(BaseSettings):
         # 기본값은 True
         return True
 
+    @field_validator("migration_mode", mode="before")
+    @classmethod
+    def parse_migration_mode(cls, v):
+        """MIGRATION_MODE 환경 변수 검증 (잘못된 값은 async로 대체)"""
+        if isinstance(v, str) and v.lower() in ("async", "sync", "skip"):
+            return v.lower()
+        return "async"
+
     @field_validator("allowed_origins", mode="before")
     @classmethod
     def parse_allowed_origins(cls, v):
@@ -0,0 +1,83 @@
+"""
+순수 ASGI CORS 미들웨어
+
+Starlette CORSMiddleware는 요청마다 Headers 래퍼 객체를 만들고 문자열
+비교 경로를 거칩니다. 프록시 뒤에서 초 단위 probe와 고빈도 조회가 같은
+앱을 때리는 환경에서는 이 프레임당 오버헤드도 아까우므로, scope의 원시
+바이트 헤더만 보고 동작하는 최소 구현으로 대체합니다. 허용 헤더는 기동
+시 바이트 튜플로 미리 인코딩해 두고, preflight(OPTIONS)는 라우터까지
+내려가지 않고 즉시 응답합니다.
+"""
+
+
+class ASGICORSMiddleware:
+    """설정된 origin 목록 기반의 최소 CORS 처리 (credentials 허용)"""
+
+    PREFLIGHT_ALLOW_METHODS = b"GET, POST, PUT, PATCH, DELETE, OPTIONS"
+
+    def __init__(self, app, allow_origins: list[str]):
+        self.app = app
+        self.allow_all = "*" in allow_origins
+        # origin 비교는 바이트로 수행 (scope 헤더는 latin-1 바이트)
+        # 기동 후 변하지 않는 집합이므로 frozenset으로 고정
+        self.allow_origins = frozenset(
+            origin.encode("latin-1") for origin in allow_origins if origin != "*"
+        )
+        # 응답 헤더는 기동 시 미리 인코딩 (요청마다 재생성하지 않음)
+        self._simple_headers = (
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        )
+        self._preflight_headers = (
+            (b"access-control-allow-methods", self.PREFLIGHT_ALLOW_METHODS),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-max-age", b"600"),
+            (b"vary", b"Origin"),
+        )
+
+    def _is_allowed(self, origin: bytes) -> bool:
+        return self.allow_all or origin in self.allow_origins
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # CORS 요청이 아니거나 허용되지 않은 origin이면 그대로 통과
+        # (허용 헤더를 붙이지 않으면 브라우저가 차단)
+        if origin is None or not self._is_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            # preflight 즉시 응답
+            headers = [
+                (b"access-control-allow-origin", origin),
+                *self._preflight_headers,
+            ]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"access-control-allow-origin", origin),
+                    *self._simple_headers,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -1,40 +1,92 @@
+import asyncio
 import logging
+import threading
 from contextlib import contextmanager
 
-import psycopg2
 from psycopg2.extras import RealDictCursor
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
+# 풀 크기는 최악 동시성(FastAPI sync 엔드포인트 스레드풀 ~40 +
+# async 모드 마이그레이션/인덱스 빌드 스레드 + 활동 로그 flush 스레드)
+# 을 웃돌게 잡습니다.
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = 50
+
+# 풀 고갈 시 즉시 실패하는 대신 대여를 기다리는 최대 시간 (초)
+POOL_ACQUIRE_TIMEOUT = 5.0
+
 
 class Database:
     def __init__(self):
         self.connection_string = settings.database_url
-        # SQLAlchemy 엔진 생성
-        self.engine = create_engine(self.connection_string)
-        self.SessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine
+        # SQLAlchemy 비동기 엔진 (asyncpg 드라이버)
+        # DDL과 ORM 세션이 이벤트 루프를 막지 않고 실행됩니다.
+        self.async_connection_string = self.connection_string.replace(
+            "postgresql://", "postgresql+asyncpg://", 1
+        )
+        self.engine = create_async_engine(self.async_connection_string)
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine, expire_on_commit=False, autoflush=False
         )
+        # 커넥션 풀은 첫 사용 시점에 생성 (임포트 시 DB 연결 시도 방지)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # getconn은 풀이 비면 대기 없이 PoolError를 던지므로, 세마포어로
+        # 대여 가능 슬롯을 세어 고갈 시 한정된 시간만큼 블로킹합니다
+        self._pool_slots = threading.BoundedSemaphore(POOL_MAX_CONNECTIONS)
+
+    def _ensure_pool(self) -> ThreadedConnectionPool:
+        """커넥션 풀 지연 초기화
+
+        요청마다 connect/close를 반복하면 접속 비용(백엔드 fork, 인증)을
+        매번 치르고, Postgres의 커넥션 단위 플랜 캐시도 전혀 활용하지
+        못합니다. 풀로 커넥션을 재사용해 반복 실행되는 정적 쿼리가
+        같은 백엔드에서 계속 처리되도록 합니다.
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(
+                        minconn=POOL_MIN_CONNECTIONS,
+                        maxconn=POOL_MAX_CONNECTIONS,
+                        dsn=self.connection_string,
+                        cursor_factory=RealDictCursor,
+                    )
+        return self._pool
 
     @contextmanager
     def get_connection(self):
-        """데이터베이스 연결 컨텍스트 매니저"""
-        conn = None
-        try:
-            conn = psycopg2.connect(
-                self.connection_string, cursor_factory=RealDictCursor
+        """데이터베이스 연결 컨텍스트 매니저 (풀에서 대여/반납)
+
+        풀이 고갈되면 즉시 실패하는 대신 POOL_ACQUIRE_TIMEOUT 동안
+        반납을 기다립니다. 순간 부하(시작 직후 인덱스 빌드 + 트래픽)로
+        동시 사용자가 풀 크기를 넘어도 대기 후 처리되고, 타임아웃을
+        넘길 때만 PoolError로 실패합니다.
+        """
+        pool = self._ensure_pool()
+        if not self._pool_slots.acquire(timeout=POOL_ACQUIRE_TIMEOUT):
+            raise PoolError(
+                f"커넥션 풀 고갈: {POOL_ACQUIRE_TIMEOUT}초 내에 반납된 커넥션이 없습니다"
             )
+        try:
+            conn = pool.getconn()
+        except Exception:
+            self._pool_slots.release()
+            raise
+        try:
             yield conn
         except Exception as e:
-            if conn:
+            if conn and not conn.closed:
                 conn.rollback()
             logging.error(f"Database connection error: {e}")
             raise
         finally:
-            if conn:
-                conn.close()
+            # putconn은 트랜잭션이 남아 있으면 롤백 후 풀에 반납
+            pool.putconn(conn)
+            self._pool_slots.release()
 
     @contextmanager
     def get_cursor(self):
@@ -50,47 +102,55 @@ class Database:
             finally:
                 cursor.close()
 
-    def create_tables(self):
+    async def create_tables(self):
         """모든 테이블을 생성합니다 (모델 기반)"""
         try:
             from app.models.base import Base
 
-            Base.metadata.create_all(bind=self.engine)
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
 
-            # ULID 기본값 설정 함수 실행 (함수가 존재하는 경우에만)
-            # ULID는 Python 레벨에서 생성되므로 이 함수는 선택적입니다
-            try:
-                with self.get_connection() as conn:
-                    cursor = conn.cursor()
-                    # 함수 존재 여부 확인
-                    cursor.execute("""
-                        SELECT EXISTS (
-                            SELECT 1 FROM pg_proc 
-                            WHERE proname = 'set_ulid_defaults'
-                        );
-                    """)
-                    function_exists = cursor.fetchone()[0]
-
-                    if function_exists:
-                        cursor.execute("SELECT set_ulid_defaults();")
-                        conn.commit()
-                        logging.info("ULID 기본값 설정 함수 실행 완료")
-                    else:
-                        logging.debug(
-                            "set_ulid_defaults() 함수가 없습니다. ULID는 Python 레벨에서 생성됩니다."
-                        )
-                    cursor.close()
-            except Exception as e:
-                # 함수 실행 실패는 치명적이지 않음 (ULID는 Python에서 생성됨)
-                logging.warning(f"ULID 기본값 설정 함수 실행 중 오류 (무시됨): {e}")
+            # ULID 기본값 설정은 psycopg2 동기 커넥션을 쓰므로 스레드로 위임
+            await asyncio.to_thread(self._run_ulid_defaults)
 
             logging.info("데이터베이스 테이블 생성 완료")
         except Exception as e:
             logging.error(f"테이블 생성 중 오류: {e}")
             raise
 
+    def _run_ulid_defaults(self):
+        """ULID 기본값 설정 함수 실행 (함수가 존재하는 경우에만)
+
+        ULID는 Python 레벨에서 생성되므로 이 함수는 선택적입니다
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # 함수 존재 여부 확인
+                # (풀 커서는 RealDictCursor라 위치 인덱스 대신 컬럼명으로 접근)
+                cursor.execute("""
+                    SELECT EXISTS (
+                        SELECT 1 FROM pg_proc
+                        WHERE proname = 'set_ulid_defaults'
+                    ) AS function_exists;
+                """)
+                function_exists = cursor.fetchone()["function_exists"]
+
+                if function_exists:
+                    cursor.execute("SELECT set_ulid_defaults();")
+                    conn.commit()
+                    logging.info("ULID 기본값 설정 함수 실행 완료")
+                else:
+                    logging.debug(
+                        "set_ulid_defaults() 함수가 없습니다. ULID는 Python 레벨에서 생성됩니다."
+                    )
+                cursor.close()
+        except Exception as e:
+            # 함수 실행 실패는 치명적이지 않음 (ULID는 Python에서 생성됨)
+            logging.warning(f"ULID 기본값 설정 함수 실행 중 오류 (무시됨): {e}")
+
     def get_session(self):
-        """SQLAlchemy 세션을 반환합니다"""
+        """SQLAlchemy 비동기 세션을 반환합니다"""
         return self.SessionLocal()
 
 
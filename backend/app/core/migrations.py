@@ -3,6 +3,7 @@
 Alembic 대신 직접 SQL을 실행하는 방식으로 마이그레이션을 관리합니다.
 """
 
+import asyncio
 import logging
 
 from app.core.db import db
@@ -123,6 +124,179 @@ def migrate_diner_review_cnt_to_integer():
         raise
 
 
+def drop_diner_scores_projection():
+    """
+    정렬용 프로젝션 테이블(kakao_diner_scores) 제거
+
+    실제 목록 조회 경로(get_list_filtered)는 프로젝션에 없는 컬럼으로
+    필터링하기 때문에 이 테이블을 읽는 코드가 없었고, 동기화 트리거만
+    kakao_diner의 모든 쓰기에 비용을 얹고 있었습니다. 이미 생성된
+    환경에서도 트리거 비용이 사라지도록 멱등하게 정리합니다.
+    """
+    try:
+        with db.get_cursor() as (cursor, conn):
+            cursor.execute(
+                "DROP TRIGGER IF EXISTS trg_sync_kakao_diner_scores ON kakao_diner"
+            )
+            cursor.execute("DROP FUNCTION IF EXISTS sync_kakao_diner_scores()")
+            cursor.execute("DROP TABLE IF EXISTS kakao_diner_scores")
+            conn.commit()
+            logger.info("kakao_diner_scores 프로젝션 테이블 정리 완료")
+            return True
+    except Exception as e:
+        logger.error(f"kakao_diner_scores 프로젝션 테이블 정리 중 오류 발생: {e}")
+        raise
+
+
+def create_item_rating_aggregates():
+    """
+    items 테이블에 리뷰 집계 컬럼(avg_rating, review_count) 추가 및 동기화
+
+    GET_AVERAGE_RATING_BY_ITEM이 호출마다 해당 아이템의 리뷰 전체를
+    스캔했는데, 집계를 컬럼으로 유지하면 단일 행 PK 조회로 끝납니다.
+    쓰기 시 트리거가 해당 아이템의 집계만 다시 계산합니다.
+    """
+    try:
+        add_column_if_not_exists("items", "avg_rating", "NUMERIC(3,2)")
+        add_column_if_not_exists(
+            "items", "review_count", "INTEGER", nullable=False, default_value="0"
+        )
+
+        with db.get_cursor() as (cursor, conn):
+            # 기존 리뷰 데이터 백필 (재실행해도 안전)
+            cursor.execute("""
+                UPDATE items SET
+                    review_count = sub.cnt,
+                    avg_rating = sub.avg
+                FROM (
+                    SELECT item_id, COUNT(*) AS cnt,
+                           AVG(score)::NUMERIC(3,2) AS avg
+                    FROM reviews GROUP BY item_id
+                ) sub
+                WHERE items.id = sub.item_id
+            """)
+
+            # reviews 변경 시 해당 아이템의 집계만 재계산하는 트리거
+            cursor.execute("""
+                CREATE OR REPLACE FUNCTION sync_item_rating()
+                RETURNS trigger AS $$
+                DECLARE
+                    target_item VARCHAR(26);
+                BEGIN
+                    IF TG_OP = 'DELETE' THEN
+                        target_item := OLD.item_id;
+                    ELSE
+                        target_item := NEW.item_id;
+                    END IF;
+
+                    UPDATE items SET
+                        review_count = sub.cnt,
+                        avg_rating = sub.avg
+                    FROM (
+                        SELECT COUNT(*) AS cnt,
+                               AVG(score)::NUMERIC(3,2) AS avg
+                        FROM reviews WHERE item_id = target_item
+                    ) sub
+                    WHERE items.id = target_item;
+
+                    IF TG_OP = 'DELETE' THEN
+                        RETURN OLD;
+                    END IF;
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql
+            """)
+            cursor.execute("DROP TRIGGER IF EXISTS trg_sync_item_rating ON reviews")
+            cursor.execute("""
+                CREATE TRIGGER trg_sync_item_rating
+                AFTER INSERT OR UPDATE OR DELETE ON reviews
+                FOR EACH ROW EXECUTE FUNCTION sync_item_rating()
+            """)
+
+            conn.commit()
+            logger.info("items 리뷰 집계 컬럼 동기화 설정 완료")
+            return True
+    except Exception as e:
+        logger.error(f"items 리뷰 집계 마이그레이션 중 오류 발생: {e}")
+        raise
+
+
+def create_top_reviewers_view():
+    """
+    상위 리뷰어 리더보드용 구체화 뷰(mv_top_kakao_reviewers) 생성
+
+    GET_TOP_REVIEWERS는 호출마다 kakao_reviewer 전체를 정렬했는데,
+    리더보드는 요청 단위로 바뀌지 않으므로 상위 1000명을 미리 구체화해
+    두고 주기적으로 갱신합니다. 조회가 전체 정렬 대신 1000행 이하
+    스캔으로 줄어듭니다.
+    """
+    try:
+        with db.get_cursor() as (cursor, conn):
+            cursor.execute("""
+                CREATE MATERIALIZED VIEW IF NOT EXISTS mv_top_kakao_reviewers AS
+                SELECT id, reviewer_id, reviewer_user_name,
+                       reviewer_review_cnt, reviewer_avg, badge_grade, badge_level,
+                       crawled_at, updated_at
+                FROM kakao_reviewer
+                ORDER BY reviewer_review_cnt DESC, reviewer_avg DESC
+                LIMIT 1000
+            """)
+            # CONCURRENTLY 갱신에는 유니크 인덱스가 필요
+            cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS uidx_mv_top_reviewers_reviewer_id
+                ON mv_top_kakao_reviewers(reviewer_id)
+            """)
+            conn.commit()
+            logger.info("mv_top_kakao_reviewers 구체화 뷰 생성 완료")
+            return True
+    except Exception as e:
+        logger.error(f"mv_top_kakao_reviewers 생성 중 오류 발생: {e}")
+        raise
+
+
+def refresh_top_reviewers_view():
+    """상위 리뷰어 구체화 뷰 갱신 (주기 작업/업로드 후 호출용)
+
+    CONCURRENTLY 갱신은 갱신 중에도 기존 내용을 조회할 수 있지만
+    트랜잭션 블록 안에서는 실행할 수 없으므로, create_index_safe와
+    같은 방식으로 커넥션을 autocommit으로 전환해 실행합니다.
+    """
+    try:
+        with db.get_connection() as conn:
+            previous_autocommit = conn.autocommit
+            conn.autocommit = True
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_top_kakao_reviewers"
+                )
+                cursor.close()
+            finally:
+                conn.autocommit = previous_autocommit
+            logger.info("mv_top_kakao_reviewers 갱신 완료")
+            return True
+    except Exception as e:
+        logger.warning(f"mv_top_kakao_reviewers 갱신 실패 (무시): {e}")
+        return False
+
+
+def check_extension_exists(extension_name: str) -> bool:
+    """확장이 설치되어 있는지 확인"""
+    try:
+        with db.get_cursor() as (cursor, conn):
+            query = """
+                SELECT 1
+                FROM pg_extension
+                WHERE extname = %s
+            """
+            cursor.execute(query, (extension_name,))
+            result = cursor.fetchone()
+            return result is not None
+    except Exception as e:
+        logger.error(f"확장 존재 확인 중 오류 발생: {e}")
+        return False
+
+
 def check_index_exists(table_name: str, index_name: str) -> bool:
     """인덱스가 존재하는지 확인"""
     try:
@@ -140,20 +314,54 @@ def check_index_exists(table_name: str, index_name: str) -> bool:
         return False
 
 
-def create_performance_indexes():
-    """성능 최적화를 위한 인덱스 생성"""
+def check_unique_index_on_column(table_name: str, column_name: str) -> bool:
+    """해당 컬럼을 단일 키로 갖는 유니크 인덱스가 있는지 확인
+
+    CREATE UNIQUE INDEX IF NOT EXISTS는 이름만 비교하므로, 모델의
+    unique=True 제약으로 이미 만들어진 인덱스가 있으면 이름이 달라도
+    중복 인덱스를 추가하게 됩니다. 실제 유니크 인덱스 유무로 판단합니다.
+    """
+    try:
+        with db.get_cursor() as (cursor, conn):
+            query = """
+                SELECT 1
+                FROM pg_index i
+                JOIN pg_class t ON t.oid = i.indrelid
+                JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(i.indkey)
+                WHERE t.relname = %s
+                  AND i.indisunique
+                  AND i.indnkeyatts = 1
+                  AND a.attname = %s
+            """
+            cursor.execute(query, (table_name, column_name))
+            result = cursor.fetchone()
+            return result is not None
+    except Exception as e:
+        logger.error(f"유니크 인덱스 확인 중 오류 발생: {e}")
+        return False
+
+
+def ensure_extension(extension_name: str) -> bool:
+    """확장 설치 후 사용 가능 여부 반환"""
+    try:
+        with db.get_cursor() as (cursor, conn):
+            cursor.execute(f"CREATE EXTENSION IF NOT EXISTS {extension_name}")
+            conn.commit()
+    except Exception as e:
+        logger.warning(f"{extension_name} 확장 설치 실패 (무시): {str(e)[:100]}")
+    return check_extension_exists(extension_name)
+
+
+async def create_performance_indexes():
+    """성능 최적화를 위한 인덱스 생성 (그룹별 병렬 실행)"""
     logger.info("성능 최적화 인덱스 생성 시작...")
 
     # 기본 정렬 인덱스 (High Priority)
     basic_indexes = [
-        "CREATE INDEX IF NOT EXISTS idx_kakao_diner_bayesian_score ON kakao_diner(bayesian_score DESC)",
-        "CREATE INDEX IF NOT EXISTS idx_kakao_diner_hidden_score ON kakao_diner(hidden_score DESC)",
         "CREATE INDEX IF NOT EXISTS idx_kakao_diner_review_avg ON kakao_diner(diner_review_avg DESC)",
-    ]
-
-    # PostGIS 확장 설치
-    postgis_setup = [
-        "CREATE EXTENSION IF NOT EXISTS postgis",
+        # GET_ALL_KAKAO_DINERS_SEEK의 키셋 커서가 범위 스캔을 타기 위한 인덱스
+        # (쿼리의 COALESCE 정렬 키와 동일한 표현식이어야 인덱스를 탑니다)
+        "CREATE INDEX IF NOT EXISTS idx_kakao_diner_review_seek ON kakao_diner(COALESCE(diner_review_avg, -1) DESC, COALESCE(diner_blog_review_cnt, -1) DESC, diner_idx DESC)",
     ]
 
     # 공간 인덱스 (High Priority) - PostGIS GIST 인덱스
@@ -174,78 +382,202 @@ def create_performance_indexes():
         "CREATE INDEX IF NOT EXISTS idx_kakao_diner_cat_large_rating ON kakao_diner(diner_category_large, diner_review_avg DESC)",
     ]
 
-    # pg_trgm 확장 및 GIN 인덱스 (LIKE 검색 최적화)
-    trgm_setup = [
-        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    # 부분 인덱스 (클릭 이벤트 핫 필터 최적화)
+    # 로그 테이블 대부분이 page_view 이벤트라 전체 인덱스 대비 크기가 크게 줄고,
+    # INCLUDE 컬럼 덕분에 GET_STATISTICS의 인기 음식점(top_diners) 집계가
+    # index-only로 처리됩니다.
+    partial_indexes = [
+        """CREATE INDEX IF NOT EXISTS idx_ual_clicks_by_diner
+           ON user_activity_logs (clicked_diner_idx, event_timestamp DESC)
+           INCLUDE (clicked_diner_name)
+           WHERE event_type = 'diner_click' AND clicked_diner_idx IS NOT NULL""",
     ]
 
+    # 존재 확인(CHECK_*) 쿼리용 유니크 인덱스
+    # 모델의 unique=True로 생성된 DB에는 이미 있지만, 그렇지 않은 DB에서는
+    # 존재 확인이 seq scan이 되고 ON CONFLICT 절도 동작하지 않습니다.
+    # (table, column, sql) — 해당 컬럼에 유니크 인덱스가 없을 때만 생성
+    unique_probe_indexes = [
+        (
+            "kakao_review",
+            "review_id",
+            "CREATE UNIQUE INDEX IF NOT EXISTS uidx_kakao_review_review_id ON kakao_review(review_id)",
+        ),
+        (
+            "kakao_diner",
+            "diner_idx",
+            "CREATE UNIQUE INDEX IF NOT EXISTS uidx_kakao_diner_diner_idx ON kakao_diner(diner_idx)",
+        ),
+        (
+            "kakao_reviewer",
+            "reviewer_id",
+            "CREATE UNIQUE INDEX IF NOT EXISTS uidx_kakao_reviewer_reviewer_id ON kakao_reviewer(reviewer_id)",
+        ),
+        (
+            "users",
+            "firebase_uid",
+            "CREATE UNIQUE INDEX IF NOT EXISTS uidx_users_firebase_uid ON users(firebase_uid)",
+        ),
+    ]
+
+    # 리뷰 페이지네이션 커버링 인덱스
+    # GET_KAKAO_REVIEWS_BY_DINER / BY_REVIEWER / 전체 목록이 모두
+    # (reviewer_review_score DESC, crawled_at DESC) 정렬을 쓰므로
+    # 필터 컬럼 + 정렬 키 + INCLUDE 컬럼으로 index-only 스캔을 유도합니다.
+    review_indexes = [
+        """CREATE INDEX IF NOT EXISTS idx_kakao_review_diner_score
+           ON kakao_review (diner_idx, reviewer_review_score DESC, crawled_at DESC)
+           INCLUDE (review_id, reviewer_id, reviewer_review, reviewer_review_date)""",
+        """CREATE INDEX IF NOT EXISTS idx_kakao_review_reviewer_score
+           ON kakao_review (reviewer_id, reviewer_review_score DESC, crawled_at DESC)
+           INCLUDE (review_id, diner_idx, reviewer_review, reviewer_review_date)""",
+        """CREATE INDEX IF NOT EXISTS idx_kakao_review_score
+           ON kakao_review (reviewer_review_score DESC, crawled_at DESC)""",
+    ]
+
+    # pg_trgm GIN 인덱스 (LIKE 검색 최적화)
     trgm_indexes = [
         "CREATE INDEX IF NOT EXISTS idx_kakao_diner_cat_large_trgm ON kakao_diner USING GIN (diner_category_large gin_trgm_ops)",
         "CREATE INDEX IF NOT EXISTS idx_kakao_diner_cat_middle_trgm ON kakao_diner USING GIN (diner_category_middle gin_trgm_ops)",
+        # 태그 컬럼은 TEXT이므로 배열 containment 대신 trigram GIN으로
+        # LIKE '%태그%' 형태의 태그 필터를 인덱스 스캔으로 처리
+        "CREATE INDEX IF NOT EXISTS idx_kakao_diner_tag_trgm ON kakao_diner USING GIN (diner_tag gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS idx_kakao_diner_review_tags_trgm ON kakao_diner USING GIN (diner_review_tags gin_trgm_ops)",
+    ]
+
+    # BRIN 인덱스 (시계열 범위 조회)
+    # crawled_at은 삽입 순서와 거의 단조 증가로 정렬돼 있어 BRIN의
+    # 블록 범위 요약만으로 날짜 범위 스캔이 가능합니다. B-tree 대비
+    # 크기가 수백~수천 배 작아 쓰기 부하도 거의 없습니다.
+    brin_indexes = [
+        """CREATE INDEX IF NOT EXISTS idx_kakao_review_crawled_brin
+           ON kakao_review USING BRIN (crawled_at) WITH (pages_per_range = 32)""",
+        """CREATE INDEX IF NOT EXISTS idx_kakao_diner_crawled_brin
+           ON kakao_diner USING BRIN (crawled_at) WITH (pages_per_range = 32)""",
     ]
 
-    # 각 인덱스를 독립적인 트랜잭션으로 생성
+    # 각 인덱스를 독립적으로 생성 (CONCURRENTLY)
     def create_index_safe(index_sql: str, description: str):
-        """안전하게 인덱스 생성 (독립 트랜잭션)"""
+        """안전하게 인덱스 생성 (autocommit + CONCURRENTLY)
+
+        기본 CREATE INDEX는 빌드 동안 대상 테이블 쓰기를 막으므로,
+        수백만 행이 쌓인 kakao_review/user_activity_logs에 재실행될 때를
+        대비해 CONCURRENTLY로 빌드합니다. CONCURRENTLY는 트랜잭션 블록
+        안에서 실행할 수 없어 커넥션을 autocommit으로 전환합니다.
+        (빌드 실패 시 INVALID 인덱스가 남을 수 있으나 재실행에 무해하고,
+        실패는 어차피 경고 후 무시되는 경로입니다)
+        """
+        concurrent_sql = index_sql.replace(
+            "INDEX IF NOT EXISTS", "INDEX CONCURRENTLY IF NOT EXISTS", 1
+        )
         try:
-            with db.get_cursor() as (cursor, conn):
-                cursor.execute(index_sql)
-                conn.commit()
-                logger.info(f"{description} 생성 완료: {index_sql[:80]}...")
+            with db.get_connection() as conn:
+                previous_autocommit = conn.autocommit
+                conn.autocommit = True
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute(concurrent_sql)
+                    cursor.close()
+                finally:
+                    conn.autocommit = previous_autocommit
+                logger.info(f"{description} 생성 완료: {concurrent_sql[:80]}...")
                 return True
         except Exception as e:
             logger.warning(f"{description} 생성 실패 (무시): {str(e)[:100]}")
             return False
 
-    # 기본 인덱스 생성
-    logger.info("기본 정렬 인덱스 생성 중...")
-    for index_sql in basic_indexes:
-        create_index_safe(index_sql, "기본 인덱스")
-
-    # PostGIS 확장 설치
-    logger.info("PostGIS 확장 설치 중...")
-    postgis_available = False
-    for setup_sql in postgis_setup:
-        if create_index_safe(setup_sql, "PostGIS 확장"):
-            postgis_available = True
-
-    # 공간 인덱스 생성
-    logger.info("공간 인덱스 생성 중...")
-    if postgis_available:
-        # PostGIS GIST 인덱스 사용
-        for index_sql in spatial_indexes:
-            if not create_index_safe(index_sql, "PostGIS GIST 인덱스"):
-                # GIST 인덱스 실패 시 일반 인덱스로 대체
-                logger.warning(
-                    "PostGIS GIST 인덱스 생성 실패, 일반 인덱스로 대체합니다."
-                )
-                for fallback_sql in fallback_spatial_indexes:
-                    create_index_safe(fallback_sql, "공간 인덱스 (대체)")
-    else:
-        # PostGIS 없으면 일반 인덱스 사용
-        logger.warning("PostGIS를 사용할 수 없어 일반 B-tree 인덱스를 사용합니다.")
-        for fallback_sql in fallback_spatial_indexes:
-            create_index_safe(fallback_sql, "공간 인덱스 (대체)")
-
-    # 복합 인덱스 생성
-    logger.info("복합 인덱스 생성 중...")
-    for index_sql in composite_indexes:
-        create_index_safe(index_sql, "복합 인덱스")
-
-    # pg_trgm 확장 설치
-    logger.info("pg_trgm 확장 설치 중...")
-    trgm_available = False
-    for setup_sql in trgm_setup:
-        if create_index_safe(setup_sql, "pg_trgm 확장"):
-            trgm_available = True
-
-    # pg_trgm 인덱스 생성 (확장이 설치된 경우만)
-    if trgm_available:
-        logger.info("LIKE 검색 최적화 인덱스 생성 중...")
-        for index_sql in trgm_indexes:
-            create_index_safe(index_sql, "pg_trgm 인덱스")
-    else:
-        logger.warning("pg_trgm 확장을 사용할 수 없어 GIN 인덱스를 건너뜁니다.")
+    def create_basic_indexes():
+        logger.info("기본 정렬 인덱스 생성 중...")
+        for index_sql in basic_indexes:
+            create_index_safe(index_sql, "기본 인덱스")
+
+    def create_spatial_indexes():
+        # create_index_safe의 반환값은 "이미 존재"와 "방금 생성"을 구분하지 못하므로
+        # pg_extension을 직접 조회해 PostGIS 사용 가능 여부를 판단
+        postgis_available = check_extension_exists("postgis")
+
+        logger.info("공간 인덱스 생성 중...")
+        if postgis_available:
+            # PostGIS GIST 인덱스 사용
+            gist_created = True
+            for index_sql in spatial_indexes:
+                if not create_index_safe(index_sql, "PostGIS GIST 인덱스"):
+                    gist_created = False
+                    # GIST 인덱스 실패 시 일반 인덱스로 대체
+                    logger.warning(
+                        "PostGIS GIST 인덱스 생성 실패, 일반 인덱스로 대체합니다."
+                    )
+                    for fallback_sql in fallback_spatial_indexes:
+                        create_index_safe(fallback_sql, "공간 인덱스 (대체)")
+
+            # GIST 인덱스가 살아있으면 이전 실행에서 남은 대체 B-tree 인덱스는
+            # kakao_diner 쓰기 성능만 깎는 군더더기이므로 제거
+            if gist_created and check_index_exists(
+                "kakao_diner", "idx_kakao_diner_lat_lon"
+            ):
+                try:
+                    with db.get_cursor() as (cursor, conn):
+                        cursor.execute("DROP INDEX IF EXISTS idx_kakao_diner_lat_lon")
+                        conn.commit()
+                        logger.info(
+                            "대체 공간 인덱스(idx_kakao_diner_lat_lon) 제거 완료"
+                        )
+                except Exception as e:
+                    logger.warning(f"대체 공간 인덱스 제거 실패 (무시): {e}")
+        else:
+            # PostGIS 없으면 일반 인덱스 사용
+            logger.warning("PostGIS를 사용할 수 없어 일반 B-tree 인덱스를 사용합니다.")
+            for fallback_sql in fallback_spatial_indexes:
+                create_index_safe(fallback_sql, "공간 인덱스 (대체)")
+
+    def create_composite_indexes():
+        logger.info("복합 인덱스 생성 중...")
+        for index_sql in composite_indexes:
+            create_index_safe(index_sql, "복합 인덱스")
+
+    def create_partial_indexes():
+        logger.info("부분 인덱스 생성 중...")
+        for index_sql in partial_indexes:
+            create_index_safe(index_sql, "부분 인덱스")
+
+    def create_unique_probe_indexes():
+        logger.info("존재 확인용 유니크 인덱스 점검 중...")
+        for table_name, column_name, index_sql in unique_probe_indexes:
+            if check_unique_index_on_column(table_name, column_name):
+                continue
+            create_index_safe(index_sql, "유니크 인덱스")
+
+    def create_review_indexes():
+        logger.info("리뷰 페이지네이션 인덱스 생성 중...")
+        for index_sql in review_indexes:
+            create_index_safe(index_sql, "리뷰 커버링 인덱스")
+
+    def create_trgm_indexes():
+        # pg_trgm 인덱스 생성 (확장이 설치된 경우만)
+        if check_extension_exists("pg_trgm"):
+            logger.info("LIKE 검색 최적화 인덱스 생성 중...")
+            for index_sql in trgm_indexes:
+                create_index_safe(index_sql, "pg_trgm 인덱스")
+        else:
+            logger.warning("pg_trgm 확장을 사용할 수 없어 GIN 인덱스를 건너뜁니다.")
+
+    def create_brin_indexes():
+        logger.info("BRIN 시계열 인덱스 생성 중...")
+        for index_sql in brin_indexes:
+            create_index_safe(index_sql, "BRIN 인덱스")
+
+    # 인덱스 그룹 간에는 순서 의존성이 없으므로 각 그룹을 독립 커넥션에서
+    # 동시에 실행 (전체 소요 시간이 합계가 아닌 가장 느린 그룹 기준으로 수렴)
+    await asyncio.gather(
+        asyncio.to_thread(create_basic_indexes),
+        asyncio.to_thread(create_spatial_indexes),
+        asyncio.to_thread(create_composite_indexes),
+        asyncio.to_thread(create_partial_indexes),
+        asyncio.to_thread(create_unique_probe_indexes),
+        asyncio.to_thread(create_review_indexes),
+        asyncio.to_thread(create_trgm_indexes),
+        asyncio.to_thread(create_brin_indexes),
+    )
 
     # 통계 업데이트
     logger.info("테이블 통계 업데이트 중...")
@@ -260,50 +592,69 @@ def create_performance_indexes():
     logger.info("성능 최적화 인덱스 생성 완료")
 
 
-def run_migrations():
+def add_kakao_diner_columns():
+    """kakao_diner 테이블에 점수 관련 컬럼 추가"""
+    migrations = [
+        {
+            "table": "kakao_diner",
+            "column": "diner_grade",
+            "type": "INTEGER",
+            "nullable": False,
+            "default": "0",
+        },
+        {
+            "table": "kakao_diner",
+            "column": "hidden_score",
+            "type": "DOUBLE PRECISION",
+            "nullable": False,
+            "default": "0.0",
+        },
+        {
+            "table": "kakao_diner",
+            "column": "bayesian_score",
+            "type": "DOUBLE PRECISION",
+            "nullable": False,
+            "default": "0.0",
+        },
+    ]
+
+    for migration in migrations:
+        add_column_if_not_exists(
+            table_name=migration["table"],
+            column_name=migration["column"],
+            column_type=migration["type"],
+            nullable=migration["nullable"],
+            default_value=migration["default"],
+        )
+
+
+async def run_migrations():
     """모든 마이그레이션 실행"""
     logger.info("데이터베이스 마이그레이션 시작...")
 
     try:
-        # kakao_diner 테이블에 컬럼 추가
-        migrations = [
-            {
-                "table": "kakao_diner",
-                "column": "diner_grade",
-                "type": "INTEGER",
-                "nullable": False,
-                "default": "0",
-            },
-            {
-                "table": "kakao_diner",
-                "column": "hidden_score",
-                "type": "DOUBLE PRECISION",
-                "nullable": False,
-                "default": "0.0",
-            },
-            {
-                "table": "kakao_diner",
-                "column": "bayesian_score",
-                "type": "DOUBLE PRECISION",
-                "nullable": False,
-                "default": "0.0",
-            },
-        ]
-
-        for migration in migrations:
-            add_column_if_not_exists(
-                table_name=migration["table"],
-                column_name=migration["column"],
-                column_type=migration["type"],
-                nullable=migration["nullable"],
-                default_value=migration["default"],
-            )
-
+        # 컬럼 추가와 확장 설치는 서로 의존성이 없으므로 동시에 실행
+        await asyncio.gather(
+            asyncio.to_thread(add_kakao_diner_columns),
+            asyncio.to_thread(ensure_extension, "postgis"),
+            asyncio.to_thread(ensure_extension, "pg_trgm"),
+        )
+
+        # 컬럼이 준비된 뒤에만 가능한 작업
         # diner_review_cnt 컬럼 타입 변경 (VARCHAR -> INTEGER)
-        migrate_diner_review_cnt_to_integer()
+        await asyncio.to_thread(migrate_diner_review_cnt_to_integer)
+
+        # 사용처 없이 쓰기 비용만 발생시키던 프로젝션 테이블 정리
+        await asyncio.to_thread(drop_diner_scores_projection)
+
+        # 상위 리뷰어 리더보드 구체화 뷰 생성
+        await asyncio.to_thread(create_top_reviewers_view)
+
+        # 아이템 리뷰 집계 컬럼 유지
+        await asyncio.to_thread(create_item_rating_aggregates)
 
         # 성능 최적화 인덱스 생성
-        create_performance_indexes()
+        await create_performance_indexes()
 
         logger.info("데이터베이스 마이그레이션 완료")
     except Exception as e:
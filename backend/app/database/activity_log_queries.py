@@ -28,6 +28,49 @@ RETURNING id, user_id, firebase_uid, session_id, event_type, event_timestamp, pa
           additional_data, user_agent, ip_address
 """
 
+# firebase_uid → user_id 해석을 INSERT와 같은 왕복에서 수행하는 변형
+# (사용자가 없으면 0행을 반환하므로 호출부에서 404 처리)
+INSERT_ACTIVITY_LOG_BY_FIREBASE_UID = """
+INSERT INTO user_activity_logs (
+    id, user_id, firebase_uid, session_id, event_type, page,
+    location_query, location_address, location_lat, location_lon, location_method,
+    search_radius_km, selected_large_categories, selected_middle_categories, sort_by, period,
+    selected_city, selected_region, selected_grades,
+    clicked_diner_idx, clicked_diner_name, display_position,
+    additional_data, user_agent, ip_address
+)
+SELECT
+    %s, u.id, %s, %s, %s, %s,
+    %s, %s, %s, %s, %s,
+    %s, %s, %s, %s, %s,
+    %s, %s, %s,
+    %s, %s, %s,
+    %s, %s, %s
+FROM users u
+WHERE u.firebase_uid = %s
+RETURNING id, user_id, firebase_uid, session_id, event_type, event_timestamp, page,
+          location_query, location_address, location_lat, location_lon, location_method,
+          search_radius_km, selected_large_categories, selected_middle_categories, sort_by, period,
+          selected_city, selected_region, selected_grades,
+          clicked_diner_idx, clicked_diner_name, display_position,
+          additional_data, user_agent, ip_address
+"""
+
+# execute_values용 대량 INSERT 템플릿 (VALUES %s 형태)
+# 버퍼링된 이벤트를 한 번의 왕복으로 적재하는 fire-and-forget 경로이므로
+# RETURNING 절이 없습니다
+INSERT_ACTIVITY_LOG_BULK = """
+INSERT INTO user_activity_logs (
+    id, user_id, firebase_uid, session_id, event_type, page,
+    location_query, location_address, location_lat, location_lon, location_method,
+    search_radius_km, selected_large_categories, selected_middle_categories, sort_by, period,
+    selected_city, selected_region, selected_grades,
+    clicked_diner_idx, clicked_diner_name, display_position,
+    additional_data, user_agent, ip_address
+)
+VALUES %s
+"""
+
 GET_ACTIVITY_LOGS_BY_USER = """
 SELECT id, user_id, firebase_uid, session_id, event_type, event_timestamp, page,
        location_query, location_address, location_lat, location_lon, location_method,
@@ -116,33 +159,67 @@ SELECT
 FROM user_activity_logs
 WHERE (%s IS NULL OR event_timestamp >= %s)
   AND (%s IS NULL OR event_timestamp <= %s)
-  AND (%s IS NULL OR event_type = ANY(%s))
 ORDER BY user_id, session_id, event_timestamp
 """
 
-# 통계 쿼리
-COUNT_LOGS_BY_EVENT_TYPE = """
-SELECT event_type, COUNT(*) as count
+# event_type 필터가 있는 경우의 변형
+# (%s IS NULL OR ...) 혼합 조건 대신 실제 배열 파라미터를 사용해야
+# 플래너가 event_type 인덱스를 탈 수 있습니다.
+GET_LOGS_FOR_ML_BY_EVENT_TYPES = """
+SELECT
+    user_id,
+    firebase_uid,
+    session_id,
+    event_type,
+    event_timestamp,
+    page,
+    location_lat,
+    location_lon,
+    search_radius_km,
+    selected_large_categories,
+    selected_middle_categories,
+    sort_by,
+    clicked_diner_idx,
+    display_position
 FROM user_activity_logs
-WHERE event_timestamp >= %s
-  AND event_timestamp <= %s
-GROUP BY event_type
-ORDER BY count DESC
+WHERE (%s IS NULL OR event_timestamp >= %s)
+  AND (%s IS NULL OR event_timestamp <= %s)
+  AND event_type = ANY(%s)
+ORDER BY user_id, session_id, event_timestamp
 """
 
-GET_TOP_CLICKED_DINERS = """
+# 통계 쿼리
+# 이벤트 타입별 카운트와 인기 음식점을 한 왕복으로 집계
+# (두 집계가 같은 날짜 범위를 스캔하므로 CTE로 묶고 json_agg로
+#  각 결과 집합을 단일 행의 컬럼 두 개로 반환)
+GET_STATISTICS = """
+WITH event_counts AS (
+    SELECT event_type, COUNT(*) as count
+    FROM user_activity_logs
+    WHERE event_timestamp >= %s
+      AND event_timestamp <= %s
+    GROUP BY event_type
+    ORDER BY count DESC
+),
+top_diners AS (
+    SELECT
+        clicked_diner_idx,
+        clicked_diner_name,
+        COUNT(*) as click_count
+    FROM user_activity_logs
+    WHERE event_type = 'diner_click'
+      AND clicked_diner_idx IS NOT NULL
+      AND event_timestamp >= %s
+      AND event_timestamp <= %s
+    GROUP BY clicked_diner_idx, clicked_diner_name
+    ORDER BY click_count DESC
+    LIMIT %s
+)
 SELECT
-    clicked_diner_idx,
-    clicked_diner_name,
-    COUNT(*) as click_count
-FROM user_activity_logs
-WHERE event_type = 'diner_click'
-  AND clicked_diner_idx IS NOT NULL
-  AND event_timestamp >= %s
-  AND event_timestamp <= %s
-GROUP BY clicked_diner_idx, clicked_diner_name
-ORDER BY click_count DESC
-LIMIT %s
+    (SELECT COALESCE(json_agg(event_counts ORDER BY count DESC), '[]'::json)
+     FROM event_counts) AS event_counts,
+    (SELECT COALESCE(json_agg(top_diners ORDER BY click_count DESC), '[]'::json)
+     FROM top_diners) AS top_clicked_diners
 """
 
 GET_USER_PREFERRED_CATEGORIES = """
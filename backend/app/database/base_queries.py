@@ -1,10 +1,12 @@
 """
 기본 테이블 관련 SQL 쿼리
-"""
 
-# Users 관련 쿼리
-CHECK_USER_EXISTS = "SELECT id FROM users WHERE account_id = %s"
-CHECK_USER_DUPLICATE = "SELECT id FROM users WHERE account_id = %s"
+users/kakao_* 존재 확인 쿼리의 정본은 user_queries.py와 kakao_queries.py에
+있습니다. 과거 이 파일에 있던 중복 정의(account_id, kakao_user_id,
+kakao_review_id 기준)는 현재 스키마와 컬럼명이 달라 같은 이름으로 다른
+SQL이 실행되는 원인이었으므로 제거했습니다. 여기에는 items/reviews
+테이블 전용 쿼리만 둡니다.
+"""
 
 # Items 관련 쿼리
 CHECK_ITEM_EXISTS = "SELECT id FROM items WHERE id = %s"
@@ -12,15 +14,3 @@ CHECK_ITEM_EXISTS = "SELECT id FROM items WHERE id = %s"
 # Reviews 관련 쿼리
 CHECK_REVIEW_EXISTS = "SELECT id FROM reviews WHERE id = %s"
 CHECK_REVIEW_DUPLICATE = "SELECT id FROM reviews WHERE account_id = %s AND item_id = %s"
-
-# Kakao Diner 관련 쿼리
-CHECK_KAKAO_DINER_EXISTS_BY_PLACE_ID = (
-    "SELECT id FROM kakao_diner WHERE kakao_place_id = %s"
-)
-
-# Kakao Reviewer 관련 쿼리
-CHECK_KAKAO_REVIEWER_EXISTS = "SELECT id FROM kakao_reviewer WHERE kakao_user_id = %s"
-
-# Kakao Review 관련 쿼리
-CHECK_KAKAO_REVIEW_EXISTS = "SELECT id FROM kakao_review WHERE kakao_review_id = %s"
-CHECK_KAKAO_REVIEW_DUPLICATE = "SELECT id FROM kakao_review WHERE kakao_review_id = %s"
@@ -36,6 +36,38 @@ INSERT_KAKAO_DINER_BASIC = """
         updated_at = CURRENT_TIMESTAMP
 """
 
+# execute_values용 대량 UPSERT 템플릿
+# VALUES %s 자리에 psycopg2.extras.execute_values가 여러 행을 한 문장으로
+# 펼쳐 넣어, 행당 한 번씩 왕복하던 executemany 대비 배치당 한 번만 왕복합니다.
+INSERT_KAKAO_DINER_BASIC_BULK = """
+    INSERT INTO kakao_diner (
+        id, diner_idx, diner_name, diner_tag, diner_menu_name, diner_menu_price,
+        diner_review_cnt, diner_review_avg, diner_blog_review_cnt, diner_review_tags,
+        diner_road_address, diner_num_address, diner_phone,
+        diner_lat, diner_lon, diner_open_time,
+        diner_grade, hidden_score, bayesian_score
+    ) VALUES %s
+    ON CONFLICT (diner_idx) DO UPDATE SET
+        diner_name = EXCLUDED.diner_name,
+        diner_tag = EXCLUDED.diner_tag,
+        diner_menu_name = EXCLUDED.diner_menu_name,
+        diner_menu_price = EXCLUDED.diner_menu_price,
+        diner_review_cnt = EXCLUDED.diner_review_cnt,
+        diner_review_avg = EXCLUDED.diner_review_avg,
+        diner_blog_review_cnt = EXCLUDED.diner_blog_review_cnt,
+        diner_review_tags = EXCLUDED.diner_review_tags,
+        diner_road_address = EXCLUDED.diner_road_address,
+        diner_num_address = EXCLUDED.diner_num_address,
+        diner_phone = EXCLUDED.diner_phone,
+        diner_lat = EXCLUDED.diner_lat,
+        diner_lon = EXCLUDED.diner_lon,
+        diner_open_time = EXCLUDED.diner_open_time,
+        diner_grade = EXCLUDED.diner_grade,
+        hidden_score = EXCLUDED.hidden_score,
+        bayesian_score = EXCLUDED.bayesian_score,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
 UPDATE_KAKAO_DINER_CATEGORY = """
     UPDATE kakao_diner SET
         diner_category_large = %s,
@@ -86,6 +118,73 @@ UPDATE_KAKAO_DINER_HIDDEN_SCORE = """
     WHERE diner_idx = %s
 """
 
+# execute_values용 대량 UPDATE 템플릿
+# UPDATE ... FROM (VALUES %s) 형태로 배치 전체를 한 문장에 실어
+# 행당 한 번씩 왕복하던 executemany 대비 배치당 한 번만 왕복합니다.
+# data(...) 컬럼 순서는 PROCESSING_CONFIG의 field_mappings(튜플 생성 순서)와
+# 일치해야 하며, NULL만 있는 행에서도 타입이 고정되도록 숫자 컬럼은
+# 명시적으로 캐스팅합니다.
+UPDATE_KAKAO_DINER_CATEGORY_BULK = """
+    UPDATE kakao_diner AS kd SET
+        diner_category_large = data.diner_category_large,
+        diner_category_middle = data.diner_category_middle,
+        diner_category_small = data.diner_category_small,
+        diner_category_detail = data.diner_category_detail,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (VALUES %s) AS data (
+        diner_category_large, diner_category_middle,
+        diner_category_small, diner_category_detail, diner_idx
+    )
+    WHERE kd.diner_idx = data.diner_idx::integer
+"""
+
+UPDATE_KAKAO_DINER_MENU_BULK = """
+    UPDATE kakao_diner AS kd SET
+        diner_menu_name = data.diner_menu_name,
+        diner_menu_price = data.diner_menu_price,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (VALUES %s) AS data (diner_menu_name, diner_menu_price, diner_idx)
+    WHERE kd.diner_idx = data.diner_idx::integer
+"""
+
+UPDATE_KAKAO_DINER_REVIEW_BULK = """
+    UPDATE kakao_diner AS kd SET
+        diner_review_cnt = data.diner_review_cnt::integer,
+        diner_review_avg = data.diner_review_avg::double precision,
+        diner_blog_review_cnt = data.diner_blog_review_cnt::double precision,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (VALUES %s) AS data (
+        diner_review_cnt, diner_review_avg, diner_blog_review_cnt, diner_idx
+    )
+    WHERE kd.diner_idx = data.diner_idx::integer
+"""
+
+UPDATE_KAKAO_DINER_TAGS_BULK = """
+    UPDATE kakao_diner AS kd SET
+        diner_tag = data.diner_tag,
+        diner_review_tags = data.diner_review_tags,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (VALUES %s) AS data (diner_tag, diner_review_tags, diner_idx)
+    WHERE kd.diner_idx = data.diner_idx::integer
+"""
+
+UPDATE_KAKAO_DINER_GRADE_BAYESIAN_BULK = """
+    UPDATE kakao_diner AS kd SET
+        diner_grade = data.diner_grade::integer,
+        bayesian_score = data.bayesian_score::double precision,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (VALUES %s) AS data (diner_grade, bayesian_score, diner_idx)
+    WHERE kd.diner_idx = data.diner_idx::integer
+"""
+
+UPDATE_KAKAO_DINER_HIDDEN_SCORE_BULK = """
+    UPDATE kakao_diner AS kd SET
+        hidden_score = data.hidden_score::double precision,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (VALUES %s) AS data (hidden_score, diner_idx)
+    WHERE kd.diner_idx = data.diner_idx::integer
+"""
+
 # 카테고리 테이블 관련 쿼리
 INSERT_KAKAO_CATEGORY = """
     INSERT INTO kakao_diner_category (
@@ -125,6 +224,33 @@ GET_ALL_KAKAO_DINERS = """
     LIMIT %s OFFSET %s
 """
 
+# 키셋(seek) 페이지네이션 변형
+# OFFSET은 페이지가 깊어질수록 앞의 N행을 정렬 후 버리는 비용이 커지므로,
+# 직전 페이지 마지막 행의 (diner_review_avg, diner_blog_review_cnt, diner_idx)
+# 튜플을 커서로 받아 해당 지점부터 인덱스 범위 스캔만 수행합니다.
+# 두 점수 컬럼은 NULL일 수 있고 NULL이 섞인 행 비교는 NULL(필터 탈락)이
+# 되므로, COALESCE(-1)로 NULL을 정렬 꼬리의 실제 값으로 바꿔 커서가
+# NULL 점수 행까지 도달하게 합니다 (점수는 0 이상이라 -1과 충돌 없음).
+# 호출부도 커서 값의 NULL을 -1로 치환해 전달해야 합니다.
+# (idx_kakao_diner_review_seek COALESCE 표현식 인덱스 사용)
+# 파라미터: (last_review_avg, last_blog_review_cnt, last_diner_idx, limit)
+GET_ALL_KAKAO_DINERS_SEEK = """
+    SELECT id, diner_idx, diner_name, diner_tag, diner_menu_name, diner_menu_price,
+           diner_review_cnt, diner_review_avg, diner_blog_review_cnt, diner_review_tags,
+           diner_road_address, diner_num_address, diner_phone,
+           diner_lat, diner_lon, diner_open_time,
+           diner_category_large, diner_category_middle, diner_category_small, diner_category_detail,
+           diner_grade, hidden_score, bayesian_score,
+           crawled_at, updated_at
+    FROM kakao_diner
+    WHERE (COALESCE(diner_review_avg, -1), COALESCE(diner_blog_review_cnt, -1), diner_idx)
+          < (%s, %s, %s)
+    ORDER BY COALESCE(diner_review_avg, -1) DESC,
+             COALESCE(diner_blog_review_cnt, -1) DESC,
+             diner_idx DESC
+    LIMIT %s
+"""
+
 GET_ALL_KAKAO_DINERS_API = """
     SELECT id, diner_idx, diner_name, diner_tag, diner_menu_name, diner_menu_price,
            diner_review_cnt, diner_review_avg, diner_blog_review_cnt, diner_review_tags,
@@ -139,6 +265,14 @@ COUNT_KAKAO_DINERS = """
     SELECT COUNT(*) FROM kakao_diner
 """
 
+# 근사 카운트 (UI 표시용)
+# 정확한 COUNT(*)는 매 호출 전체 인덱스 스캔이지만, pg_class.reltuples는
+# ANALYZE/VACUUM이 유지하는 통계를 O(1)로 읽습니다. "약 12만 개" 수준의
+# 표시에는 충분하며, 정확한 값이 필요한 경로만 COUNT_*를 사용합니다.
+COUNT_KAKAO_DINERS_ESTIMATE = """
+    SELECT reltuples::BIGINT AS estimate FROM pg_class WHERE relname = 'kakao_diner'
+"""
+
 # 존재 확인 쿼리
 CHECK_KAKAO_DINER_EXISTS_BY_IDX = """
     SELECT 1 FROM kakao_diner WHERE diner_idx = %s
@@ -194,6 +328,41 @@ INSERT_KAKAO_REVIEWER = """
               crawled_at, updated_at
 """
 
+# RETURNING 없는 단건 UPSERT (업로드 개별 행 폴백용)
+# API 경로는 생성된 행을 응답으로 돌려주므로 RETURNING이 필요하지만,
+# 업로드/크롤러 경로는 결과를 버리므로 행마다 ~9개 컬럼을 직렬화해
+# 돌려받을 이유가 없습니다.
+INSERT_KAKAO_REVIEWER_SILENT = """
+    INSERT INTO kakao_reviewer (
+        id, reviewer_id, reviewer_user_name,
+        reviewer_review_cnt, reviewer_avg, badge_grade, badge_level
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (reviewer_id) DO UPDATE SET
+        reviewer_user_name = EXCLUDED.reviewer_user_name,
+        reviewer_review_cnt = EXCLUDED.reviewer_review_cnt,
+        reviewer_avg = EXCLUDED.reviewer_avg,
+        badge_grade = EXCLUDED.badge_grade,
+        badge_level = EXCLUDED.badge_level,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# execute_values용 대량 UPSERT 템플릿 (RETURNING 없음 - 크롤러/업로드 경로용)
+INSERT_KAKAO_REVIEWER_BULK = """
+    INSERT INTO kakao_reviewer (
+        id, reviewer_id, reviewer_user_name,
+        reviewer_review_cnt, reviewer_avg, badge_grade, badge_level
+    )
+    VALUES %s
+    ON CONFLICT (reviewer_id) DO UPDATE SET
+        reviewer_user_name = EXCLUDED.reviewer_user_name,
+        reviewer_review_cnt = EXCLUDED.reviewer_review_cnt,
+        reviewer_avg = EXCLUDED.reviewer_avg,
+        badge_grade = EXCLUDED.badge_grade,
+        badge_level = EXCLUDED.badge_level,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
 # 카카오 리뷰어 조회
 GET_KAKAO_REVIEWER_BY_ID = """
     SELECT id, reviewer_id, reviewer_user_name,
@@ -217,6 +386,18 @@ GET_ALL_KAKAO_REVIEWERS_PAGINATED = """
     LIMIT %s OFFSET %s
 """
 
+# 키셋(seek) 페이지네이션 변형
+# 파라미터: (last_review_cnt, last_avg, last_reviewer_id, limit)
+GET_ALL_KAKAO_REVIEWERS_SEEK = """
+    SELECT id, reviewer_id, reviewer_user_name,
+           reviewer_review_cnt, reviewer_avg, badge_grade, badge_level,
+           crawled_at, updated_at
+    FROM kakao_reviewer
+    WHERE (reviewer_review_cnt, reviewer_avg, reviewer_id) < (%s, %s, %s)
+    ORDER BY reviewer_review_cnt DESC, reviewer_avg DESC, reviewer_id DESC
+    LIMIT %s
+"""
+
 # 존재 확인 쿼리
 CHECK_KAKAO_REVIEWER_EXISTS = """
     SELECT 1 FROM kakao_reviewer WHERE reviewer_id = %s
@@ -243,11 +424,19 @@ COUNT_KAKAO_REVIEWERS = """
     SELECT COUNT(*) FROM kakao_reviewer
 """
 
+# 근사 카운트 (UI 표시용)
+COUNT_KAKAO_REVIEWERS_ESTIMATE = """
+    SELECT reltuples::BIGINT AS estimate FROM pg_class WHERE relname = 'kakao_reviewer'
+"""
+
+# 구체화 뷰(mv_top_kakao_reviewers, 상위 1000명 사전 정렬)에서 읽습니다.
+# 전체 테이블 정렬 대신 1000행 이하 스캔. 뷰 갱신은 main의 주기 태스크가
+# migrations.refresh_top_reviewers_view를 호출해 수행합니다.
 GET_TOP_REVIEWERS = """
     SELECT id, reviewer_id, reviewer_user_name,
            reviewer_review_cnt, reviewer_avg, badge_grade, badge_level,
            crawled_at, updated_at
-    FROM kakao_reviewer
+    FROM mv_top_kakao_reviewers
     ORDER BY reviewer_review_cnt DESC, reviewer_avg DESC
     LIMIT %s
 """
@@ -275,6 +464,38 @@ INSERT_KAKAO_REVIEW = """
               crawled_at, updated_at
 """
 
+# RETURNING 없는 단건 UPSERT (업로드 개별 행 폴백용)
+INSERT_KAKAO_REVIEW_SILENT = """
+    INSERT INTO kakao_review (
+        id, diner_idx, reviewer_id, review_id,
+        reviewer_review, reviewer_review_date, reviewer_review_score
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (review_id) DO UPDATE SET
+        diner_idx = EXCLUDED.diner_idx,
+        reviewer_id = EXCLUDED.reviewer_id,
+        reviewer_review = EXCLUDED.reviewer_review,
+        reviewer_review_date = EXCLUDED.reviewer_review_date,
+        reviewer_review_score = EXCLUDED.reviewer_review_score,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# execute_values용 대량 UPSERT 템플릿 (RETURNING 없음 - 크롤러/업로드 경로용)
+INSERT_KAKAO_REVIEW_BULK = """
+    INSERT INTO kakao_review (
+        id, diner_idx, reviewer_id, review_id,
+        reviewer_review, reviewer_review_date, reviewer_review_score
+    )
+    VALUES %s
+    ON CONFLICT (review_id) DO UPDATE SET
+        diner_idx = EXCLUDED.diner_idx,
+        reviewer_id = EXCLUDED.reviewer_id,
+        reviewer_review = EXCLUDED.reviewer_review,
+        reviewer_review_date = EXCLUDED.reviewer_review_date,
+        reviewer_review_score = EXCLUDED.reviewer_review_score,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
 # 카카오 리뷰 조회 (상세 정보 포함)
 GET_KAKAO_REVIEW_BY_ID = """
     SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
@@ -303,12 +524,99 @@ GET_ALL_KAKAO_REVIEWS = """
 GET_ALL_KAKAO_REVIEWS_PAGINATED = """
     SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
            kr.reviewer_review, kr.reviewer_review_date, kr.reviewer_review_score,
-           kr.crawled_at, kr.updated_at, kr2.reviewer_user_name
+           kr.crawled_at, kr.updated_at, kr2.reviewer_user_name,
+           COUNT(*) OVER () AS total_count
     FROM kakao_review kr
     LEFT JOIN kakao_reviewer kr2 ON kr.reviewer_id = kr2.reviewer_id
     ORDER BY kr.reviewer_review_score DESC, kr.crawled_at DESC LIMIT %s OFFSET %s
 """
 
+# 조인 없는 리뷰 목록 (배치 조회 조합용)
+# 3-테이블 JOIN 대신 리뷰 페이지만 먼저 가져오고, 수집한 id 목록으로
+# 아래 *_BY_*_IN 쿼리를 실행해 서비스 레이어에서 dict로 합칩니다.
+# 페이지당 넓은 중간 결과가 사라지고 각 SELECT가 PK/유니크 인덱스를 탑니다.
+GET_ALL_KAKAO_REVIEWS_PLAIN = """
+    SELECT id, diner_idx, reviewer_id, review_id,
+           reviewer_review, reviewer_review_date, reviewer_review_score,
+           crawled_at, updated_at
+    FROM kakao_review
+    ORDER BY reviewer_review_score DESC, crawled_at DESC
+"""
+
+GET_ALL_KAKAO_REVIEWS_PLAIN_PAGINATED = """
+    SELECT id, diner_idx, reviewer_id, review_id,
+           reviewer_review, reviewer_review_date, reviewer_review_score,
+           crawled_at, updated_at,
+           COUNT(*) OVER () AS total_count
+    FROM kakao_review
+    ORDER BY reviewer_review_score DESC, crawled_at DESC LIMIT %s OFFSET %s
+"""
+
+# 배치 메타데이터 조회 (ANY 배열 파라미터)
+GET_KAKAO_DINERS_BY_IDX_IN = """
+    SELECT diner_idx, diner_name, diner_tag
+    FROM kakao_diner WHERE diner_idx = ANY(%s)
+"""
+
+GET_KAKAO_REVIEWERS_BY_ID_IN = """
+    SELECT reviewer_id, reviewer_user_name
+    FROM kakao_reviewer WHERE reviewer_id = ANY(%s)
+"""
+
+# 키셋(seek) 페이지네이션 변형
+# OFFSET은 깊은 페이지일수록 앞의 N행을 읽고 버리므로, 직전 페이지 마지막
+# 행의 (reviewer_review_score, crawled_at, id) 튜플을 커서로 받아 복합
+# 인덱스 범위 스캔만 수행합니다.
+# 파라미터: (last_score, last_crawled_at, last_id, limit)
+GET_ALL_KAKAO_REVIEWS_SEEK = """
+    SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
+           kr.reviewer_review, kr.reviewer_review_date, kr.reviewer_review_score,
+           kr.crawled_at, kr.updated_at, kr2.reviewer_user_name
+    FROM kakao_review kr
+    LEFT JOIN kakao_reviewer kr2 ON kr.reviewer_id = kr2.reviewer_id
+    WHERE (kr.reviewer_review_score, kr.crawled_at, kr.id) < (%s, %s, %s)
+    ORDER BY kr.reviewer_review_score DESC, kr.crawled_at DESC, kr.id DESC
+    LIMIT %s
+"""
+
+# 파라미터: (diner_idx, diner_idx, last_score, last_crawled_at, last_id, limit)
+GET_KAKAO_REVIEWS_BY_DINER_SEEK = """
+    WITH diner AS (
+        SELECT diner_name, diner_tag FROM kakao_diner WHERE diner_idx = %s
+    )
+    SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
+           kr.reviewer_review, kr.reviewer_review_date, kr.reviewer_review_score,
+           kr.crawled_at, kr.updated_at,
+           d.diner_name, d.diner_tag,
+           kr2.reviewer_user_name
+    FROM kakao_review kr
+    LEFT JOIN diner d ON TRUE
+    LEFT JOIN kakao_reviewer kr2 ON kr.reviewer_id = kr2.reviewer_id
+    WHERE kr.diner_idx = %s
+      AND (kr.reviewer_review_score, kr.crawled_at, kr.id) < (%s, %s, %s)
+    ORDER BY kr.reviewer_review_score DESC, kr.crawled_at DESC, kr.id DESC
+    LIMIT %s
+"""
+
+# 파라미터: (reviewer_id, reviewer_id, last_score, last_crawled_at, last_id, limit)
+GET_KAKAO_REVIEWS_BY_REVIEWER_SEEK = """
+    WITH reviewer AS (
+        SELECT reviewer_user_name FROM kakao_reviewer WHERE reviewer_id = %s
+    )
+    SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
+           kr.reviewer_review, kr.reviewer_review_date, kr.reviewer_review_score,
+           kr.crawled_at, kr.updated_at,
+           kd.diner_name, kd.diner_tag,
+           r.reviewer_user_name
+    FROM kakao_review kr
+    LEFT JOIN reviewer r ON TRUE
+    LEFT JOIN kakao_diner kd ON kr.diner_idx = kd.diner_idx
+    WHERE kr.reviewer_id = %s
+      AND (kr.reviewer_review_score, kr.crawled_at, kr.id) < (%s, %s, %s)
+    ORDER BY kr.reviewer_review_score DESC, kr.crawled_at DESC, kr.id DESC
+    LIMIT %s
+"""
+
 # 필터링이 있는 경우의 기본 쿼리 템플릿
 GET_KAKAO_REVIEWS_BASE_QUERY = """
     SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
@@ -321,32 +629,75 @@ GET_KAKAO_REVIEWS_BASE_QUERY = """
     LEFT JOIN kakao_reviewer kr2 ON kr.reviewer_id = kr2.reviewer_id
 """
 
+# diner_idx로 필터하면 diner_name/diner_tag는 전체 결과에서 상수이므로
+# kakao_diner 전체를 행마다 JOIN하지 않고 CTE로 한 번만 읽어 붙입니다.
+# 파라미터: (diner_idx, diner_idx, limit, offset)
 GET_KAKAO_REVIEWS_BY_DINER = """
+    WITH diner AS (
+        SELECT diner_name, diner_tag FROM kakao_diner WHERE diner_idx = %s
+    )
     SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
            kr.reviewer_review, kr.reviewer_review_date, kr.reviewer_review_score,
            kr.crawled_at, kr.updated_at,
-           kd.diner_name, kd.diner_tag,
-           kr2.reviewer_user_name
+           d.diner_name, d.diner_tag,
+           kr2.reviewer_user_name,
+           COUNT(*) OVER () AS total_count
     FROM kakao_review kr
-    LEFT JOIN kakao_diner kd ON kr.diner_idx = kd.diner_idx
+    LEFT JOIN diner d ON TRUE
     LEFT JOIN kakao_reviewer kr2 ON kr.reviewer_id = kr2.reviewer_id
     WHERE kr.diner_idx = %s
     ORDER BY kr.reviewer_review_score DESC, kr.crawled_at DESC LIMIT %s OFFSET %s
 """
 
+# reviewer_id로 필터하면 reviewer_user_name이 상수이므로 위와 동일하게 처리
+# 파라미터: (reviewer_id, reviewer_id, limit, offset)
 GET_KAKAO_REVIEWS_BY_REVIEWER = """
+    WITH reviewer AS (
+        SELECT reviewer_user_name FROM kakao_reviewer WHERE reviewer_id = %s
+    )
     SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
            kr.reviewer_review, kr.reviewer_review_date, kr.reviewer_review_score,
            kr.crawled_at, kr.updated_at,
            kd.diner_name, kd.diner_tag,
-           kr2.reviewer_user_name
+           r.reviewer_user_name,
+           COUNT(*) OVER () AS total_count
     FROM kakao_review kr
+    LEFT JOIN reviewer r ON TRUE
     LEFT JOIN kakao_diner kd ON kr.diner_idx = kd.diner_idx
-    LEFT JOIN kakao_reviewer kr2 ON kr.reviewer_id = kr2.reviewer_id
     WHERE kr.reviewer_id = %s
     ORDER BY kr.reviewer_review_score DESC, kr.crawled_at DESC LIMIT %s OFFSET %s
 """
 
+# 중첩(jsonb) 응답 변형
+# 조인 대신 상관 서브쿼리로 diner/reviewer를 jsonb 객체 컬럼으로 돌려줍니다.
+# 리뷰당 출력 행이 정확히 하나로 유지되므로, 태그/이미지처럼 1:N 자식이
+# 붙어도 행이 복제되지 않고 API가 후처리 없이 그대로 직렬화할 수 있습니다.
+GET_KAKAO_REVIEW_BY_ID_NESTED = """
+    SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
+           kr.reviewer_review, kr.reviewer_review_date, kr.reviewer_review_score,
+           kr.crawled_at, kr.updated_at,
+           (SELECT jsonb_build_object('name', kd.diner_name, 'tag', kd.diner_tag)
+            FROM kakao_diner kd WHERE kd.diner_idx = kr.diner_idx) AS diner,
+           (SELECT jsonb_build_object('name', kr2.reviewer_user_name)
+            FROM kakao_reviewer kr2 WHERE kr2.reviewer_id = kr.reviewer_id) AS reviewer
+    FROM kakao_review kr
+    WHERE kr.review_id = %s
+"""
+
+# 파라미터: (diner_idx, limit, offset)
+GET_KAKAO_REVIEWS_BY_DINER_NESTED = """
+    SELECT kr.id, kr.diner_idx, kr.reviewer_id, kr.review_id,
+           kr.reviewer_review, kr.reviewer_review_date, kr.reviewer_review_score,
+           kr.crawled_at, kr.updated_at,
+           (SELECT jsonb_build_object('name', kd.diner_name, 'tag', kd.diner_tag)
+            FROM kakao_diner kd WHERE kd.diner_idx = kr.diner_idx) AS diner,
+           (SELECT jsonb_build_object('name', kr2.reviewer_user_name)
+            FROM kakao_reviewer kr2 WHERE kr2.reviewer_id = kr.reviewer_id) AS reviewer
+    FROM kakao_review kr
+    WHERE kr.diner_idx = %s
+    ORDER BY kr.reviewer_review_score DESC, kr.crawled_at DESC LIMIT %s OFFSET %s
+"""
+
 # 존재 확인 쿼리
 CHECK_KAKAO_REVIEW_EXISTS = """
     SELECT 1 FROM kakao_review WHERE review_id = %s
@@ -360,6 +711,22 @@ CHECK_KAKAO_REVIEW_DUPLICATE = """
     SELECT 1 FROM kakao_review WHERE review_id = %s
 """
 
+# 대량 존재 확인 쿼리 (크롤러 dedup용)
+# 후보 id 목록을 배열 하나로 넘기고 이미 존재하는 것만 돌려받아
+# 호출 측에서 set 차집합으로 신규분을 골라냅니다.
+# 건당 CHECK_* 왕복 N번이 왕복 1번으로 줄어듭니다.
+GET_EXISTING_KAKAO_REVIEW_IDS = """
+    SELECT review_id FROM kakao_review WHERE review_id = ANY(%s)
+"""
+
+GET_EXISTING_KAKAO_DINER_IDXS = """
+    SELECT diner_idx FROM kakao_diner WHERE diner_idx = ANY(%s)
+"""
+
+GET_EXISTING_KAKAO_REVIEWER_IDS = """
+    SELECT reviewer_id FROM kakao_reviewer WHERE reviewer_id = ANY(%s)
+"""
+
 # 업데이트 쿼리
 UPDATE_KAKAO_REVIEW_BY_ID = """
     UPDATE kakao_review SET
@@ -380,10 +747,7 @@ COUNT_KAKAO_REVIEWS = """
     SELECT COUNT(*) FROM kakao_review
 """
 
-COUNT_KAKAO_REVIEWS_BY_DINER = """
-    SELECT COUNT(*) FROM kakao_review WHERE diner_idx = %s
-"""
-
-COUNT_KAKAO_REVIEWS_BY_REVIEWER = """
-    SELECT COUNT(*) FROM kakao_review WHERE reviewer_id = %s
+# 근사 카운트 (UI 표시용)
+COUNT_KAKAO_REVIEWS_ESTIMATE = """
+    SELECT reltuples::BIGINT AS estimate FROM pg_class WHERE relname = 'kakao_review'
 """
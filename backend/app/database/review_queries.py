@@ -74,7 +74,9 @@ COUNT_REVIEWS_BY_ITEM = """
     SELECT COUNT(*) FROM reviews WHERE item_id = %s
 """
 
+# 트리거로 유지되는 items.avg_rating / review_count 집계 컬럼을 읽습니다.
+# 리뷰 전체 스캔 대신 단일 행 PK 조회. (migrations.create_item_rating_aggregates)
 GET_AVERAGE_RATING_BY_ITEM = """
-    SELECT AVG(score) as average_rating, COUNT(*) as review_count
-    FROM reviews WHERE item_id = %s
+    SELECT avg_rating as average_rating, review_count
+    FROM items WHERE id = %s
 """
@@ -50,6 +50,25 @@ GET_USER_ID_BY_FIREBASE_UID = """
 SELECT id FROM users WHERE firebase_uid = %s
 """
 
+# 활동 로그 배치 적재 시 firebase_uid → user_id 일괄 변환용
+GET_USER_IDS_BY_FIREBASE_UIDS = """
+SELECT id, firebase_uid FROM users WHERE firebase_uid = ANY(%s)
+"""
+
+# 좁은 프로젝션 쿼리
+# 전체 사용자 행은 온보딩 JSON/배열 컬럼(restaurant_ratings,
+# food_preferences_*) 때문에 TOAST 접근이 발생하므로, 인증/세션처럼
+# 일부 컬럼만 필요한 경로는 아래 변형을 사용합니다.
+GET_USER_AUTH_BY_FIREBASE_UID = """
+SELECT id, firebase_uid, name, email FROM users WHERE firebase_uid = %s
+"""
+
+GET_USER_PROFILE_BY_ID = """
+SELECT id, firebase_uid, kakao_reviewer_id, name, email, display_name, photo_url,
+       created_at, updated_at
+FROM users WHERE id = %s
+"""
+
 GET_ALL_USERS = """
 SELECT id, firebase_uid, kakao_reviewer_id, name, email, display_name, photo_url,
        created_at, updated_at,
@@ -63,10 +82,66 @@ SELECT id, firebase_uid, kakao_reviewer_id, name, email, display_name, photo_url
 FROM users ORDER BY created_at DESC LIMIT %s OFFSET %s
 """
 
-UPDATE_USER_BY_ID = """
-UPDATE users SET
-    {fields}
+# 사용자 업데이트 쿼리
+# {fields} 문자열 포매팅으로 SET 절을 조립하면 갱신 필드 조합마다 다른
+# SQL 텍스트가 생겨 prepared statement 캐시가 전혀 재사용되지 않습니다.
+# 고정 SET 절 + COALESCE로 바꿔 항상 같은 문장이 실행되게 합니다.
+# (None을 넘기면 해당 컬럼은 기존 값 유지)
+# 파라미터 순서는 USER_UPDATE_FIELD_ORDER와 일치해야 합니다.
+USER_UPDATE_FIELD_ORDER = (
+    "name",
+    "email",
+    "display_name",
+    "photo_url",
+    "kakao_reviewer_id",
+    "is_personalization_enabled",
+    "has_completed_onboarding",
+    "location",
+    "location_method",
+    "user_lat",
+    "user_lon",
+    "birth_year",
+    "gender",
+    "dining_companions",
+    "regular_budget",
+    "special_budget",
+    "spice_level",
+    "allergies",
+    "dislikes",
+    "food_preferences_large",
+    "food_preferences_middle",
+    "restaurant_ratings",
+)
+
+_USER_UPDATE_SET_CLAUSE = """
+    name = COALESCE(%s, name),
+    email = COALESCE(%s, email),
+    display_name = COALESCE(%s, display_name),
+    photo_url = COALESCE(%s, photo_url),
+    kakao_reviewer_id = COALESCE(%s, kakao_reviewer_id),
+    is_personalization_enabled = COALESCE(%s, is_personalization_enabled),
+    has_completed_onboarding = COALESCE(%s, has_completed_onboarding),
+    location = COALESCE(%s, location),
+    location_method = COALESCE(%s, location_method),
+    user_lat = COALESCE(%s, user_lat),
+    user_lon = COALESCE(%s, user_lon),
+    birth_year = COALESCE(%s, birth_year),
+    gender = COALESCE(%s, gender),
+    dining_companions = COALESCE(%s, dining_companions),
+    regular_budget = COALESCE(%s, regular_budget),
+    special_budget = COALESCE(%s, special_budget),
+    spice_level = COALESCE(%s, spice_level),
+    allergies = COALESCE(%s, allergies),
+    dislikes = COALESCE(%s, dislikes),
+    food_preferences_large = COALESCE(%s, food_preferences_large),
+    food_preferences_middle = COALESCE(%s, food_preferences_middle),
+    restaurant_ratings = COALESCE(%s, restaurant_ratings),
     updated_at = CURRENT_TIMESTAMP
+"""
+
+UPDATE_USER_BY_ID = f"""
+UPDATE users SET
+    {_USER_UPDATE_SET_CLAUSE}
 WHERE id = %s
 RETURNING id, firebase_uid, kakao_reviewer_id, name, email, display_name, photo_url,
           created_at, updated_at,
@@ -79,15 +154,22 @@ RETURNING id, firebase_uid, kakao_reviewer_id, name, email, display_name, photo_
           restaurant_ratings
 """
 
-UPDATE_USER_BY_FIREBASE_UID = """
+UPDATE_USER_BY_FIREBASE_UID = f"""
 UPDATE users SET
-    {fields}
-    updated_at = CURRENT_TIMESTAMP
+    {_USER_UPDATE_SET_CLAUSE}
 WHERE firebase_uid = %s
 RETURNING id, firebase_uid, name, email, display_name, photo_url, kakao_reviewer_id,
           created_at, updated_at
 """
 
+# Firebase 동기화 전용 프로필 업데이트 (결과 행 불필요)
+UPDATE_USER_FIREBASE_PROFILE = """
+UPDATE users SET
+    name = %s, email = %s, display_name = %s, photo_url = %s,
+    updated_at = CURRENT_TIMESTAMP
+WHERE firebase_uid = %s
+"""
+
 DELETE_USER_BY_ID = """
 DELETE FROM users WHERE id = %s RETURNING id
 """
@@ -96,6 +178,11 @@ COUNT_USERS = """
 SELECT COUNT(*) FROM users
 """
 
+# 근사 카운트 (UI 표시용) - pg_class 통계를 O(1)로 읽음
+COUNT_USERS_ESTIMATE = """
+SELECT reltuples::BIGINT AS estimate FROM pg_class WHERE relname = 'users'
+"""
+
 # Firebase 동기화 관련 쿼리
 INSERT_USER_FOR_SYNC = """
 INSERT INTO users (id, firebase_uid, name, email, display_name, photo_url, kakao_reviewer_id)
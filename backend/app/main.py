@@ -1,8 +1,10 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1 import (
     activity_logs,
@@ -19,60 +21,156 @@ from app.api.v1 import (
     vector_db,
 )
 from app.core.config import settings
+from app.core.cors import ASGICORSMiddleware
 from app.core.db import db
 from app.core.redis_db import redis_db
+from app.services.activity_log_service import activity_log_buffer
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """애플리케이션 생명주기 관리"""
-    # 시작 시 실행
-    logger.info("yamyam API 서버 시작")
+# Redis 상태 갱신 주기 (초)
+REDIS_HEALTH_CHECK_INTERVAL = 10.0
+
+# 상위 리뷰어 구체화 뷰 갱신 주기 (초)
+TOP_REVIEWERS_REFRESH_INTERVAL = 600.0
+
+
+async def _refresh_top_reviewers():
+    """상위 리뷰어 구체화 뷰를 주기적으로 갱신하는 백그라운드 태스크
 
-    # 데이터베이스 마이그레이션 실행 (옵션)
-    if settings.run_migrations:
+    /kakao/reviewers/top이 읽는 mv_top_kakao_reviewers를 주기적으로
+    REFRESH MATERIALIZED VIEW CONCURRENTLY로 갱신합니다. 동기 psycopg2
+    호출이므로 스레드로 위임하고, 갱신 실패(뷰 미생성 등)는
+    refresh_top_reviewers_view가 경고만 남기고 넘어갑니다.
+    """
+    from app.core.migrations import refresh_top_reviewers_view
+
+    while True:
+        await asyncio.sleep(TOP_REVIEWERS_REFRESH_INTERVAL)
+        await asyncio.to_thread(refresh_top_reviewers_view)
+
+
+async def _monitor_redis(app: FastAPI):
+    """Redis 상태를 주기적으로 갱신하는 백그라운드 태스크
+
+    K8s liveness/readiness probe가 초 단위로 /health를 때리면 probe마다
+    Redis PING 왕복이 발생합니다. 대신 이 태스크가 주기적으로 핑을 보내
+    app.state.redis_status에 캐시해 두고, /health는 I/O 없이 캐시된
+    값만 읽습니다.
+    """
+    while True:
         try:
+            client = await redis_db.get_client()
+            is_connected = await client.ping()
+            app.state.redis_status = "healthy" if is_connected else "unhealthy"
+        except Exception:
+            app.state.redis_status = "unavailable"
+        await asyncio.sleep(REDIS_HEALTH_CHECK_INTERVAL)
+
+
+async def _run_ddl_and_migrations(app: FastAPI):
+    """DDL(테이블 생성) + 마이그레이션 실행
+
+    기동 경로와 분리해 호출됩니다. 동기 DDL은 asyncio.to_thread로
+    이벤트 루프 밖에서 실행하고, 진행 상태를 app.state.migration_status에
+    기록해 /health에서 확인할 수 있게 합니다.
+    """
+    app.state.migration_status = "running"
+
+    # 데이터베이스 테이블 생성 (비동기 엔진, 루프 블로킹 없음)
+    # 마이그레이션보다 먼저 실행해야 합니다: 빈 DB에서는 ALTER TABLE류
+    # 마이그레이션이 실패하는데, 그 실패가 테이블 생성까지 막으면
+    # 재시작해도 같은 이유로 계속 실패하는 부트스트랩 교착이 됩니다.
+    try:
+        await db.create_tables()
+        logger.info("데이터베이스 테이블 초기화 완료")
+    except Exception as e:
+        logger.error(f"테이블 생성 중 오류 발생: {e}")
+        import traceback
+
+        logger.error(f"테이블 생성 오류 상세: {traceback.format_exc()}")
+        logger.warning("테이블 생성 실패했지만 서버는 계속 실행합니다.")
+        app.state.migration_status = "failed"
+        return
+
+    try:
+        # 데이터베이스 마이그레이션 실행 (옵션)
+        if settings.run_migrations:
             from app.core.migrations import run_migrations
 
             logger.info("데이터베이스 마이그레이션 실행 중...")
-            run_migrations()
+            await run_migrations()
             logger.info("데이터베이스 마이그레이션 완료")
-        except Exception as e:
-            logger.error(f"마이그레이션 실행 중 오류 발생: {e}")
-            import traceback
+        else:
+            logger.info(
+                "데이터베이스 마이그레이션이 비활성화되어 있습니다. (RUN_MIGRATIONS=false)"
+            )
+        app.state.migration_status = "complete"
+    except Exception as e:
+        logger.error(f"마이그레이션 실행 중 오류 발생: {e}")
+        import traceback
 
-            logger.error(f"마이그레이션 오류 상세: {traceback.format_exc()}")
-            logger.warning("마이그레이션 실패했지만 서버는 계속 실행합니다.")
+        logger.error(f"마이그레이션 오류 상세: {traceback.format_exc()}")
+        logger.warning("마이그레이션 실패했지만 서버는 계속 실행합니다.")
+        app.state.migration_status = "failed"
+
+
+# 서브시스템별 lifespan
+# 각 서브시스템(DB 마이그레이션, Redis)의 시작/종료를 독립된 컨텍스트
+# 매니저로 분리하고, lifespan에서 AsyncExitStack으로 합성합니다.
+# 새 서브시스템은 컨텍스트 매니저를 하나 추가하는 것으로 끝나며,
+# 종료 순서는 스택이 역순으로 보장합니다.
+
+
+@asynccontextmanager
+async def _migrations_lifespan(app: FastAPI):
+    """DDL/마이그레이션 lifespan
+
+    async 모드에서는 백그라운드 태스크로 띄워 서버가 즉시 /health에
+    응답하게 합니다 (K8s readiness probe가 DDL 왕복을 기다리지 않음).
+    """
+    app.state.migration_status = "skipped"
+    app.state.migration_task = None
+    if settings.migration_mode == "async":
+        app.state.migration_task = asyncio.create_task(_run_ddl_and_migrations(app))
+    elif settings.migration_mode == "sync":
+        await _run_ddl_and_migrations(app)
     else:
-        logger.info(
-            "데이터베이스 마이그레이션이 비활성화되어 있습니다. (RUN_MIGRATIONS=false)"
-        )
+        logger.info("마이그레이션/DDL 생략 (MIGRATION_MODE=skip)")
+
+    yield
+
+    # 진행 중인 마이그레이션 태스크 정리
+    if app.state.migration_task is not None and not app.state.migration_task.done():
+        app.state.migration_task.cancel()
 
-    # 데이터베이스 테이블 생성
-    try:
-        db.create_tables()
-        logger.info("데이터베이스 테이블 초기화 완료")
-    except Exception as e:
-        logger.error(f"데이터베이스 초기화 실패: {e}")
-        raise
 
-    # Redis 연결 확인
+@asynccontextmanager
+async def _redis_lifespan(app: FastAPI):
+    """Redis 연결/상태 모니터링 lifespan"""
+    app.state.redis_status = "unknown"
+    app.state.redis_monitor_task = None
     try:
         client = await redis_db.get_client()
         redis.redis_service.redis_client = client  # RedisService에 client 할당
         await redis.redis_service.initialize_data()
+        app.state.redis_status = "healthy"
         logger.info("Redis 연결 및 초기화 완료")
     except Exception as e:
+        app.state.redis_status = "unavailable"
         logger.error(f"Redis 초기화 실패: {e}")
 
+    # 상태 캐시 갱신 태스크 시작 (/health는 캐시만 읽음)
+    app.state.redis_monitor_task = asyncio.create_task(_monitor_redis(app))
+
     yield
 
-    # 종료 시 실행
-    logger.info("yamyam API 서버 종료 중...")
+    # Redis 상태 갱신 태스크 정리
+    if app.state.redis_monitor_task is not None:
+        app.state.redis_monitor_task.cancel()
 
     # Redis 연결 종료
     try:
@@ -81,104 +179,206 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Redis 종료 실패: {e}")
 
-    logger.info("yamyam API 서버 종료 완료")
 
+@asynccontextmanager
+async def _top_reviewers_refresh_lifespan(app: FastAPI):
+    """상위 리뷰어 구체화 뷰 주기 갱신 lifespan"""
+    app.state.top_reviewers_refresh_task = asyncio.create_task(_refresh_top_reviewers())
 
-# FastAPI 앱 생성
-app = FastAPI(
-    title="yamyam API",
-    description="음식 추천 시스템 API",
-    version="1.0.0",
-    lifespan=lifespan,
-)
+    yield
 
-# CORS 미들웨어 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    if app.state.top_reviewers_refresh_task is not None:
+        app.state.top_reviewers_refresh_task.cancel()
 
-# API 라우터 등록
-app.include_router(auth.router, prefix="/auth", tags=["authentication"])
-app.include_router(users.router, prefix="/users", tags=["users"])
-app.include_router(
-    activity_logs.router, prefix="/activity-logs", tags=["activity-logs"]
-)
-app.include_router(items.router, prefix="/items", tags=["items"])
-app.include_router(reviews.router, prefix="/reviews", tags=["reviews"])
-app.include_router(upload.router, prefix="/upload")
-app.include_router(kakao_diners.router, prefix="/kakao/diners", tags=["kakao-diners"])
-app.include_router(
-    kakao_reviews.router, prefix="/kakao/reviews", tags=["kakao-reviews"]
-)
-app.include_router(
-    kakao_reviewers.router, prefix="/kakao/reviewers", tags=["kakao-reviewers"]
+
+@asynccontextmanager
+async def _activity_log_buffer_lifespan(app: FastAPI):
+    """활동 로그 배치 버퍼 lifespan (종료 시 잔여 이벤트 flush)"""
+    yield
+
+    # flush/join은 블로킹이므로 이벤트 루프 밖에서 수행
+    await asyncio.to_thread(activity_log_buffer.close)
+    logger.info("활동 로그 버퍼 flush 완료")
+
+
+# 합성 대상 서브시스템 lifespan 목록 (진입 순서 = 기록 순서)
+_SUBSYSTEM_LIFESPANS = (
+    _migrations_lifespan,
+    _redis_lifespan,
+    _top_reviewers_refresh_lifespan,
+    _activity_log_buffer_lifespan,
 )
-app.include_router(vector_db.router, prefix="/vector_db", tags=["vector-db"])
-app.include_router(redis.router, prefix="/redis", tags=["redis"])
-app.include_router(recommendation.router, prefix="/rec", tags=["recommendation"])
-
-
-@app.get("/")
-def root():
-    """root endpoint"""
-    return {
-        "message": "🍜 yamyam API에 오신 것을 환영합니다!",
-        "version": "1.0.0",
-        "docs": "/docs",
-    }
-
-
-@app.get("/health")
-async def health_check():
-    """health check endpoint"""
-    # Redis 상태 확인
-    redis_status = "healthy"
+
+
+def _check_pydantic_compiled() -> None:
+    """pydantic-core가 컴파일된 바이너리 빌드인지 기동 시 확인
+
+    요청 검증은 전부 pydantic-core를 거치므로, 순수 파이썬 폴백으로
+    설치된 환경(wheel이 없는 플랫폼 등)은 검증 비용이 수 배로 늘어납니다.
+    빌드 문제를 조용히 안고 가지 않도록 기동 로그에 남깁니다.
+    """
     try:
-        is_connected = await redis_db.ping()
-        if not is_connected:
-            redis_status = "unhealthy"
-    except Exception:
-        redis_status = "unavailable"
-
-    return {
-        "status": "healthy",
-        "service": "yamyam-api",
-        "version": "1.0.0",
-        "redis": redis_status,
-    }
-
-
-@app.get("/info")
-def get_info():
-    """service information"""
-    return {
-        "service": "yamyam API",
-        "version": "1.0.0",
-        "environment": settings.environment,
-        "debug": settings.debug,
-        "endpoints": {
-            "auth": "/auth",
-            "users": "/users",
-            "activity_logs": "/activity-logs",
-            "items": "/items",
-            "reviews": "/reviews",
-            "upload": "/upload",
-            "kakao_diners": "/kakao/diners",
-            "kakao_reviews": "/kakao/reviews",
-            "kakao_reviewers": "/kakao/reviewers",
-            "vector_db": "/vector_db",
-            "redis": "/redis",
+        import pydantic
+        import pydantic_core
+
+        binary = pydantic_core._pydantic_core.__file__ or ""
+        if binary.endswith((".so", ".pyd")):
+            logger.info(
+                f"pydantic {pydantic.VERSION} / "
+                f"pydantic-core {pydantic_core.__version__} (컴파일 빌드)"
+            )
+        else:
+            logger.warning(
+                "pydantic-core가 순수 파이썬 빌드로 설치되어 있습니다. "
+                "요청 검증 성능이 크게 저하되므로 바이너리 wheel 설치를 확인하세요."
+            )
+    except Exception as e:
+        logger.warning(f"pydantic 빌드 확인 실패: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 생명주기 관리 (서브시스템 lifespan 합성)"""
+    logger.info("yamyam API 서버 시작")
+    _check_pydantic_compiled()
+
+    async with AsyncExitStack() as stack:
+        # 서브시스템 시작 단계를 동시에 진입: 서로 다른 백엔드(DB, Redis)에
+        # 대한 독립 I/O이므로 순차 합산 대신 가장 느린 서브시스템 시간으로
+        # 기동이 수렴합니다. 종료는 스택이 역순으로 정리합니다.
+        await asyncio.gather(
+            *(
+                stack.enter_async_context(subsystem_lifespan(app))
+                for subsystem_lifespan in _SUBSYSTEM_LIFESPANS
+            )
+        )
+
+        yield
+
+        logger.info("yamyam API 서버 종료 중...")
+
+    logger.info("yamyam API 서버 종료 완료")
+
+
+def create_app() -> FastAPI:
+    """FastAPI 앱 팩토리
+
+    앱 구성(미들웨어, 라우터, 운영 엔드포인트)을 한 곳에 모아
+    테스트나 배포 변형에서 동일한 구성으로 앱을 만들 수 있게 합니다.
+    """
+    app = FastAPI(
+        title="yamyam API",
+        description="음식 추천 시스템 API",
+        version="1.0.0",
+        lifespan=lifespan,
+        # orjson 기반 직렬화 (stdlib json.dumps 대비 응답 인코딩 수 배 단축)
+        default_response_class=ORJSONResponse,
+    )
+
+    # CORS 미들웨어 설정 (순수 ASGI 구현, app.core.cors 참고)
+    app.add_middleware(ASGICORSMiddleware, allow_origins=settings.allowed_origins)
+
+    # 완전 정적인 응답은 앱 생성 시 한 번만 직렬화해 두고
+    # 요청마다 dict 생성/JSON 인코딩 없이 바이트 그대로 반환
+    root_bytes = orjson.dumps(
+        {
+            "message": "🍜 yamyam API에 오신 것을 환영합니다!",
+            "version": "1.0.0",
             "docs": "/docs",
-            "health": "/health",
-        },
-    }
+        }
+    )
+    info_bytes = orjson.dumps(
+        {
+            "service": "yamyam API",
+            "version": "1.0.0",
+            "environment": settings.environment,
+            "debug": settings.debug,
+            "endpoints": {
+                "auth": "/auth",
+                "users": "/users",
+                "activity_logs": "/activity-logs",
+                "items": "/items",
+                "reviews": "/reviews",
+                "upload": "/upload",
+                "kakao_diners": "/kakao/diners",
+                "kakao_reviews": "/kakao/reviews",
+                "kakao_reviewers": "/kakao/reviewers",
+                "vector_db": "/vector_db",
+                "redis": "/redis",
+                "docs": "/docs",
+                "health": "/health",
+            },
+        }
+    )
+
+    # 운영(probe) 엔드포인트는 라우터 등록 전에 정의해 라우트 테이블
+    # 맨 앞에 배치합니다. 라우트 매칭은 등록 순서대로 선형 탐색이므로,
+    # 로드밸런서가 초 단위로 때리는 /health와 /가 수십 개의 API 라우트
+    # 정규식을 매번 지나치지 않게 됩니다.
+
+    @app.get("/")
+    def root():
+        """root endpoint"""
+        return Response(content=root_bytes, media_type="application/json")
+
+    @app.get("/health")
+    async def health_check():
+        """health check endpoint"""
+        # Redis 상태는 백그라운드 태스크(_monitor_redis)가 캐시한 값을 읽음
+        redis_status = getattr(app.state, "redis_status", "unknown")
+
+        return {
+            "status": "healthy",
+            "service": "yamyam-api",
+            "version": "1.0.0",
+            "redis": redis_status,
+            "migrations": getattr(app.state, "migration_status", "unknown"),
+        }
+
+    @app.get("/info")
+    def get_info():
+        """service information"""
+        return Response(content=info_bytes, media_type="application/json")
+
+    # API 라우터 등록 (router, prefix, tags)
+    routers = (
+        (auth.router, "/auth", ["authentication"]),
+        (users.router, "/users", ["users"]),
+        (activity_logs.router, "/activity-logs", ["activity-logs"]),
+        (items.router, "/items", ["items"]),
+        (reviews.router, "/reviews", ["reviews"]),
+        (upload.router, "/upload", None),
+        (kakao_diners.router, "/kakao/diners", ["kakao-diners"]),
+        (kakao_reviews.router, "/kakao/reviews", ["kakao-reviews"]),
+        (kakao_reviewers.router, "/kakao/reviewers", ["kakao-reviewers"]),
+        (vector_db.router, "/vector_db", ["vector-db"]),
+        (redis.router, "/redis", ["redis"]),
+        (recommendation.router, "/rec", ["recommendation"]),
+    )
+    for router, prefix, tags in routers:
+        app.include_router(router, prefix=prefix, tags=tags)
+
+    return app
+
+
+# FastAPI 앱 생성
+app = create_app()
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=settings.debug)
+    # uvloop + httptools: 기본 asyncio 루프/파서 대비 처리량 30~40% 향상.
+    # reload는 단일 프로세스에서만 동작하므로 debug일 때는 워커를 1로 유지.
+    workers = 1 if settings.debug else (os.cpu_count() or 1)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        reload=settings.debug,
+    )
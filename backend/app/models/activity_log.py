@@ -1,5 +1,8 @@
-from sqlalchemy import ARRAY, TIMESTAMP, Column, Float, Integer, String, Text
+from datetime import datetime
+
+from sqlalchemy import ARRAY, TIMESTAMP, Float, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from .base import Base, ULIDMixin
@@ -10,45 +13,64 @@ class UserActivityLog(Base, ULIDMixin):
 
     __tablename__ = "user_activity_logs"
 
+    # ML 학습용 조회 패턴에 맞춘 복합/커버링 인덱스
+    # 학습 추출 쿼리는 (firebase_uid, 기간) 또는 (event_type, 기간)으로
+    # 거르므로 단일 컬럼 인덱스 대신 복합 인덱스를 사용합니다.
+    # event_timestamp 단독 범위 스캔은 append-only 특성상 BRIN으로 충분하며
+    # 클릭 로그는 INCLUDE로 heap 접근 없는 index-only scan을 지원합니다.
+    __table_args__ = (
+        Index("ix_ual_uid_ts", "firebase_uid", "event_timestamp"),
+        Index("ix_ual_evt_ts", "event_type", "event_timestamp"),
+        Index("ix_ual_ts_brin", "event_timestamp", postgresql_using="brin"),
+        Index(
+            "ix_ual_click",
+            "clicked_diner_idx",
+            "event_timestamp",
+            postgresql_include=["display_position"],
+        ),
+    )
+
     # User identification
-    user_id = Column(String(26), nullable=False, index=True)
-    firebase_uid = Column(String(128), nullable=False, index=True)
+    user_id: Mapped[str] = mapped_column(String(26), index=True)
+    firebase_uid: Mapped[str] = mapped_column(String(128))
 
     # Session tracking
-    session_id = Column(String(50), nullable=False, index=True)
+    # 세션 ID는 ULID(26자) 또는 UUID(36자) 형식: 인덱스된 varchar는 폭이
+    # 좁을수록 BTREE 페이지당 엔트리가 많아져 버퍼 캐시 적중률이 오릅니다
+    session_id: Mapped[str] = mapped_column(String(36), index=True)
 
     # Event information
-    event_type = Column(String(50), nullable=False, index=True)
-    event_timestamp = Column(
-        TIMESTAMP(timezone=True), server_default=func.now(), index=True
+    event_type: Mapped[str] = mapped_column(String(30))
+    event_timestamp: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now()
     )
-    page = Column(String(50))
+    page: Mapped[str | None] = mapped_column(String(30))
 
     # Location related
-    location_query = Column(String(255))
-    location_address = Column(String(255))
-    location_lat = Column(Float)
-    location_lon = Column(Float)
-    location_method = Column(String(50))
+    location_query: Mapped[str | None] = mapped_column(String(255))
+    location_address: Mapped[str | None] = mapped_column(String(255))
+    location_lat: Mapped[float | None] = mapped_column(Float)
+    location_lon: Mapped[float | None] = mapped_column(Float)
+    location_method: Mapped[str | None] = mapped_column(String(50))
 
     # Search filter related
-    search_radius_km = Column(Float)
-    selected_large_categories = Column(ARRAY(Text))
-    selected_middle_categories = Column(ARRAY(Text))
-    sort_by = Column(String(50))
-    period = Column(String(20))
+    search_radius_km: Mapped[float | None] = mapped_column(Float)
+    selected_large_categories: Mapped[list[str] | None] = mapped_column(ARRAY(Text))
+    selected_middle_categories: Mapped[list[str] | None] = mapped_column(ARRAY(Text))
+    sort_by: Mapped[str | None] = mapped_column(String(30))
+    period: Mapped[str | None] = mapped_column(String(20))
 
     # Ranking page related
-    selected_city = Column(String(100))
-    selected_region = Column(String(100))
-    selected_grades = Column(ARRAY(Text))
+    selected_city: Mapped[str | None] = mapped_column(String(100))
+    selected_region: Mapped[str | None] = mapped_column(String(100))
+    selected_grades: Mapped[list[str] | None] = mapped_column(ARRAY(Text))
 
     # Click/Interaction related
-    clicked_diner_idx = Column(String(50), index=True)
-    clicked_diner_name = Column(String(255))
-    display_position = Column(Integer)
+    clicked_diner_idx: Mapped[str | None] = mapped_column(String(50))
+    clicked_diner_name: Mapped[str | None] = mapped_column(String(255))
+    display_position: Mapped[int | None] = mapped_column(Integer)
 
     # Additional metadata
-    additional_data = Column(JSONB)
-    user_agent = Column(Text)
-    ip_address = Column(String(45))
+    additional_data: Mapped[dict | None] = mapped_column(JSONB)
+    user_agent: Mapped[str | None] = mapped_column(Text)
+    ip_address: Mapped[str | None] = mapped_column(String(45))
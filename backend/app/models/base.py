@@ -1,19 +1,49 @@
-from sqlalchemy import Column, String
-from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from app.utils.ulid_utils import generate_ulid
 
-# 모든 모델의 기본 클래스
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """모든 모델의 기본 클래스 (SQLAlchemy 2.0 declarative)"""
 
 
 class ULIDMixin:
     """ULID를 프라이머리 키로 사용하는 Mixin 클래스"""
 
-    id = Column(
+    id: Mapped[str] = mapped_column(
         String(26),
         primary_key=True,
         default=generate_ulid,
         index=True,
         comment="ULID (Universally Lexicographically Sortable Identifier)",
     )
+
+
+class TimestampMixin:
+    """created_at/updated_at 공통 컬럼 Mixin
+
+    모델마다 동일한 DateTime 컬럼과 server_default 식을 재정의하는 대신
+    한 곳에서 정의해 공유합니다.
+    """
+
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class CrawledTimestampMixin:
+    """crawled_at/updated_at 공통 컬럼 Mixin (크롤링 수집 테이블용)"""
+
+    crawled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -1,21 +1,16 @@
-from sqlalchemy import Column, DateTime, String, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base, ULIDMixin
+from .base import Base, TimestampMixin, ULIDMixin
 
 
-class Item(Base, ULIDMixin):
+class Item(Base, ULIDMixin, TimestampMixin):
     __tablename__ = "items"
 
-    name = Column(String(255), nullable=False)
-    category = Column(String(100))
-    description = Column(Text)
-    location = Column(String(255))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
+    name: Mapped[str] = mapped_column(String(255))
+    category: Mapped[str | None] = mapped_column(String(100))
+    description: Mapped[str | None] = mapped_column(Text)
+    location: Mapped[str | None] = mapped_column(String(255))
 
     # Relationships
-    reviews = relationship("Review", back_populates="item")
+    reviews: Mapped[list["Review"]] = relationship(back_populates="item")  # noqa: F821
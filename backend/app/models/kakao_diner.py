@@ -1,40 +1,39 @@
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Float, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base, ULIDMixin
+from .base import Base, CrawledTimestampMixin, ULIDMixin
 
 
-class KakaoDiner(Base, ULIDMixin):
+class KakaoDiner(Base, ULIDMixin, CrawledTimestampMixin):
     __tablename__ = "kakao_diner"
 
-    diner_idx = Column(Integer, unique=True, nullable=False, index=True)
-    diner_name = Column(String(255), nullable=False)
-    diner_tag = Column(Text)
-    diner_menu_name = Column(Text)
-    diner_menu_price = Column(Text)
-    diner_review_cnt = Column(Integer)
-    diner_review_avg = Column(Float)
-    diner_blog_review_cnt = Column(Float)
-    diner_review_tags = Column(Text)
-    diner_road_address = Column(Text)
-    diner_num_address = Column(Text)
-    diner_phone = Column(String(50))
-    diner_lat = Column(Float, nullable=False)
-    diner_lon = Column(Float, nullable=False)
-    diner_open_time = Column(Text)
-    diner_category_large = Column(String(100))
-    diner_category_middle = Column(String(100))
-    diner_category_small = Column(String(100))
-    diner_category_detail = Column(String(100))
-    diner_grade = Column(Integer)
-    hidden_score = Column(Float)
-    bayesian_score = Column(Float)
-    crawled_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
+    diner_idx: Mapped[int] = mapped_column(Integer, unique=True, index=True)
+    diner_name: Mapped[str] = mapped_column(String(255))
+    diner_tag: Mapped[str | None] = mapped_column(Text)
+    diner_menu_name: Mapped[str | None] = mapped_column(Text)
+    diner_menu_price: Mapped[str | None] = mapped_column(Text)
+    diner_review_cnt: Mapped[int | None] = mapped_column(Integer)
+    diner_review_avg: Mapped[float | None] = mapped_column(Float)
+    diner_blog_review_cnt: Mapped[float | None] = mapped_column(Float)
+    diner_review_tags: Mapped[str | None] = mapped_column(Text)
+    diner_road_address: Mapped[str | None] = mapped_column(Text)
+    diner_num_address: Mapped[str | None] = mapped_column(Text)
+    diner_phone: Mapped[str | None] = mapped_column(String(50))
+    diner_lat: Mapped[float] = mapped_column(Float)
+    diner_lon: Mapped[float] = mapped_column(Float)
+    diner_open_time: Mapped[str | None] = mapped_column(Text)
+    diner_category_large: Mapped[str | None] = mapped_column(String(100))
+    diner_category_middle: Mapped[str | None] = mapped_column(String(100))
+    diner_category_small: Mapped[str | None] = mapped_column(String(100))
+    diner_category_detail: Mapped[str | None] = mapped_column(String(100))
+    diner_grade: Mapped[int | None] = mapped_column(Integer)
+    hidden_score: Mapped[float | None] = mapped_column(Float)
+    bayesian_score: Mapped[float | None] = mapped_column(Float)
 
     # Relationships
-    reviews = relationship("KakaoReview", back_populates="diner")
-    mappings = relationship("ItemKakaoMapping", back_populates="diner")
+    reviews: Mapped[list["KakaoReview"]] = relationship(  # noqa: F821
+        back_populates="diner"
+    )
+    mappings: Mapped[list["ItemKakaoMapping"]] = relationship(  # noqa: F821
+        back_populates="diner"
+    )
@@ -1,28 +1,37 @@
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base, ULIDMixin
+from .base import Base, CrawledTimestampMixin, ULIDMixin
 
 
-class KakaoReview(Base, ULIDMixin):
+class KakaoReview(Base, ULIDMixin, CrawledTimestampMixin):
     __tablename__ = "kakao_review"
 
-    diner_idx = Column(
-        Integer, ForeignKey("kakao_diner.diner_idx"), nullable=False, index=True
+    diner_idx: Mapped[int] = mapped_column(
+        Integer, ForeignKey("kakao_diner.diner_idx"), index=True
     )
-    reviewer_id = Column(
-        String, ForeignKey("kakao_reviewer.reviewer_id"), nullable=False, index=True
+    reviewer_id: Mapped[str] = mapped_column(
+        String, ForeignKey("kakao_reviewer.reviewer_id"), index=True
     )
-    review_id = Column(String, unique=True, nullable=False, index=True)
-    reviewer_review = Column(Text)
-    reviewer_review_date = Column(String(50))
-    reviewer_review_score = Column(Float, nullable=False)
-    crawled_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    review_id: Mapped[str] = mapped_column(String, unique=True, index=True)
+    reviewer_review: Mapped[str | None] = mapped_column(Text)
+    reviewer_review_date: Mapped[str | None] = mapped_column(String(50))
+    reviewer_review_score: Mapped[float] = mapped_column(Float)
+
+    __table_args__ = (
+        # 시간 범위 분석용 BRIN 인덱스. 마이그레이션(create_brin_indexes)이
+        # 만드는 인덱스와 같은 이름을 사용해 중복 생성을 피합니다.
+        Index(
+            "idx_kakao_review_crawled_brin",
+            "crawled_at",
+            postgresql_using="brin",
+        ),
     )
 
     # Relationships
-    diner = relationship("KakaoDiner", back_populates="reviews")
-    reviewer = relationship("KakaoReviewer", back_populates="reviews")
+    diner: Mapped["KakaoDiner"] = relationship(  # noqa: F821
+        back_populates="reviews"
+    )
+    reviewer: Mapped["KakaoReviewer"] = relationship(  # noqa: F821
+        back_populates="reviews"
+    )
@@ -1,23 +1,20 @@
-from sqlalchemy import Column, DateTime, Float, Integer, String
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base, ULIDMixin
+from .base import Base, CrawledTimestampMixin, ULIDMixin
 
 
-class KakaoReviewer(Base, ULIDMixin):
+class KakaoReviewer(Base, ULIDMixin, CrawledTimestampMixin):
     __tablename__ = "kakao_reviewer"
 
-    reviewer_id = Column(String, unique=True, nullable=False, index=True)
-    reviewer_user_name = Column(String(100))
-    reviewer_review_cnt = Column(Integer, nullable=False)
-    reviewer_avg = Column(Float, nullable=False)
-    badge_grade = Column(String(50), nullable=False)
-    badge_level = Column(Integer, nullable=False)
-    crawled_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
+    reviewer_id: Mapped[str] = mapped_column(String, unique=True, index=True)
+    reviewer_user_name: Mapped[str | None] = mapped_column(String(100))
+    reviewer_review_cnt: Mapped[int] = mapped_column(Integer)
+    reviewer_avg: Mapped[float] = mapped_column(Float)
+    badge_grade: Mapped[str] = mapped_column(String(50))
+    badge_level: Mapped[int] = mapped_column(Integer)
 
     # Relationships
-    reviews = relationship("KakaoReview", back_populates="reviewer")
+    reviews: Mapped[list["KakaoReview"]] = relationship(  # noqa: F821
+        back_populates="reviewer"
+    )
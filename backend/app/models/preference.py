@@ -1,28 +1,29 @@
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
-from .base import Base, ULIDMixin
+from .base import Base, TimestampMixin, ULIDMixin
 
 
-class UserPreference(Base, ULIDMixin):
+class UserPreference(Base, ULIDMixin, TimestampMixin):
     __tablename__ = "user_preferences"
 
-    firebase_uid = Column(
-        String(128), ForeignKey("users.firebase_uid"), nullable=False, index=True
-    )
-    category = Column(String(100), nullable=False)
-    preference_score = Column(Float, nullable=False, default=0.0)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    firebase_uid: Mapped[str] = mapped_column(
+        String(128), ForeignKey("users.firebase_uid"), index=True
     )
+    category: Mapped[str] = mapped_column(String(100))
+    preference_score: Mapped[float] = mapped_column(Float, default=0.0)
 
 
 class EmbeddingMetadata(Base, ULIDMixin):
     __tablename__ = "embeddings_metadata"
 
-    entity_type = Column(String(50), nullable=False)
-    entity_id = Column(String(26), nullable=False)
-    embedding_type = Column(String(50), nullable=False)
-    dimension = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    entity_type: Mapped[str] = mapped_column(String(50))
+    entity_id: Mapped[str] = mapped_column(String(26))
+    embedding_type: Mapped[str] = mapped_column(String(50))
+    dimension: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
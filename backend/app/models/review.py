@@ -1,24 +1,19 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base, ULIDMixin
+from .base import Base, TimestampMixin, ULIDMixin
 
 
-class Review(Base, ULIDMixin):
+class Review(Base, ULIDMixin, TimestampMixin):
     __tablename__ = "reviews"
 
-    firebase_uid = Column(
-        String(128), ForeignKey("users.firebase_uid"), nullable=False, index=True
-    )
-    item_id = Column(String(26), ForeignKey("items.id"), nullable=False, index=True)
-    score = Column(Integer, nullable=False)
-    review_text = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    firebase_uid: Mapped[str] = mapped_column(
+        String(128), ForeignKey("users.firebase_uid"), index=True
     )
+    item_id: Mapped[str] = mapped_column(String(26), ForeignKey("items.id"), index=True)
+    score: Mapped[int] = mapped_column(Integer)
+    review_text: Mapped[str | None] = mapped_column(Text)
 
     # Relationships
-    user = relationship("User", back_populates="reviews")
-    item = relationship("Item", back_populates="reviews")
+    user: Mapped["User"] = relationship(back_populates="reviews")  # noqa: F821
+    item: Mapped["Item"] = relationship(back_populates="reviews")  # noqa: F821
@@ -1,56 +1,61 @@
-from sqlalchemy import ARRAY, Boolean, Column, DateTime, Float, Integer, String
+from datetime import datetime
+
+from sqlalchemy import ARRAY, Boolean, DateTime, Float, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base, ULIDMixin
+from .base import Base, TimestampMixin, ULIDMixin
 
 
-class User(Base, ULIDMixin):
+class User(Base, ULIDMixin, TimestampMixin):
     __tablename__ = "users"
 
-    firebase_uid = Column(String(128), unique=True, nullable=False, index=True)
-    kakao_reviewer_id = Column(String(100), nullable=True)
-    name = Column(String(100), nullable=False)
-    email = Column(String(255))
-    display_name = Column(String(100))
-    photo_url = Column(String(500))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
+    firebase_uid: Mapped[str] = mapped_column(String(128), unique=True, index=True)
+    kakao_reviewer_id: Mapped[str | None] = mapped_column(String(100))
+    name: Mapped[str] = mapped_column(String(100))
+    email: Mapped[str | None] = mapped_column(String(255))
+    display_name: Mapped[str | None] = mapped_column(String(100))
+    photo_url: Mapped[str | None] = mapped_column(String(500))
 
     # Onboarding flags
-    is_personalization_enabled = Column(Boolean, default=False, server_default="false")
-    has_completed_onboarding = Column(Boolean, default=False, server_default="false")
-    onboarding_completed_at = Column(DateTime(timezone=True))
+    is_personalization_enabled: Mapped[bool | None] = mapped_column(
+        Boolean, default=False, server_default="false"
+    )
+    has_completed_onboarding: Mapped[bool | None] = mapped_column(
+        Boolean, default=False, server_default="false"
+    )
+    onboarding_completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
 
     # Location information
-    location = Column(String(255))
-    location_method = Column(String(50))
-    user_lat = Column(Float)
-    user_lon = Column(Float)
+    location: Mapped[str | None] = mapped_column(String(255))
+    location_method: Mapped[str | None] = mapped_column(String(50))
+    user_lat: Mapped[float | None] = mapped_column(Float)
+    user_lon: Mapped[float | None] = mapped_column(Float)
 
     # Basic information
-    birth_year = Column(Integer)
-    gender = Column(String(20))
-    dining_companions = Column(ARRAY(String))
+    birth_year: Mapped[int | None] = mapped_column(Integer)
+    gender: Mapped[str | None] = mapped_column(String(20))
+    dining_companions: Mapped[list[str] | None] = mapped_column(ARRAY(String))
 
     # Budget information
-    regular_budget = Column(String(50))
-    special_budget = Column(String(50))
+    regular_budget: Mapped[str | None] = mapped_column(String(50))
+    special_budget: Mapped[str | None] = mapped_column(String(50))
 
     # Taste preferences
-    spice_level = Column(Integer)
-    allergies = Column(String)
-    dislikes = Column(String)
+    spice_level: Mapped[int | None] = mapped_column(Integer)
+    allergies: Mapped[str | None] = mapped_column(String)
+    dislikes: Mapped[str | None] = mapped_column(String)
 
     # Food preferences
-    food_preferences_large = Column(ARRAY(String))
-    food_preferences_middle = Column(JSONB)
+    food_preferences_large: Mapped[list[str] | None] = mapped_column(ARRAY(String))
+    food_preferences_middle: Mapped[dict | None] = mapped_column(JSONB)
 
     # Restaurant ratings
-    restaurant_ratings = Column(JSONB)
+    restaurant_ratings: Mapped[dict | None] = mapped_column(JSONB)
 
     # Relationships
-    reviews = relationship("Review", back_populates="user")
+    reviews: Mapped[list["Review"]] = relationship(  # noqa: F821
+        back_populates="user"
+    )
@@ -2,16 +2,39 @@
 범용 파일 처리 클래스 - CSV, JSON, Excel 등 지원
 """
 
-import json
 import logging
-from io import BytesIO, StringIO
+from collections.abc import Iterator
+from io import BytesIO
 from typing import Any
 
+import orjson
 import pandas as pd
+from charset_normalizer import from_bytes
 
 logger = logging.getLogger(__name__)
 
 
+# 업로드 파이프라인에 실제로 들어오는 인코딩 후보
+# 전체 인코딩을 열어 두면 cp949 한국어 CSV가 big5hkscs 같은 다른 CJK
+# 인코딩으로 오판되므로 (문자 통계가 비슷해 디코딩은 성공하지만
+# mojibake가 됨) 후보를 이 집합으로 제한합니다.
+_ENCODING_CANDIDATES = ["utf_8", "cp949", "euc_kr"]
+
+
+def _detect_encoding(file_content: bytes) -> str:
+    """바이트 내용의 인코딩 감지
+
+    UTF-8 실패 → cp949 재시도처럼 인코딩 후보마다 전체 파일을 다시
+    디코딩하는 대신, charset-normalizer로 인코딩을 한 번에 판별해
+    디코딩이 정확히 한 번만 일어나게 합니다. 판별 실패 시에는 한국어
+    CSV에서 가장 흔한 cp949로 폴백합니다.
+    """
+    best = from_bytes(file_content, cp_isolation=_ENCODING_CANDIDATES).best()
+    if best is not None and best.encoding:
+        return best.encoding
+    return "cp949"
+
+
 class FileProcessor:
     """범용 파일 처리 클래스 - 다양한 포맷 지원"""
 
@@ -55,21 +78,28 @@ class FileProcessor:
         Returns:
             pandas DataFrame
         """
+        # pyarrow 엔진은 UTF-8이 아닌 입력에도 예외를 내지 않고 bytes
+        # dtype 컬럼을 돌려주므로 (cp949 업로드가 조용히 mojibake로
+        # 들어감), 파싱 전에 디코딩 가능 여부를 직접 검증합니다.
+        # 검증용 str은 바로 버려지고 파싱 자체는 바이트로 수행됩니다.
         try:
-            # 바이트를 문자열로 디코딩
-            text = file_content.decode(encoding)
-            # DataFrame으로 변환
-            df = pd.read_csv(StringIO(text))
-            df.reset_index(drop=True, inplace=True)
-            logger.info(f"CSV 파일 읽기 성공: {len(df)} 행")
-            return df
-        except UnicodeDecodeError:
-            # UTF-8 실패 시 다른 인코딩 시도
-            logger.warning(f"{encoding} 디코딩 실패, cp949로 재시도")
-            text = file_content.decode("cp949")
-            df = pd.read_csv(StringIO(text))
-            logger.info(f"CSV 파일 읽기 성공 (cp949): {len(df)} 행")
-            return df
+            if encoding.lower() in ("utf-8", "utf8"):
+                file_content.decode("utf-8")
+            else:
+                # pyarrow 엔진에는 UTF-8만 전달되도록 미리 재인코딩
+                file_content = file_content.decode(encoding).encode("utf-8")
+        except (UnicodeDecodeError, LookupError):
+            # 인코딩을 감지해 한 번만 재디코딩 (→ UTF-8 재인코딩)
+            detected = _detect_encoding(file_content)
+            logger.warning(f"{encoding} 디코딩 실패, {detected}로 재시도")
+            file_content = file_content.decode(detected).encode("utf-8")
+
+        # pyarrow 엔진: 멀티스레드 네이티브 파서가 바이트를 직접 읽으므로
+        # 파일 전체를 파이썬 문자열로 유지하는 단계가 없습니다
+        df = pd.read_csv(BytesIO(file_content), engine="pyarrow")
+        df.reset_index(drop=True, inplace=True)
+        logger.info(f"CSV 파일 읽기 성공: {len(df)} 행")
+        return df
 
     @staticmethod
     def read_json(
@@ -86,15 +116,15 @@ class FileProcessor:
             JSON 데이터 (딕셔너리 또는 리스트)
         """
         try:
-            text = file_content.decode(encoding)
-            data = json.loads(text)
+            # orjson은 UTF-8 바이트를 직접 파싱하므로 decode 단계가 없습니다
+            data = orjson.loads(file_content)
             logger.info(f"JSON 파일 읽기 성공: {type(data).__name__}")
             return data
-        except UnicodeDecodeError:
-            logger.warning(f"{encoding} 디코딩 실패, cp949로 재시도")
-            text = file_content.decode("cp949")
-            data = json.loads(text)
-            logger.info(f"JSON 파일 읽기 성공 (cp949): {type(data).__name__}")
+        except orjson.JSONDecodeError:
+            detected = _detect_encoding(file_content)
+            logger.warning(f"{encoding} 디코딩 실패, {detected}로 재시도")
+            data = orjson.loads(file_content.decode(detected))
+            logger.info(f"JSON 파일 읽기 성공 ({detected}): {type(data).__name__}")
             return data
 
     @staticmethod
@@ -146,26 +176,34 @@ class FileProcessor:
         Returns:
             정제된 DataFrame
         """
-        # NaN을 None으로 변환
-        df = df.where(pd.notnull(df), None)
+        # NaN을 None으로 변환 (object 컬럼만)
+        # 전체 프레임에 where를 걸면 프레임 크기의 불리언 마스크를 만들고
+        # 숫자 컬럼까지 object dtype으로 업캐스트한 새 프레임을 생성합니다.
+        # 숫자 컬럼의 NaN은 이후 타입 변환기가 pd.notnull로 직접 처리하므로
+        # 문자열(object) 컬럼만 결측값을 None으로 치환합니다.
+        for column in df.select_dtypes(include="object").columns:
+            df[column] = df[column].where(df[column].notna(), None)
         return df
 
     @staticmethod
-    def batch_data(df: pd.DataFrame, batch_size: int = 1000) -> list[pd.DataFrame]:
+    def batch_data(df: pd.DataFrame, batch_size: int = 1000) -> Iterator[pd.DataFrame]:
         """
-        DataFrame을 배치로 분할
+        DataFrame을 배치로 분할 (지연 생성)
+
+        배치 리스트를 미리 전부 만들어 두는 대신 요청 시점에 슬라이스를
+        하나씩 내보냅니다. 소비 측이 배치 단위로 DB에 적재하므로 동시에
+        살아 있는 배치는 항상 하나뿐이고, 전체 배치 목록을 메모리에
+        유지하지 않습니다.
 
         Args:
             df: 분할할 DataFrame
             batch_size: 배치 크기
 
-        Returns:
-            DataFrame 배치 리스트
+        Yields:
+            DataFrame 배치
         """
-        batches = []
         for i in range(0, len(df), batch_size):
-            batches.append(df.iloc[i : i + batch_size])
-        return batches
+            yield df.iloc[i : i + batch_size]
 
     @staticmethod
     def detect_file_format(filename: str) -> str:
@@ -3,11 +3,31 @@ Kakao 데이터 처리 전용 클래스 - 설정 기반 처리
 """
 
 import ast
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
-from app.utils.ulid_utils import generate_ulid
+from app.utils.ulid_utils import generate_ulid, generate_ulid_batch
+
+
+class _FieldPlan(NamedTuple):
+    """컴파일된 필드 변환 계획 (문자열 키를 변환기로 사전 해석)"""
+
+    name: str
+    data_type: str
+    vectorized: Callable | None
+    converter: Callable | None
+
+
+class _CompiledConfig(NamedTuple):
+    """파일 타입별 설정을 사전 해석한 불변 디스크립터"""
+
+    required_columns: tuple[str, ...]
+    field_plans: tuple[_FieldPlan, ...]
+    sql_fields: tuple[str, ...] | None
+    query_name: str | None
 
 
 class KakaoDataProcessor:
@@ -34,7 +54,7 @@ class KakaoDataProcessor:
                 ("diner_tag", "list_to_comma"),
                 ("diner_menu_name", "list_to_comma"),
                 ("diner_menu_price", "list_to_comma"),
-                ("diner_review_cnt", "str"),
+                ("diner_review_cnt", "int_default_zero"),
                 ("diner_review_avg", "float_nullable"),
                 ("diner_blog_review_cnt", "float_nullable"),
                 ("diner_review_tags", "list_to_comma"),
@@ -99,10 +119,10 @@ class KakaoDataProcessor:
             "required_columns": ["diner_idx", "diner_menu_name", "diner_menu_price"],
             "field_mappings": [
                 ("diner_menu_name", "str"),
-                ("diner_idx", "int"),
                 ("diner_menu_price", "str"),
+                ("diner_idx", "int"),
             ],
-            "sql_fields": ["diner_menu_name", "diner_idx", "diner_menu_price"],
+            "sql_fields": ["diner_menu_name", "diner_menu_price", "diner_idx"],
             "query_name": "UPDATE_KAKAO_DINER_MENU",
         },
         "diner_reviews": {
@@ -226,26 +246,43 @@ class KakaoDataProcessor:
         },
     }
 
+    # 리스트 문자열 정제용 변환 테이블 (대괄호/따옴표 제거)
+    _LIST_STRIP_TABLE = str.maketrans("", "", "[]'\"")
+
     # 데이터 타입 변환 함수들
     @staticmethod
-    def convert_list_string_to_comma_separated(x):
+    def convert_list_string_to_comma_separated(x, _empties=frozenset(("", "nan"))):
         """
         리스트 형식의 문자열을 쉼표로 구분된 문자열로 변환
 
         예: "['제로페이', '모임,회식']" -> "제로페이,모임,회식"
         """
-        if pd.isnull(x) or x is None:
+        # 결측 검사 인라인: pd.isnull은 pandas NA 디스패치를 거치므로
+        # None/NaN/pd.NA를 직접 검사합니다 (NaN은 자기 자신과 다름)
+        if x is None or x is pd.NA or (isinstance(x, float) and x != x):
             return None
 
         # 문자열 정제
-        x_str = str(x).strip()
+        x_str = (x if isinstance(x, str) else str(x)).strip()
 
-        if not x_str or x_str == "" or x_str == "nan":
+        if x_str in _empties:
             return None
 
         try:
             # Python 리스트로 파싱 시도
             if x_str.startswith("[") and x_str.endswith("]"):
+                if "[" not in x_str[1:-1]:
+                    # 평탄한 리스트 문자열(실데이터의 거의 전부)은 AST를
+                    # 만들지 않고 C 레벨 translate/split로 정제합니다.
+                    # ast.literal_eval은 중첩 리스트일 때만 사용합니다.
+                    parts = (
+                        part.strip()
+                        for part in x_str.translate(
+                            KakaoDataProcessor._LIST_STRIP_TABLE
+                        ).split(",")
+                    )
+                    return ",".join(part for part in parts if part)
+
                 parsed = ast.literal_eval(x_str)
                 if isinstance(parsed, list):
                     return ",".join([str(item).strip() for item in parsed if item])
@@ -296,36 +333,304 @@ class KakaoDataProcessor:
         "ulid": lambda x: generate_ulid(),  # ULID는 항상 새로 생성 (입력값 무시)
     }
 
+    # 컬럼 단위 벡터화 변환기
+    # TYPE_CONVERTERS와 의미는 같지만 셀 단위 람다 대신 Series 전체를
+    # 한 번에 변환합니다. process_file가 행×필드마다 파이썬 함수를
+    # 호출하는 대신 필드당 한 번씩만 호출하게 됩니다.
+
+    @staticmethod
+    def _mask_to_values(values: list, mask, default=None) -> list:
+        """마스크가 False인 위치를 default로 치환한 리스트 반환"""
+        return [value if keep else default for value, keep in zip(values, mask)]
+
+    @classmethod
+    def _vectorize_str(cls, s: pd.Series) -> list:
+        """str 변환: 결측값은 None"""
+        mask = s.notna().to_numpy()
+        return cls._mask_to_values(s.astype(str).tolist(), mask)
+
+    @classmethod
+    def _vectorize_str_optional(cls, s: pd.Series) -> list:
+        """str 변환: 결측값/공백 문자열은 None (원본 값은 strip하지 않음)"""
+        str_s = s.astype(str)
+        mask = (s.notna() & (str_s.str.strip() != "")).to_numpy()
+        return cls._mask_to_values(str_s.tolist(), mask)
+
+    @classmethod
+    def _vectorize_date_str(cls, s: pd.Series) -> list:
+        """날짜 문자열 변환: strip 후 결측값/빈 문자열은 None"""
+        stripped = s.astype(str).str.strip()
+        mask = (s.notna() & (stripped != "")).to_numpy()
+        return cls._mask_to_values(stripped.tolist(), mask)
+
+    @classmethod
+    def _validate_integer_range_column(cls, numeric: pd.Series) -> None:
+        """컬럼 전체의 INTEGER 범위 검증 (NumPy 비교 한 번)
+
+        값마다 파이썬 비교 두 번을 수행하는 대신 컬럼 단위 벡터 비교로
+        검증합니다. 결측값(NaN)은 비교 결과가 False라 자연히 통과합니다.
+        """
+        out_of_range = (numeric < cls.INTEGER_MIN) | (numeric > cls.INTEGER_MAX)
+        if out_of_range.any():
+            first = int(np.argmax(out_of_range.to_numpy()))
+            raise ValueError(
+                f"정수 값이 INTEGER 범위를 초과합니다: "
+                f"{numeric.iloc[first]} (범위: {cls.INTEGER_MIN} ~ {cls.INTEGER_MAX})"
+            )
+
+    @classmethod
+    def _vectorize_int(cls, s: pd.Series, default=None) -> list:
+        """int 변환: 결측값은 default (기본 None)"""
+        numeric = pd.to_numeric(s, errors="raise")
+        cls._validate_integer_range_column(numeric)
+        mask = numeric.notna().to_numpy()
+        if mask.all():
+            if pd.api.types.is_integer_dtype(numeric):
+                # 정수 dtype(Int32 포함)은 그대로 파이썬 int 리스트로
+                return numeric.tolist()
+            return numeric.astype("int64").tolist()
+        # float → int64 캐스팅은 int()와 동일하게 0 방향으로 절사
+        return cls._mask_to_values(
+            numeric.fillna(0).astype("int64").tolist(), mask, default
+        )
+
+    @classmethod
+    def _vectorize_float(cls, s: pd.Series, default=None) -> list:
+        """float 변환: 결측값은 default (기본 None)"""
+        numeric = pd.to_numeric(s, errors="raise")
+        mask = numeric.notna().to_numpy()
+        return cls._mask_to_values(numeric.astype("float64").tolist(), mask, default)
+
+    @classmethod
+    def _vectorize_list_to_comma(cls, s: pd.Series) -> list:
+        """리스트 문자열 변환 (컬럼 단위)
+
+        평탄한 리스트 문자열은 Series.str 연산(translate + 정규식 치환)
+        만으로 정제하고, 중첩 리스트가 섞인 행만 셀 단위 변환기로
+        처리합니다. 정규식은 pandas가 한 번만 컴파일해 재사용합니다.
+        """
+        str_s = s.astype(str).str.strip()
+        valid = s.notna() & (str_s != "") & (str_s != "nan")
+
+        bracketed = valid & str_s.str.startswith("[") & str_s.str.endswith("]")
+        nested = bracketed & str_s.str.slice(1, -1).str.contains("[", regex=False)
+        flat = (bracketed & ~nested).to_numpy()
+        nested = nested.to_numpy()
+        valid = valid.to_numpy()
+
+        # 평탄한 리스트: 대괄호/따옴표 제거 후 쉼표 주변 공백과 빈 항목 정리
+        cleaned = (
+            str_s.str.translate(cls._LIST_STRIP_TABLE)
+            .str.replace(r"\s*,\s*", ",", regex=True)
+            .str.replace(r",{2,}", ",", regex=True)
+            .str.strip()
+            .str.strip(",")
+        ).tolist()
+
+        convert = cls.convert_list_string_to_comma_separated
+        values = str_s.tolist()
+        out = []
+        for i, value in enumerate(values):
+            if not valid[i]:
+                out.append(None)
+            elif flat[i]:
+                out.append(cleaned[i])
+            elif nested[i]:
+                # 중첩 리스트는 드물어 셀 단위 파싱으로 폴백
+                out.append(convert(value))
+            else:
+                # 이미 쉼표로 구분된 문자열인 경우
+                out.append(value)
+        return out
+
+    VECTORIZED_CONVERTERS = {
+        "str": lambda s: KakaoDataProcessor._vectorize_str(s),
+        "str_optional": lambda s: KakaoDataProcessor._vectorize_str_optional(s),
+        "int": lambda s: KakaoDataProcessor._vectorize_int(s),
+        "int_nullable": lambda s: KakaoDataProcessor._vectorize_int(s),
+        "float": lambda s: KakaoDataProcessor._vectorize_float(s),
+        "float_nullable": lambda s: KakaoDataProcessor._vectorize_float(s),
+        "int_default_zero": lambda s: KakaoDataProcessor._vectorize_int(s, default=0),
+        "float_default_zero": lambda s: KakaoDataProcessor._vectorize_float(
+            s, default=0.0
+        ),
+        "date_str": lambda s: KakaoDataProcessor._vectorize_date_str(s),
+        "list_to_comma": lambda s: KakaoDataProcessor._vectorize_list_to_comma(s),
+    }
+
+    # 파일 타입별 설정을 컴파일한 디스크립터 캐시
+    # PROCESSING_CONFIG의 dict 인덱싱과 변환기 문자열 키 해석을 호출마다
+    # 반복하지 않도록 최초 접근 시 한 번만 해석해 둡니다.
+    _COMPILED: dict[str, _CompiledConfig] = {}
+
+    @classmethod
+    def _get_compiled(cls, file_type: str) -> _CompiledConfig:
+        """파일 타입의 컴파일된 설정 반환 (최초 접근 시 생성)"""
+        compiled = cls._COMPILED.get(file_type)
+        if compiled is None:
+            if file_type not in cls.PROCESSING_CONFIG:
+                raise ValueError(f"지원하지 않는 파일 타입: {file_type}")
+            compiled = cls._compile_config(file_type)
+            cls._COMPILED[file_type] = compiled
+        return compiled
+
+    @classmethod
+    def _compile_config(cls, file_type: str) -> _CompiledConfig:
+        """설정 dict를 불변 디스크립터로 변환 (변환기 사전 해석 포함)"""
+        config = cls.PROCESSING_CONFIG[file_type]
+
+        field_plans = []
+        for field_name, data_type in config["field_mappings"]:
+            vectorized = cls.VECTORIZED_CONVERTERS.get(data_type)
+            converter = None
+            if vectorized is None and data_type != "ulid":
+                converter = cls.TYPE_CONVERTERS.get(data_type)
+                if not converter:
+                    raise ValueError(f"지원하지 않는 데이터 타입: {data_type}")
+            field_plans.append(_FieldPlan(field_name, data_type, vectorized, converter))
+
+        sql_fields = config.get("sql_fields")
+        return _CompiledConfig(
+            required_columns=tuple(config.get("required_columns", [])),
+            field_plans=tuple(field_plans),
+            sql_fields=tuple(sql_fields) if sql_fields is not None else None,
+            query_name=config.get("query_name"),
+        )
+
     @classmethod
     def get_required_columns(cls, file_type: str) -> list[str]:
         """파일 타입별 필수 컬럼 반환"""
-        if file_type not in cls.PROCESSING_CONFIG:
-            raise ValueError(f"지원하지 않는 파일 타입: {file_type}")
-        return cls.PROCESSING_CONFIG[file_type]["required_columns"]
+        return list(cls._get_compiled(file_type).required_columns)
 
     @classmethod
     def get_sql_fields(cls, file_type: str) -> list[str]:
         """파일 타입별 SQL 필드 반환"""
-        if file_type not in cls.PROCESSING_CONFIG:
-            raise ValueError(f"지원하지 않는 파일 타입: {file_type}")
-        return cls.PROCESSING_CONFIG[file_type]["sql_fields"]
+        return list(cls._get_compiled(file_type).sql_fields or ())
 
     @classmethod
     def get_query_name(cls, file_type: str) -> str:
         """파일 타입별 쿼리 이름 반환"""
-        if file_type not in cls.PROCESSING_CONFIG:
-            raise ValueError(f"지원하지 않는 파일 타입: {file_type}")
-        return cls.PROCESSING_CONFIG[file_type]["query_name"]
+        return cls._get_compiled(file_type).query_name
+
+    # 파일 타입별 dtype 축소 힌트
+    # 업로드된 CSV는 pandas 기본 dtype(object 문자열, int64)으로 들어오므로
+    # 텍스트 컬럼은 pyarrow 기반 string으로, 작은 정수 컬럼은 Int32로
+    # 축소해 전체 프레임의 메모리 사용량을 줄입니다. DB에 저장되는 값이
+    # 달라질 수 있는 float32 축소(평점/좌표)는 적용하지 않습니다.
+    _DTYPE_HINTS = {
+        "diner_basic": {
+            "diner_idx": "Int32",
+            "diner_name": "string[pyarrow]",
+            "diner_tag": "string[pyarrow]",
+            "diner_menu_name": "string[pyarrow]",
+            "diner_menu_price": "string[pyarrow]",
+            "diner_review_cnt": "Int32",
+            "diner_review_tags": "string[pyarrow]",
+            "diner_road_address": "string[pyarrow]",
+            "diner_num_address": "string[pyarrow]",
+            "diner_phone": "string[pyarrow]",
+            "diner_open_time": "string[pyarrow]",
+        },
+        "diner_categories": {
+            "diner_idx": "Int32",
+            "diner_category_large": "string[pyarrow]",
+            "diner_category_middle": "string[pyarrow]",
+            "diner_category_small": "string[pyarrow]",
+            "diner_category_detail": "string[pyarrow]",
+        },
+        "diner_menus": {
+            "diner_idx": "Int32",
+            "diner_menu_name": "string[pyarrow]",
+            "diner_menu_price": "string[pyarrow]",
+        },
+        "diner_reviews": {
+            "diner_idx": "Int32",
+        },
+        "diner_tags": {
+            "diner_idx": "Int32",
+            "diner_tag": "string[pyarrow]",
+            "diner_review_tags": "string[pyarrow]",
+        },
+        "reviewers": {
+            "reviewer_review_cnt": "Int32",
+            "reviewer_user_name": "string[pyarrow]",
+            "badge_grade": "string[pyarrow]",
+            "badge_level": "Int32",
+        },
+        "reviews": {
+            "diner_idx": "Int32",
+            "reviewer_review": "string[pyarrow]",
+            "reviewer_review_date": "string[pyarrow]",
+        },
+        "diner_grade_bayesian": {
+            "diner_idx": "Int32",
+            "diner_grade": "Int32",
+        },
+        "diner_hidden_score": {
+            "diner_idx": "Int32",
+        },
+    }
+
+    @classmethod
+    def shrink_dtypes(cls, file_type: str, df: pd.DataFrame) -> pd.DataFrame:
+        """파일 타입별 힌트에 따라 DataFrame dtype 축소
+
+        변환할 수 없는 값이 섞인 컬럼은 원 dtype을 유지합니다
+        (축소는 선택적 최적화이므로 실패해도 처리는 계속됩니다).
+        """
+        hints = cls._DTYPE_HINTS.get(file_type)
+        if not hints:
+            return df
+        for column, dtype in hints.items():
+            if column not in df.columns:
+                continue
+            try:
+                df[column] = df[column].astype(dtype, copy=False)
+            except (ValueError, TypeError):
+                continue
+        return df
+
+    # UPDATE 쿼리 구성 정보 (file_type → SET 절 갱신 필드, WHERE는 diner_idx)
+    _UPDATE_FIELDS = {
+        "diner_categories": (
+            "diner_category_large",
+            "diner_category_middle",
+            "diner_category_small",
+            "diner_category_detail",
+        ),
+        "diner_menus": ("diner_menu_name", "diner_menu_price"),
+        "diner_reviews": (
+            "diner_review_cnt",
+            "diner_review_avg",
+            "diner_blog_review_cnt",
+        ),
+        "diner_tags": ("diner_tag", "diner_review_tags"),
+    }
+
+    # 생성된 SQL 문자열 캐시 ((file_type, operation) → SQL)
+    # 쿼리는 설정에서 결정되는 정적 문자열이므로 배치마다 join/f-string
+    # 조립을 반복하지 않고 최초 1회만 생성합니다.
+    _SQL_CACHE: dict[tuple[str, str], str] = {}
 
     @classmethod
     def generate_sql_query(cls, file_type: str, operation: str = "INSERT") -> str:
         """
-        설정에 따라 SQL 쿼리 자동 생성
+        설정에 따라 SQL 쿼리 반환 (최초 생성 후 캐시)
 
         Args:
             file_type: 파일 타입
             operation: SQL 작업 타입 (INSERT, UPDATE)
         """
+        key = (file_type, operation)
+        cached = cls._SQL_CACHE.get(key)
+        if cached is None:
+            cached = cls._build_sql_query(file_type, operation)
+            cls._SQL_CACHE[key] = cached
+        return cached
+
+    @classmethod
+    def _build_sql_query(cls, file_type: str, operation: str) -> str:
+        """설정에 따라 SQL 쿼리 문자열 생성"""
         if file_type not in cls.PROCESSING_CONFIG:
             raise ValueError(f"지원하지 않는 파일 타입: {file_type}")
 
@@ -357,32 +662,13 @@ class KakaoDataProcessor:
                 return cls.generate_sql_query(file_type, "UPDATE")
 
         elif operation == "UPDATE":
-            # UPDATE 쿼리 생성
-            if file_type == "diner_categories":
-                update_fields = [
-                    "diner_category_large",
-                    "diner_category_middle",
-                    "diner_category_small",
-                    "diner_category_detail",
-                ]
-                where_field = "diner_idx"
-            elif file_type == "diner_menus":
-                update_fields = ["diner_menu_name", "diner_menu_price"]
-                where_field = "diner_idx"
-            elif file_type == "diner_reviews":
-                update_fields = [
-                    "diner_review_cnt",
-                    "diner_review_avg",
-                    "diner_blog_review_cnt",
-                ]
-                where_field = "diner_idx"
-            elif file_type == "diner_tags":
-                update_fields = ["diner_tag", "diner_review_tags"]
-                where_field = "diner_idx"
-            else:
+            # UPDATE 쿼리 생성 (_UPDATE_FIELDS에서 갱신 필드 조회)
+            update_fields = cls._UPDATE_FIELDS.get(file_type)
+            if update_fields is None:
                 raise ValueError(f"지원하지 않는 UPDATE 타입: {file_type}")
+            where_field = "diner_idx"
 
-            set_clause = ", ".join([f"{field} = %s" for field in update_fields])
+            set_clause = ", ".join(f"{field} = %s" for field in update_fields)
 
             return f"""
             UPDATE kakao_diner SET
@@ -394,10 +680,14 @@ class KakaoDataProcessor:
         else:
             raise ValueError(f"지원하지 않는 작업 타입: {operation}")
 
+    # 설정 일관성 검증 결과 캐시 (file_type → 검증 결과)
+    # PROCESSING_CONFIG는 거의 변하지 않으므로 타입당 한 번만 검증합니다.
+    _VALIDATED: dict[str, dict] = {}
+
     @classmethod
     def validate_config_consistency(cls, file_type: str) -> dict[str, bool]:
         """
-        설정의 일관성 검증
+        설정의 일관성 검증 (최초 1회 수행 후 캐시)
 
         Args:
             file_type: 파일 타입
@@ -405,6 +695,17 @@ class KakaoDataProcessor:
         Returns:
             검증 결과 딕셔너리
         """
+        cached = cls._VALIDATED.get(file_type)
+        if cached is not None:
+            return cached
+        result = cls._validate_config_consistency(file_type)
+        if file_type in cls.PROCESSING_CONFIG:
+            cls._VALIDATED[file_type] = result
+        return result
+
+    @classmethod
+    def _validate_config_consistency(cls, file_type: str) -> dict[str, bool]:
+        """설정 일관성 검증 수행"""
         if file_type not in cls.PROCESSING_CONFIG:
             return {"valid": False, "error": "지원하지 않는 파일 타입"}
 
@@ -436,7 +737,11 @@ class KakaoDataProcessor:
     @classmethod
     def process_file(cls, file_type: str, df: pd.DataFrame) -> list[tuple]:
         """
-        설정 기반 파일 처리
+        설정 기반 파일 처리 (컬럼 단위 벡터화)
+
+        df.iterrows()로 행마다 변환기를 호출하는 대신 필드(컬럼)별로
+        Series 전체를 한 번에 변환하고 마지막에 zip으로 행 튜플을
+        조립합니다. 파이썬 레벨 호출이 행수×필드수에서 필드수로 줄어듭니다.
 
         Args:
             file_type: 파일 타입 (diner_basic, diner_categories 등)
@@ -445,69 +750,73 @@ class KakaoDataProcessor:
         Returns:
             처리된 데이터 튜플 리스트
         """
-        if file_type not in cls.PROCESSING_CONFIG:
-            raise ValueError(f"지원하지 않는 파일 타입: {file_type}")
+        compiled = cls._get_compiled(file_type)
+
+        # 필수 컬럼 검증은 DataFrame당 한 번만 수행하고, 누락분을 한꺼번에
+        # 보고합니다 (컬럼마다 따로 실패하면 재시도를 반복해야 하므로).
+        missing = [c for c in compiled.required_columns if c not in df.columns]
+        if missing:
+            raise ValueError(f"필수 컬럼 {missing}이(가) DataFrame에 없습니다")
+
+        row_cnt = len(df)
+        columns: list[list] = []
+        for plan in compiled.field_plans:
+            # ulid 타입은 필드가 없어도 값 생성 (입력값 무시, 일괄 생성)
+            if plan.data_type == "ulid":
+                columns.append(generate_ulid_batch(row_cnt))
+                continue
+
+            # 선택 필드가 CSV에 없으면 None 채움 (필수 컬럼은 위에서 검증됨)
+            if plan.name not in df.columns:
+                columns.append([None] * row_cnt)
+                continue
+
+            series = df[plan.name]
+            try:
+                if plan.vectorized is not None:
+                    columns.append(plan.vectorized(series))
+                else:
+                    # add_custom_converter로 등록된 타입은 셀 단위 폴백
+                    columns.append([plan.converter(value) for value in series.tolist()])
+            except (ValueError, OverflowError, TypeError) as e:
+                raise ValueError(
+                    f"필드 '{plan.name}' ({plan.data_type}) 처리 실패: {str(e)}"
+                ) from e
+
+        return list(zip(*columns))
 
-        config = cls.PROCESSING_CONFIG[file_type]
-        field_mappings = config["field_mappings"]
-        required_columns = config.get("required_columns", [])
-
-        data = []
-        for row_idx, (_, row) in enumerate(df.iterrows()):
-            processed_row = []
-
-            for field_name, data_type in field_mappings:
-                converter = cls.TYPE_CONVERTERS.get(data_type)
-                if not converter:
-                    raise ValueError(f"지원하지 않는 데이터 타입: {data_type}")
+    @classmethod
+    def process_file_chunked(
+        cls, file_type: str, filepath_or_buffer, chunksize: int = 50_000
+    ) -> Iterator[list[tuple]]:
+        """
+        대용량 CSV를 청크 단위로 읽어 처리 결과를 순차 생성
 
-                # ulid 타입은 필드가 없어도 변환기 호출 (항상 새로 생성)
-                if data_type == "ulid":
-                    try:
-                        processed_value = converter(None)  # ulid는 입력값 무시
-                        processed_row.append(processed_value)
-                        continue
-                    except Exception as e:
-                        original_row_idx = (
-                            df.index[row_idx]
-                            if hasattr(df.index, "__getitem__")
-                            else row_idx
-                        )
-                        raise ValueError(
-                            f"행 {original_row_idx}, 필드 '{field_name}' (ULID 생성) 처리 실패: {str(e)}"
-                        ) from e
-
-                # 필수 컬럼이 아닌 경우, CSV에 없으면 None 반환
-                if field_name not in row:
-                    if field_name in required_columns:
-                        raise ValueError(
-                            f"필수 컬럼 '{field_name}'이 DataFrame에 없습니다"
-                        )
-                    else:
-                        # 선택 필드인 경우 None 반환
-                        processed_row.append(None)
-                        continue
-
-                try:
-                    processed_value = converter(row[field_name])
-                    # INTEGER 타입인 경우 범위 검증 (BigInteger로 변경했지만 혹시 모를 경우 대비)
-                    # 실제로는 모델이 BigInteger이므로 검증은 선택사항
-                    processed_row.append(processed_value)
-                except (ValueError, OverflowError) as e:
-                    # 원본 행 인덱스 포함하여 오류 메시지 개선
-                    original_row_idx = (
-                        df.index[row_idx]
-                        if hasattr(df.index, "__getitem__")
-                        else row_idx
-                    )
-                    raise ValueError(
-                        f"행 {original_row_idx}, 필드 '{field_name}' 처리 실패: {str(e)}\n"
-                        f"원본 값: {row[field_name]}"
-                    ) from e
+        전체 파일을 DataFrame 하나로 올리지 않고 chunksize 행씩 읽어
+        process_file 결과(튜플 배치)를 yield하므로, 동시에 메모리에
+        존재하는 작업 집합이 청크 하나로 제한됩니다. field_mappings에
+        없는 컬럼은 파싱 자체를 건너뜁니다.
 
-            data.append(tuple(processed_row))
+        Args:
+            file_type: 파일 타입 (diner_basic, reviews 등)
+            filepath_or_buffer: CSV 파일 경로 또는 파일 객체
+            chunksize: 청크당 행 수
 
-        return data
+        Yields:
+            처리된 데이터 튜플 리스트 (executemany에 바로 사용 가능)
+        """
+        compiled = cls._get_compiled(file_type)
+        wanted = {
+            plan.name for plan in compiled.field_plans if plan.data_type != "ulid"
+        }
+        reader = pd.read_csv(
+            filepath_or_buffer,
+            usecols=lambda column: column in wanted,
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            chunk = cls.shrink_dtypes(file_type, chunk)
+            yield cls.process_file(file_type, chunk)
 
     # 기존 메서드들을 새로운 구조로 래핑 (하위 호환성 유지)
     @classmethod
@@ -554,6 +863,11 @@ class KakaoDataProcessor:
             "required_columns": required_columns,
             "field_mappings": field_mappings,
         }
+        # 기존 컴파일/검증/SQL 캐시 무효화 (다음 접근 시 재계산)
+        cls._COMPILED.pop(file_type, None)
+        cls._VALIDATED.pop(file_type, None)
+        cls._SQL_CACHE.pop((file_type, "INSERT"), None)
+        cls._SQL_CACHE.pop((file_type, "UPDATE"), None)
 
     @classmethod
     def add_custom_converter(cls, type_name: str, converter_func: Callable) -> None:
@@ -565,3 +879,5 @@ class KakaoDataProcessor:
             converter_func: 변환 함수
         """
         cls.TYPE_CONVERTERS[type_name] = converter_func
+        # 변환기 해석 결과가 달라질 수 있으므로 컴파일 캐시 전체 무효화
+        cls._COMPILED.clear()
@@ -0,0 +1,38 @@
+# 스키마 패키지
+#
+# pydantic 모델은 클래스 정의 시점에 pydantic-core 검증기를 빌드하므로,
+# 여기서 하위 모듈을 전부 재노출하면 패키지 import만으로 모든 스키마가
+# 빌드됩니다. PEP 562 __getattr__로 하위 모듈을 지연 로딩해, 실제로
+# 참조되는 스키마만 그 시점에 빌드되도록 합니다. 각 라우터가 쓰는
+# `from app.schemas.<module> import ...` 형태의 직접 import는 기존과
+# 동일하게 동작합니다.
+
+import importlib
+
+_SUBMODULES = frozenset(
+    {
+        "activity_log",
+        "item",
+        "item_kakao_mapping",
+        "kakao_diner",
+        "kakao_review",
+        "kakao_reviewer",
+        "recommendation",
+        "redis_schemas",
+        "review",
+        "token",
+        "types",
+        "user",
+        "vector_db",
+    }
+)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(_SUBMODULES)
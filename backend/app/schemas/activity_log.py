@@ -1,47 +1,50 @@
-from typing import Any, Optional
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ActivityLogCreate(BaseModel):
     """활동 로그 생성 스키마"""
 
+    # 이벤트마다 생성되는 모델: frozen으로 고정해 변경 훅/재검증을 생략
+    model_config = ConfigDict(frozen=True)
+
     # User identification
     firebase_uid: str = Field(..., max_length=128)
-    session_id: str = Field(..., max_length=50)
+    session_id: str = Field(..., max_length=36)
 
     # Event information
-    event_type: str = Field(..., max_length=50)
-    page: Optional[str] = Field(None, max_length=50)
+    event_type: str = Field(..., max_length=30)
+    page: str | None = Field(None, max_length=30)
 
     # Location related
-    location_query: Optional[str] = Field(None, max_length=255)
-    location_address: Optional[str] = Field(None, max_length=255)
-    location_lat: Optional[float] = None
-    location_lon: Optional[float] = None
-    location_method: Optional[str] = Field(None, max_length=50)
+    location_query: str | None = Field(None, max_length=255)
+    location_address: str | None = Field(None, max_length=255)
+    location_lat: float | None = None
+    location_lon: float | None = None
+    location_method: str | None = Field(None, max_length=50)
 
     # Search filter related
-    search_radius_km: Optional[float] = None
-    selected_large_categories: Optional[list[str]] = None
-    selected_middle_categories: Optional[list[str]] = None
-    sort_by: Optional[str] = Field(None, max_length=50)
-    period: Optional[str] = Field(None, max_length=20)
+    search_radius_km: float | None = None
+    selected_large_categories: list[str] | None = None
+    selected_middle_categories: list[str] | None = None
+    sort_by: str | None = Field(None, max_length=30)
+    period: str | None = Field(None, max_length=20)
 
     # Ranking page related
-    selected_city: Optional[str] = Field(None, max_length=100)
-    selected_region: Optional[str] = Field(None, max_length=100)
-    selected_grades: Optional[list[str]] = None
+    selected_city: str | None = Field(None, max_length=100)
+    selected_region: str | None = Field(None, max_length=100)
+    selected_grades: list[str] | None = None
 
     # Click/Interaction related
-    clicked_diner_idx: Optional[str] = Field(None, max_length=50)
-    clicked_diner_name: Optional[str] = Field(None, max_length=255)
-    display_position: Optional[int] = None
+    clicked_diner_idx: str | None = Field(None, max_length=50)
+    clicked_diner_name: str | None = Field(None, max_length=255)
+    display_position: int | None = None
 
     # Additional metadata
-    additional_data: Optional[dict[str, Any]] = None
-    user_agent: Optional[str] = None
-    ip_address: Optional[str] = Field(None, max_length=45)
+    additional_data: dict[str, Any] | None = None
+    user_agent: str | None = None
+    ip_address: str | None = Field(None, max_length=45)
 
 
 class ActivityLogResponse(BaseModel):
@@ -53,45 +56,45 @@ class ActivityLogResponse(BaseModel):
     session_id: str
     event_type: str
     event_timestamp: str
-    page: Optional[str] = None
+    page: str | None = None
 
     # Location related
-    location_query: Optional[str] = None
-    location_address: Optional[str] = None
-    location_lat: Optional[float] = None
-    location_lon: Optional[float] = None
-    location_method: Optional[str] = None
+    location_query: str | None = None
+    location_address: str | None = None
+    location_lat: float | None = None
+    location_lon: float | None = None
+    location_method: str | None = None
 
     # Search filter related
-    search_radius_km: Optional[float] = None
-    selected_large_categories: Optional[list[str]] = None
-    selected_middle_categories: Optional[list[str]] = None
-    sort_by: Optional[str] = None
-    period: Optional[str] = None
+    search_radius_km: float | None = None
+    selected_large_categories: list[str] | None = None
+    selected_middle_categories: list[str] | None = None
+    sort_by: str | None = None
+    period: str | None = None
 
     # Ranking page related
-    selected_city: Optional[str] = None
-    selected_region: Optional[str] = None
-    selected_grades: Optional[list[str]] = None
+    selected_city: str | None = None
+    selected_region: str | None = None
+    selected_grades: list[str] | None = None
 
     # Click/Interaction related
-    clicked_diner_idx: Optional[str] = None
-    clicked_diner_name: Optional[str] = None
-    display_position: Optional[int] = None
+    clicked_diner_idx: str | None = None
+    clicked_diner_name: str | None = None
+    display_position: int | None = None
 
     # Additional metadata
-    additional_data: Optional[dict[str, Any]] = None
-    user_agent: Optional[str] = None
-    ip_address: Optional[str] = None
+    additional_data: dict[str, Any] | None = None
+    user_agent: str | None = None
+    ip_address: str | None = None
 
 
 class ActivityLogFilter(BaseModel):
     """활동 로그 조회 필터"""
 
-    event_type: Optional[str] = None
-    page: Optional[str] = None
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
+    event_type: str | None = None
+    page: str | None = None
+    start_date: str | None = None
+    end_date: str | None = None
     limit: int = Field(100, ge=1, le=1000)
     offset: int = Field(0, ge=0)
 
@@ -99,7 +102,7 @@ class ActivityLogFilter(BaseModel):
 class ActivityLogExport(BaseModel):
     """ML 학습용 데이터 추출 요청"""
 
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
-    event_types: Optional[list[str]] = None
+    start_date: str | None = None
+    end_date: str | None = None
+    event_types: list[str] | None = None
     format: str = Field("json", pattern="^(json|csv)$")
@@ -1,7 +1,14 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import Ulid
+
+# 요청/응답마다 생성되고 이후 변경되지 않는 모델들이므로 frozen으로
+# 고정해 pydantic의 변경 훅과 재검증 경로를 생략합니다.
 
 
 class ItemBase(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., min_length=1, max_length=255)
     category: str | None = Field(None, max_length=100)
     description: str | None = None
@@ -9,10 +16,13 @@ class ItemBase(BaseModel):
 
 
 class ItemCreate(ItemBase):
-    pass
+    # 필드를 추가하지 않는 서브클래스: 인스턴스별 __dict__ 확장 방지
+    __slots__ = ()
 
 
 class ItemUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = Field(None, min_length=1, max_length=255)
     category: str | None = Field(None, max_length=100)
     description: str | None = None
@@ -20,19 +30,30 @@ class ItemUpdate(BaseModel):
 
 
 class Item(ItemBase):
-    id: str  # ULID
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: Ulid
     created_at: str
     updated_at: str
 
-    class Config:
-        from_attributes = True
-
 
 class ItemResponse(BaseModel):
-    id: str  # ULID
+    model_config = ConfigDict(frozen=True)
+
+    id: Ulid
     name: str
     category: str | None
     description: str | None
     location: str | None
     created_at: str
     updated_at: str
+
+
+class ItemRatingResponse(BaseModel):
+    """아이템 평점 집계 응답 (트리거로 유지되는 집계 컬럼 기반)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    item_id: int
+    average_rating: float | None
+    review_count: int
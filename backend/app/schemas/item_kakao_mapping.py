@@ -1,34 +1,45 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import Ulid
+
+# 요청/응답마다 생성되고 이후 변경되지 않는 모델들이므로 frozen으로
+# 고정해 pydantic의 변경 훅과 재검증 경로를 생략합니다.
 
 
 class ItemKakaoMappingBase(BaseModel):
-    item_id: str  # ULID
+    model_config = ConfigDict(frozen=True)
+
+    item_id: Ulid
     diner_idx: int = Field(..., description="카카오 음식점 인덱스")
     mapping_type: str = Field("manual", max_length=20)
     confidence_score: float | None = Field(None, ge=0.0, le=1.0)
 
 
 class ItemKakaoMappingCreate(ItemKakaoMappingBase):
-    pass
+    # 필드를 추가하지 않는 서브클래스: 인스턴스별 __dict__ 확장 방지
+    __slots__ = ()
 
 
 class ItemKakaoMappingUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     mapping_type: str | None = Field(None, max_length=20)
     confidence_score: float | None = Field(None, ge=0.0, le=1.0)
 
 
 class ItemKakaoMapping(ItemKakaoMappingBase):
-    id: str  # ULID
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: Ulid
     created_at: str
     updated_at: str
 
-    class Config:
-        from_attributes = True
-
 
 class ItemKakaoMappingResponse(BaseModel):
-    id: str  # ULID
-    item_id: str  # ULID
+    model_config = ConfigDict(frozen=True)
+
+    id: Ulid
+    item_id: Ulid
     diner_idx: int
     mapping_type: str
     confidence_score: float | None
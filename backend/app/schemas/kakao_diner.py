@@ -1,7 +1,32 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import Ulid
+
+# 행(음식점)마다 생성되는 응답 모델이 많은 모듈입니다. 생성 후 변경되지
+# 않으므로 frozen으로 고정해 pydantic의 변경 훅과 재검증 경로를 생략합니다.
+
+
+class SortBy(StrEnum):
+    """음식점 정렬 기준
+
+    StrEnum이므로 기존 문자열 비교 코드와 그대로 호환되며, pydantic은
+    자유 문자열 대신 멤버 조회로 검증합니다 (잘못된 값은 422).
+    """
+
+    PERSONALIZATION = "personalization"
+    POPULARITY = "popularity"
+    HIDDEN_GEM = "hidden_gem"
+    RATING = "rating"
+    DISTANCE = "distance"
+    REVIEW_COUNT = "review_count"
 
 
 class KakaoDinerBase(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     diner_idx: int = Field(..., description="카카오 음식점 고유 인덱스")
     diner_name: str = Field(
         ..., min_length=1, max_length=255, description="음식점 이름"
@@ -24,10 +49,17 @@ class KakaoDinerBase(BaseModel):
 
 
 class KakaoDinerCreate(KakaoDinerBase):
-    pass
+    # 필드를 추가하지 않는 서브클래스: 인스턴스별 __dict__ 확장 방지
+    __slots__ = ()
+
+    # 찬 경로(관리용 생성)에서만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class KakaoDinerUpdate(BaseModel):
+    # 찬 경로(관리용 수정)에서만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     diner_name: str | None = Field(None, min_length=1, max_length=255)
     diner_tag: str | None = None
     diner_menu_name: str | None = None
@@ -47,23 +79,21 @@ class KakaoDinerUpdate(BaseModel):
 
 
 class KakaoDiner(KakaoDinerBase):
-    id: str  # ULID
-    crawled_at: str
-    updated_at: str
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
-    class Config:
-        from_attributes = True
+    id: Ulid
+    crawled_at: datetime
+    updated_at: datetime
 
 
 class KakaoDinerSortRequest(BaseModel):
     """음식점 정렬/필터링 요청 스키마"""
 
+    model_config = ConfigDict(frozen=True)
+
     diner_ids: list[str] = Field(..., description="정렬할 음식점 ID 리스트 (ULID)")
     user_id: str | None = Field(None, description="사용자 ID (개인화 정렬용)")
-    sort_by: str = Field(
-        "rating",
-        description="정렬 기준 (personalization, popularity, hidden_gem, rating, distance, review_count)",
-    )
+    sort_by: SortBy = Field(SortBy.RATING, description="정렬 기준")
     min_rating: float | None = Field(None, ge=0, le=5, description="최소 평점")
     user_lat: float | None = Field(
         None, ge=-90, le=90, description="사용자 위도 (거리 정렬용)"
@@ -80,42 +110,41 @@ class KakaoDinerSortRequest(BaseModel):
 class FilteredDinerResponse(BaseModel):
     """필터링된 음식점 최소 정보 응답 (id와 distance만)"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="음식점 ULID")
     diner_idx: int = Field(..., description="카카오 음식점 고유 인덱스")
     distance: float = Field(..., description="사용자 위치로부터의 거리 (km)")
 
 
-class KakaoDinerResponse(BaseModel):
-    id: str  # ULID
-    diner_idx: int
-    diner_name: str
-    diner_tag: str | None
-    diner_menu_name: str | None
-    diner_menu_price: str | None
-    diner_review_cnt: int
-    diner_review_avg: float
-    diner_blog_review_cnt: float | None
-    diner_review_tags: str | None
-    diner_road_address: str | None
-    diner_num_address: str | None
-    diner_phone: str | None
-    diner_lat: float
-    diner_lon: float
+class KakaoDinerResponse(KakaoDinerBase):
+    """음식점 조회 응답 (기본 필드는 KakaoDinerBase에서 상속)"""
+
+    id: Ulid
+    # 조회 행은 블로그 리뷰 수가 null일 수 있어 재정의
+    diner_blog_review_cnt: float | None = Field(None, description="블로그 리뷰 개수")
+    # 크롤링된 기존 행은 Base의 범위/길이 제약을 지킨다는 보장이 없으므로
+    # 응답 쪽에서는 제약 없이 재선언합니다 (제약은 생성/수정 입력에만 적용).
+    diner_name: str = Field(..., description="음식점 이름")
+    diner_review_cnt: int = Field(..., description="리뷰 개수")
+    diner_review_avg: float = Field(..., description="평균 평점")
+    diner_phone: str | None = Field(None, description="전화번호")
+    diner_lat: float = Field(..., description="위도")
+    diner_lon: float = Field(..., description="경도")
     diner_category_large: str | None
     diner_category_middle: str | None
     diner_category_small: str | None
     diner_category_detail: str | None
-    diner_grade: int | None
-    hidden_score: float | None
-    bayesian_score: float | None
     distance: float | None = Field(None, description="사용자 위치로부터의 거리 (km)")
-    crawled_at: str
-    updated_at: str
+    crawled_at: datetime
+    updated_at: datetime
 
 
 class SearchDinerResponse(BaseModel):
     """음식점 검색 결과 응답 스키마"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="음식점 ULID")
     diner_idx: int = Field(..., description="카카오 음식점 고유 인덱스")
     diner_name: str = Field(..., description="음식점 이름")
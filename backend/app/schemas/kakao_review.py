@@ -1,7 +1,16 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import Ulid
+
+# 요청/응답마다 생성되고 이후 변경되지 않는 모델들이므로 frozen으로
+# 고정해 pydantic의 변경 훅과 재검증 경로를 생략합니다.
 
 
 class KakaoReviewBase(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     diner_idx: int = Field(..., description="음식점 인덱스")
     reviewer_id: int = Field(..., description="리뷰어 ID")
     review_id: int = Field(..., description="리뷰 고유 ID")
@@ -11,34 +20,40 @@ class KakaoReviewBase(BaseModel):
 
 
 class KakaoReviewCreate(KakaoReviewBase):
-    pass
+    # 필드를 추가하지 않는 서브클래스: 인스턴스별 __dict__ 확장 방지
+    __slots__ = ()
+
+    # 찬 경로(관리용 생성)에서만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class KakaoReviewUpdate(BaseModel):
+    # 찬 경로(관리용 수정)에서만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     reviewer_review: str | None = None
     reviewer_review_date: str | None = None
     reviewer_review_score: float | None = Field(None, ge=1, le=5)
 
 
 class KakaoReview(KakaoReviewBase):
-    id: str  # ULID
-    crawled_at: str
-    updated_at: str
-
-    class Config:
-        from_attributes = True
-
-
-class KakaoReviewResponse(BaseModel):
-    id: str  # ULID
-    diner_idx: int
-    reviewer_id: int
-    review_id: int
-    reviewer_review: str | None
-    reviewer_review_date: str | None
-    reviewer_review_score: float
-    crawled_at: str
-    updated_at: str
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: Ulid
+    crawled_at: datetime
+    updated_at: datetime
+
+
+class KakaoReviewResponse(KakaoReviewBase):
+    """리뷰 조회 응답 (기본 필드는 KakaoReviewBase에서 상속)"""
+
+    id: Ulid
+    crawled_at: datetime
+    updated_at: datetime
+
+    # 크롤링된 기존 행은 평점이 1~5 범위라는 보장이 없으므로 응답 쪽에서는
+    # 범위 제약 없이 재선언합니다 (제약은 생성/수정 입력에만 적용).
+    reviewer_review_score: float = Field(..., description="리뷰 평점")
 
 
 class KakaoReviewWithDetails(KakaoReviewResponse):
@@ -1,7 +1,16 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import Ulid
+
+# 요청/응답마다 생성되고 이후 변경되지 않는 모델들이므로 frozen으로
+# 고정해 pydantic의 변경 훅과 재검증 경로를 생략합니다.
 
 
 class KakaoReviewerBase(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     reviewer_id: int = Field(..., description="카카오 리뷰어 고유 ID")
     reviewer_user_name: str | None = Field(
         None, max_length=100, description="리뷰어 사용자명"
@@ -13,10 +22,17 @@ class KakaoReviewerBase(BaseModel):
 
 
 class KakaoReviewerCreate(KakaoReviewerBase):
-    pass
+    # 필드를 추가하지 않는 서브클래스: 인스턴스별 __dict__ 확장 방지
+    __slots__ = ()
+
+    # 찬 경로(관리용 생성)에서만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class KakaoReviewerUpdate(BaseModel):
+    # 찬 경로(관리용 수정)에서만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     reviewer_user_name: str | None = Field(None, max_length=100)
     reviewer_review_cnt: int | None = Field(None, ge=0)
     reviewer_avg: float | None = Field(None, ge=0, le=5)
@@ -25,21 +41,23 @@ class KakaoReviewerUpdate(BaseModel):
 
 
 class KakaoReviewer(KakaoReviewerBase):
-    id: str  # ULID
-    crawled_at: str
-    updated_at: str
-
-    class Config:
-        from_attributes = True
-
-
-class KakaoReviewerResponse(BaseModel):
-    id: str  # ULID
-    reviewer_id: int
-    reviewer_user_name: str | None
-    reviewer_review_cnt: int
-    reviewer_avg: float
-    badge_grade: str
-    badge_level: int
-    crawled_at: str
-    updated_at: str
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: Ulid
+    crawled_at: datetime
+    updated_at: datetime
+
+
+class KakaoReviewerResponse(KakaoReviewerBase):
+    """리뷰어 조회 응답 (기본 필드는 KakaoReviewerBase에서 상속)"""
+
+    id: Ulid
+    crawled_at: datetime
+    updated_at: datetime
+
+    # 크롤링된 기존 행은 Base의 범위/길이 제약을 지킨다는 보장이 없으므로
+    # 응답 쪽에서는 제약 없이 재선언합니다 (제약은 생성/수정 입력에만 적용).
+    reviewer_user_name: str | None = Field(None, description="리뷰어 사용자명")
+    reviewer_review_cnt: int = Field(..., description="리뷰 개수")
+    reviewer_avg: float = Field(..., description="평균 평점")
+    badge_level: int = Field(..., description="배지 레벨")
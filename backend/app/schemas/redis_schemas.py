@@ -1,23 +1,22 @@
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+# Redis에 저장하는 값의 형태. 추천 id 리스트가 기본이고, 속성별 리스트를
+# 묶은 dict와 원시 문자열도 허용합니다. Any 대신 이 유니온을 쓰면
+# pydantic-core가 분기별 특화 검증기를 생성해 제네릭 Any 경로를 타지
+# 않습니다.
+RedisValue = list[str] | dict[str, list[str]] | str
 
 
 class RedisCreateRequest(BaseModel):
-    items: dict[str, Any] = Field(
+    items: dict[str, RedisValue] = Field(
         ..., description="Key-value dictionary to create", min_length=1
     )
     expire: int | None = Field(
         None, description="Expiration time in seconds for all keys", ge=1
     )
 
-    @field_validator("items")
-    @classmethod
-    def validate_items(cls, v):
-        if not v:
-            raise ValueError("items must contain at least one key-value pair")
-        return v
-
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -107,20 +106,13 @@ class RedisReadRequest(BaseModel):
 
 
 class RedisUpdateRequest(BaseModel):
-    items: dict[str, Any] = Field(
+    items: dict[str, RedisValue] = Field(
         ..., description="Key-value dictionary to update", min_length=1
     )
     expire: int | None = Field(
         None, description="Expiration time in seconds for all keys", ge=1
     )
 
-    @field_validator("items")
-    @classmethod
-    def validate_items(cls, v):
-        if not v:
-            raise ValueError("items must contain at least one key-value pair")
-        return v
-
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -229,7 +221,7 @@ class RedisResponse(BaseModel):
 class RedisReadResponse(BaseModel):
     success: bool = Field(..., description="Operation success status")
     message: str = Field(..., description="Response message")
-    data: dict[str, Any] = Field(
+    data: dict[str, RedisValue | None] = Field(
         ..., description="Value for each key (null if not found)"
     )
     stats: dict[str, int] = Field(..., description="Read statistics")
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import Ulid
 
 
 class ReviewBase(BaseModel):
@@ -9,18 +11,21 @@ class ReviewBase(BaseModel):
 class ReviewCreate(ReviewBase):
     """리뷰 생성 (Firebase UID 사용)"""
 
-    item_id: str  # ULID
+    item_id: Ulid
 
 
 class ReviewUpdate(BaseModel):
+    # 찬 경로(리뷰 수정)에서만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(defer_build=True)
+
     score: int | None = Field(None, ge=1, le=5)
     review_text: str | None = None
 
 
 class Review(ReviewBase):
-    id: str  # ULID
+    id: Ulid
     firebase_uid: str
-    item_id: str  # ULID
+    item_id: Ulid
     created_at: str
     updated_at: str
 
@@ -29,9 +34,9 @@ class Review(ReviewBase):
 
 
 class ReviewResponse(BaseModel):
-    id: str  # ULID
+    id: Ulid
     firebase_uid: str
-    item_id: str  # ULID
+    item_id: Ulid
     score: int
     review_text: str | None
     created_at: str
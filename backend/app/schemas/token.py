@@ -2,7 +2,7 @@
 Token 관련 스키마
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TokenResponse(BaseModel):
@@ -17,12 +17,17 @@ class TokenResponse(BaseModel):
 class TokenRefreshRequest(BaseModel):
     """토큰 갱신 요청 스키마"""
 
+    # 토큰 갱신은 찬 경로이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(defer_build=True)
+
     refresh_token: str = Field(..., description="Refresh Token")
 
 
 class TokenRefreshResponse(BaseModel):
     """토큰 갱신 응답 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     access_token: str = Field(..., description="새로운 Access Token")
     token_type: str = Field(default="bearer", description="토큰 타입")
     expires_in: int = Field(..., description="Access Token 만료 시간 (초)")
@@ -48,12 +53,17 @@ class TokenPayload(BaseModel):
 class TokenVerifyRequest(BaseModel):
     """토큰 검증 요청 스키마"""
 
+    # 토큰 검증은 찬 경로이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(defer_build=True)
+
     token: str = Field(..., description="검증할 JWT 토큰")
 
 
 class TokenVerifyResponse(BaseModel):
     """토큰 검증 응답 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     valid: bool = Field(..., description="토큰 유효성")
     payload: TokenPayload | None = Field(None, description="토큰 페이로드")
     message: str | None = Field(None, description="메시지")
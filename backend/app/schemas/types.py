@@ -0,0 +1,18 @@
+"""
+스키마 공용 타입 별칭
+"""
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# ULID 문자열 (Crockford Base32, 26자)
+# `id: str  # ULID` 식 주석 대신 제약이 담긴 공용 별칭을 사용합니다.
+# 패턴 검사는 pydantic-core의 Rust 정규식으로 수행되며, model_construct로
+# 조립되는 신뢰 경로에서는 비용이 들지 않습니다.
+Ulid = Annotated[
+    str,
+    StringConstraints(
+        min_length=26, max_length=26, pattern=r"^[0-9A-HJKMNP-TV-Z]{26}$"
+    ),
+]
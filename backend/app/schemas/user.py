@@ -1,7 +1,9 @@
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.types import Ulid
 
 
 class UserIdType(StrEnum):
@@ -54,6 +56,9 @@ class OnboardingDataCreate(BaseModel):
 
 
 class UserUpdate(BaseModel):
+    # 찬 경로(프로필 수정)에서만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(defer_build=True)
+
     name: str | None = Field(None, min_length=1, max_length=100)
     email: str | None = Field(None, max_length=255)
     display_name: str | None = Field(None, max_length=100)
@@ -81,7 +86,7 @@ class UserUpdate(BaseModel):
 
 
 class User(UserBase):
-    id: str  # ULID
+    id: Ulid
     firebase_uid: str
     created_at: str
     updated_at: str
@@ -91,7 +96,7 @@ class User(UserBase):
 
 
 class UserResponse(BaseModel):
-    id: str  # ULID
+    id: Ulid
     firebase_uid: str
     name: str
     kakao_reviewer_id: str | None
@@ -125,6 +130,9 @@ class UserResponse(BaseModel):
 class FirebaseUserInfo(BaseModel):
     """Firebase에서 가져온 사용자 정보"""
 
+    # 로그인/가입 시에만 쓰이므로 스키마 빌드를 첫 사용 시로 미룸
+    model_config = ConfigDict(defer_build=True)
+
     uid: str
     email: str | None
     display_name: str | None
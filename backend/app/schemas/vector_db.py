@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    WithJsonSchema,
+)
 
 
 class VectorType(str, Enum):
@@ -12,13 +21,37 @@ class VectorType(str, Enum):
     DINER_N2V_VEC = "diner_n2v_vec"
 
 
+def _to_float32_array(value: Any) -> np.ndarray:
+    """입력 배열을 float32 연속 버퍼로 한 번에 변환
+
+    list[float]로 두면 원소마다 PyFloat 객체가 생기고 FAISS에 넣기 전에
+    다시 ndarray로 복사해야 합니다. 검증 시점에 바로 float32 버퍼로
+    바꿔 이중 할당을 없앱니다. 이미 float32 ndarray면 복사하지 않습니다.
+    """
+    array = np.asarray(value, dtype=np.float32)
+    if array.ndim != 1 or array.size == 0:
+        raise ValueError("embedding must be a non-empty 1-dimensional array")
+    return array
+
+
+# JSON으로는 숫자 배열로 직렬화/문서화되는 float32 임베딩 버퍼
+EmbeddingArray = Annotated[
+    np.ndarray,
+    BeforeValidator(_to_float32_array),
+    PlainSerializer(lambda array: array.tolist(), return_type=list[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}, "minItems": 1}),
+]
+
+
 class Vector(BaseModel):
     """사용자 벡터 데이터"""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: str = Field(
         ..., min_length=1, description="벡터의 고유 ID. 유저 ID 또는 식당 ID"
     )
-    embedding: list[float] = Field(..., min_length=1, description="임베딩 벡터")
+    embedding: EmbeddingArray = Field(..., description="임베딩 벡터")
 
 
 class StoreVectorsRequest(BaseModel):
@@ -57,9 +90,8 @@ class SimilarRequest(BaseModel):
         ..., description="검색할 벡터 타입 (user_cf_vec, user_n2v_vec, diner_n2v_vec)"
     )
     query_id: str = Field(..., min_length=1, description="유사도를 계산할 쿼리 ID")
-    query_vector: list[float] = Field(
+    query_vector: EmbeddingArray = Field(
         ...,
-        min_length=1,
         description="쿼리 벡터 (유저가 식당에 부여한 점수 벡터 또는 유저 임베딩 벡터)",
     )
     top_k: int = Field(default=5, ge=1, le=50, description="반환할 검색 결과의 수")
@@ -68,8 +100,9 @@ class SimilarRequest(BaseModel):
         description="필터링할 ID 리스트 (검색 결과에서 제외할 ID들)",
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        json_schema_extra={
             "example": {
                 "vector_type": "diner_n2v_vec",
                 "query_id": "3933744720",
@@ -110,7 +143,8 @@ class SimilarRequest(BaseModel):
                 "top_k": 5,
                 "filtering_ids": ["1642119072", "243733683"],
             }
-        }
+        },
+    )
 
 
 class SimilarResult(BaseModel):
@@ -143,6 +177,8 @@ class SearchVectorRequest(BaseModel):
 class SearchVectorResponse(BaseModel):
     """Response model for searching a vector by ID"""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: str = Field(..., description="The ID of the vector")
-    embedding: list[float] = Field(..., description="The embedding vector")
+    embedding: EmbeddingArray = Field(..., description="The embedding vector")
     vector_type: VectorType = Field(..., description="The type of the vector")
@@ -4,24 +4,32 @@
 
 import csv
 import io
+import logging
+import queue
+import threading
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any
 
 from fastapi import HTTPException, status
+from psycopg2.extras import execute_values
 
 from app.core.db import db
 from app.database.activity_log_queries import (
-    COUNT_LOGS_BY_EVENT_TYPE,
     GET_ACTIVITY_LOGS_BY_FIREBASE_UID,
     GET_ACTIVITY_LOGS_BY_SESSION,
     GET_ACTIVITY_LOGS_BY_TYPE,
     GET_ACTIVITY_LOGS_WITH_FILTER,
     GET_LOGS_FOR_ML,
-    GET_TOP_CLICKED_DINERS,
+    GET_LOGS_FOR_ML_BY_EVENT_TYPES,
+    GET_STATISTICS,
     GET_USER_PREFERRED_CATEGORIES,
     INSERT_ACTIVITY_LOG,
+    INSERT_ACTIVITY_LOG_BULK,
+    INSERT_ACTIVITY_LOG_BY_FIREBASE_UID,
 )
-from app.database.user_queries import GET_USER_ID_BY_FIREBASE_UID
+from app.database.user_queries import GET_USER_IDS_BY_FIREBASE_UIDS
 from app.schemas.activity_log import (
     ActivityLogCreate,
     ActivityLogExport,
@@ -29,6 +37,229 @@ from app.schemas.activity_log import (
     ActivityLogResponse,
 )
 from app.services.base_service import BaseService
+from app.utils.ulid_utils import generate_ulid_batch
+
+# 배치 flush 기준: 주기(초) 또는 건수 중 먼저 도달하는 쪽
+LOG_FLUSH_INTERVAL = 0.1
+LOG_FLUSH_MAX_EVENTS = 1000
+
+
+class ActivityLogBuffer:
+    """활동 로그 배치 버퍼
+
+    활동 로그는 쓰기 전용 텔레메트리라서 요청 경로가 이벤트마다 INSERT
+    왕복을 기다릴 이유가 없습니다. 엔드포인트는 큐에 넣고 바로 202를
+    반환하고, 백그라운드 flush 스레드가 LOG_FLUSH_INTERVAL(100ms) 또는
+    LOG_FLUSH_MAX_EVENTS(1000건) 단위로 모아 execute_values 대량 INSERT
+    한 번으로 적재합니다. 라우트가 동기(스레드풀) 경로이므로 asyncio.Queue
+    대신 스레드 안전한 queue.Queue를 사용합니다.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def enqueue(self, data: ActivityLogCreate) -> None:
+        """이벤트를 버퍼에 추가 (즉시 반환, 적재는 flush 스레드가 담당)"""
+        self._ensure_thread()
+        self._queue.put(data)
+
+    def _ensure_thread(self) -> None:
+        """flush 스레드 지연 시작 (로그를 쓰지 않는 프로세스에선 안 띄움)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop_event.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="activity-log-flusher", daemon=True
+                )
+                self._thread.start()
+
+    def close(self) -> None:
+        """남은 이벤트를 모두 flush하고 스레드 종료 (앱 종료 시 호출)"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=5.0)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain()
+            if batch:
+                try:
+                    self._flush(batch)
+                except Exception as e:
+                    # 텔레메트리 적재 실패가 서비스 동작을 막으면 안 됨
+                    logging.error(f"활동 로그 배치 적재 실패 ({len(batch)}건): {e}")
+            elif self._stop_event.is_set():
+                return
+
+    def _drain(self) -> list[ActivityLogCreate]:
+        """다음 배치 수집 (최대 LOG_FLUSH_INTERVAL 대기)"""
+        batch: list[ActivityLogCreate] = []
+        try:
+            batch.append(self._queue.get(timeout=LOG_FLUSH_INTERVAL))
+        except queue.Empty:
+            return batch
+        while len(batch) < LOG_FLUSH_MAX_EVENTS:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: list[ActivityLogCreate]) -> None:
+        """배치를 대량 INSERT 한 번으로 적재
+
+        firebase_uid → user_id 변환도 배치 단위 ANY(%s) 조회 한 번으로
+        처리하고, ULID는 파이썬에서 일괄 생성해 DB 왕복을 늘리지 않습니다.
+        """
+        firebase_uids = list({data.firebase_uid for data in batch})
+        with db.get_cursor() as (cursor, conn):
+            cursor.execute(GET_USER_IDS_BY_FIREBASE_UIDS, (firebase_uids,))
+            user_id_by_uid = {
+                row["firebase_uid"]: row["id"] for row in cursor.fetchall()
+            }
+
+            rows = []
+            log_ids = generate_ulid_batch(len(batch))
+            for log_id, data in zip(log_ids, batch):
+                user_id = user_id_by_uid.get(data.firebase_uid)
+                if user_id is None:
+                    # 단건 경로의 404에 해당 (이미 202로 수신했으므로 기록만)
+                    logging.warning(
+                        f"활동 로그 버림: 사용자를 찾을 수 없음 ({data.firebase_uid})"
+                    )
+                    continue
+                rows.append(
+                    (
+                        log_id,
+                        user_id,
+                        data.firebase_uid,
+                        data.session_id,
+                        data.event_type,
+                        data.page,
+                        data.location_query,
+                        data.location_address,
+                        data.location_lat,
+                        data.location_lon,
+                        data.location_method,
+                        data.search_radius_km,
+                        data.selected_large_categories,
+                        data.selected_middle_categories,
+                        data.sort_by,
+                        data.period,
+                        data.selected_city,
+                        data.selected_region,
+                        data.selected_grades,
+                        data.clicked_diner_idx,
+                        data.clicked_diner_name,
+                        data.display_position,
+                        data.additional_data,
+                        data.user_agent,
+                        data.ip_address,
+                    )
+                )
+
+            if rows:
+                try:
+                    execute_values(
+                        cursor, INSERT_ACTIVITY_LOG_BULK, rows, page_size=500
+                    )
+                    conn.commit()
+                except Exception as e:
+                    # 독성 이벤트 하나(어댑터 불가 additional_data, varchar
+                    # 초과 등)가 배치 전체를 버리게 두지 않고, 개별 행으로
+                    # 나눠 재시도합니다 (upload_service의 배치 실패 처리와
+                    # 같은 패턴). 호출부는 이미 202를 반환했으므로 여기서
+                    # 살릴 수 있는 행은 최대한 살려야 합니다.
+                    conn.rollback()
+                    logging.warning(
+                        f"활동 로그 배치 적재 실패, 행 단위 재시도 ({len(rows)}건): {e}"
+                    )
+                    self._flush_rows_individually(cursor, conn, rows)
+
+    @staticmethod
+    def _flush_rows_individually(cursor, conn, rows: list[tuple]) -> None:
+        """배치 실패 시 개별 행 단위 재적재 (실패한 행만 버림)"""
+        inserted = 0
+        dropped = 0
+        for row in rows:
+            try:
+                cursor.execute(INSERT_ACTIVITY_LOG, row)
+                conn.commit()
+                inserted += 1
+            except Exception as row_error:
+                conn.rollback()
+                dropped += 1
+                logging.warning(f"활동 로그 버림 (행 단위 적재 실패): {row_error}")
+        logging.info(f"활동 로그 행 단위 재시도: {inserted}건 적재, {dropped}건 버림")
+
+
+# update()에서 수정을 허용하는 필드 목록 (SET 절 순서 기준)
+_UPDATEABLE_FIELDS = (
+    "page",
+    "location_query",
+    "location_address",
+    "location_lat",
+    "location_lon",
+    "location_method",
+    "search_radius_km",
+    "selected_large_categories",
+    "selected_middle_categories",
+    "sort_by",
+    "period",
+    "selected_city",
+    "selected_region",
+    "selected_grades",
+    "clicked_diner_idx",
+    "clicked_diner_name",
+    "display_position",
+    "additional_data",
+    "user_agent",
+    "ip_address",
+)
+
+
+# get_list()에서 지원하는 동등 비교 필터 (WHERE 절 순서 기준)
+_LIST_FILTER_FIELDS = ("firebase_uid", "event_type", "session_id")
+
+
+@lru_cache(maxsize=16)
+def _compile_list_query(active_filters: frozenset[str]) -> tuple[str, tuple[str, ...]]:
+    """활성 필터 조합에 대한 SELECT 문과 바인딩 순서를 생성 후 캐시
+
+    필터 조합은 최대 8가지뿐이므로 요청마다 조건 리스트와 문자열 결합을
+    반복하는 대신 조합별로 한 번만 조립합니다. 같은 SQL 문자열이
+    재사용되면 Postgres도 커넥션 단위 플랜 캐시를 활용할 수 있습니다.
+    """
+    fields = tuple(field for field in _LIST_FILTER_FIELDS if field in active_filters)
+    query = "SELECT * FROM user_activity_logs"
+    if fields:
+        query += " WHERE " + " AND ".join(f"{field} = %s" for field in fields)
+    query += " ORDER BY event_timestamp DESC LIMIT %s OFFSET %s"
+    return query, fields
+
+
+@lru_cache(maxsize=256)
+def _compile_update_query(provided: frozenset[str]) -> tuple[str, tuple[str, ...]]:
+    """제공된 필드 조합에 대한 UPDATE 문과 바인딩 순서를 생성 후 캐시
+
+    user_activity_logs 테이블에는 updated_at 컬럼이 없으므로
+    BaseService._build_update_query 대신 직접 작성합니다.
+    """
+    fields = tuple(field for field in _UPDATEABLE_FIELDS if field in provided)
+    set_clause = ", ".join(f"{field} = %s" for field in fields)
+    query = f"""
+        UPDATE user_activity_logs
+        SET {set_clause}
+        WHERE id = %s
+        RETURNING *
+    """
+    return query, fields
 
 
 class ActivityLogService(
@@ -99,33 +330,19 @@ class ActivityLogService(
     def get_list(
         self, skip: int = 0, limit: int = 100, dry_run: bool = False, **filters
     ) -> list[ActivityLogResponse]:
-        """레코드 목록 조회 (BaseService 추상 메서드)"""
-        try:
-            query = f"SELECT * FROM {self.table_name}"
-            params = []
-            conditions = []
+        """레코드 목록 조회 (BaseService 추상 메서드)
 
-            # 필터 적용
-            if filters.get("firebase_uid"):
-                conditions.append("firebase_uid = %s")
-                params.append(filters["firebase_uid"])
-
-            if filters.get("event_type"):
-                conditions.append("event_type = %s")
-                params.append(filters["event_type"])
-
-            if filters.get("session_id"):
-                conditions.append("session_id = %s")
-                params.append(filters["session_id"])
-
-            if conditions:
-                query += " WHERE " + " AND ".join(conditions)
-
-            query += " ORDER BY event_timestamp DESC"
-            query += " LIMIT %s OFFSET %s"
-            params.extend([limit, skip])
+        필터 조합별 SELECT 문은 _compile_list_query에서 캐시해
+        요청마다 조건 리스트와 SQL 문자열을 다시 조립하지 않습니다.
+        """
+        try:
+            active_filters = frozenset(
+                field for field in _LIST_FILTER_FIELDS if filters.get(field)
+            )
+            query, ordered_fields = _compile_list_query(active_filters)
+            params = tuple(filters[field] for field in ordered_fields) + (limit, skip)
 
-            results = self._execute_query_all(query, tuple(params), dry_run)
+            results = self._execute_query_all(query, params, dry_run)
             return [self._convert_to_response(row) for row in results]
         except Exception as e:
             self._handle_exception("getting activity log list", e)
@@ -133,56 +350,29 @@ class ActivityLogService(
     def update(
         self, id_value: str, data: dict[str, Any], dry_run: bool = False
     ) -> ActivityLogResponse:
-        """레코드 업데이트 (BaseService 추상 메서드)"""
+        """레코드 업데이트 (BaseService 추상 메서드)
+
+        실제 요청에서 쓰이는 필드 조합 수는 적으므로, 조합별 UPDATE 문을
+        _compile_update_query에서 캐시해 요청마다 SQL 문자열을 다시
+        조립하지 않습니다.
+        """
         try:
-            # 업데이트 가능한 필드 목록
-            updateable_fields = [
-                "page",
-                "location_query",
-                "location_address",
-                "location_lat",
-                "location_lon",
-                "location_method",
-                "search_radius_km",
-                "selected_large_categories",
-                "selected_middle_categories",
-                "sort_by",
-                "period",
-                "selected_city",
-                "selected_region",
-                "selected_grades",
-                "clicked_diner_idx",
-                "clicked_diner_name",
-                "display_position",
-                "additional_data",
-                "user_agent",
-                "ip_address",
-            ]
-
-            update_fields = []
-            update_values = []
-
-            for field in updateable_fields:
-                if field in data and data[field] is not None:
-                    update_fields.append(f"{field} = %s")
-                    update_values.append(data[field])
-
-            if not update_fields:
+            provided = frozenset(
+                field
+                for field in _UPDATEABLE_FIELDS
+                if field in data and data[field] is not None
+            )
+
+            if not provided:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="업데이트할 필드가 없습니다.",
                 )
 
-            # user_activity_logs 테이블에는 updated_at 컬럼이 없으므로 직접 쿼리 작성
-            query = f"""
-                UPDATE {self.table_name}
-                SET {", ".join(update_fields)}
-                WHERE {self.primary_key_field} = %s
-                RETURNING *
-            """
-            update_values.append(id_value)
+            query, ordered_fields = _compile_update_query(provided)
+            values = tuple(data[field] for field in ordered_fields) + (id_value,)
 
-            result = self._execute_query(query, tuple(update_values), dry_run)
+            result = self._execute_query(query, values, dry_run)
             if not result:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -222,30 +412,22 @@ class ActivityLogService(
             self._handle_exception("deleting activity log", e)
 
     def create_log(self, data: ActivityLogCreate) -> ActivityLogResponse:
-        """활동 로그 생성"""
+        """활동 로그 생성
+
+        firebase_uid → user_id 해석을 INSERT 문 안의 SELECT로 수행해
+        로그 한 건당 DB 왕복을 두 번에서 한 번으로 줄입니다. 사용자가
+        없으면 INSERT가 0행을 반환하므로 그 경우에만 404를 냅니다.
+        """
         try:
             with db.get_cursor() as (cursor, conn):
-                # Firebase UID로 user_id 조회
-                cursor.execute(GET_USER_ID_BY_FIREBASE_UID, (data.firebase_uid,))
-                user_result = cursor.fetchone()
-
-                if not user_result:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail="사용자를 찾을 수 없습니다.",
-                    )
-
-                user_id = user_result["id"]
-
                 # ULID 생성
                 log_id = self._generate_ulid()
 
-                # 로그 삽입
+                # 사용자 조회와 로그 삽입을 한 왕복으로 처리
                 cursor.execute(
-                    INSERT_ACTIVITY_LOG,
+                    INSERT_ACTIVITY_LOG_BY_FIREBASE_UID,
                     (
                         log_id,
-                        user_id,
                         data.firebase_uid,
                         data.session_id,
                         data.event_type,
@@ -269,14 +451,22 @@ class ActivityLogService(
                         data.additional_data,
                         data.user_agent,
                         data.ip_address,
+                        data.firebase_uid,
                     ),
                 )
 
                 result = cursor.fetchone()
+                if not result:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="사용자를 찾을 수 없습니다.",
+                    )
                 conn.commit()
 
                 return self._convert_to_response(result)
 
+        except HTTPException:
+            raise
         except Exception as e:
             self._handle_exception("creating activity log", e)
 
@@ -325,33 +515,52 @@ class ActivityLogService(
         )
         return [self._convert_to_response(row) for row in results]
 
-    def export_logs_for_ml(self, export_params: ActivityLogExport) -> dict[str, Any]:
-        """ML 학습용 데이터 추출"""
-        try:
-            results = self._execute_query_all(
-                GET_LOGS_FOR_ML,
-                (
-                    export_params.start_date,
-                    export_params.start_date,
-                    export_params.end_date,
-                    export_params.end_date,
-                    export_params.event_types,
-                    export_params.event_types,
-                ),
+    @staticmethod
+    def _build_export_query(export_params: ActivityLogExport) -> tuple[str, tuple]:
+        """추출 파라미터에 맞는 쿼리/바인딩 구성
+
+        event_type 필터 유무에 따라 쿼리를 분기합니다
+        (배열 파라미터를 실제로 전달해야 event_type 인덱스를 활용할 수 있음).
+        """
+        if export_params.event_types:
+            return GET_LOGS_FOR_ML_BY_EVENT_TYPES, (
+                export_params.start_date,
+                export_params.start_date,
+                export_params.end_date,
+                export_params.end_date,
+                list(export_params.event_types),
             )
+        return GET_LOGS_FOR_ML, (
+            export_params.start_date,
+            export_params.start_date,
+            export_params.end_date,
+            export_params.end_date,
+        )
 
-            if export_params.format == "csv":
-                return self._convert_to_csv(results)
-            else:
-                return {"data": [dict(row) for row in results], "count": len(results)}
+    def export_logs_for_ml(self, export_params: ActivityLogExport) -> dict[str, Any]:
+        """ML 학습용 데이터 추출 (JSON 형식)"""
+        try:
+            query, params = self._build_export_query(export_params)
+            results = self._execute_query_all(query, params)
+            return {"data": [dict(row) for row in results], "count": len(results)}
 
         except Exception as e:
             self._handle_exception("exporting logs for ML", e)
 
+    def iter_export_csv(self, export_params: ActivityLogExport) -> Iterator[str]:
+        """ML 학습용 데이터를 CSV 조각 스트림으로 추출"""
+        query, params = self._build_export_query(export_params)
+        return self._iter_query_csv(query, params)
+
     def get_statistics(
-        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+        self, start_date: str | None = None, end_date: str | None = None
     ) -> dict[str, Any]:
-        """로그 통계 조회"""
+        """로그 통계 조회
+
+        이벤트 타입별 카운트와 인기 음식점을 CTE 하나로 묶어 DB 왕복을
+        한 번으로 줄입니다. json_agg 결과는 psycopg의 json 어댑터가
+        이미 리스트로 디코딩해 돌려줍니다.
+        """
         try:
             # 기본 날짜 설정
             if not start_date:
@@ -359,20 +568,14 @@ class ActivityLogService(
             if not end_date:
                 end_date = datetime.now().isoformat()
 
-            # 이벤트 타입별 카운트
-            event_counts = self._execute_query_all(
-                COUNT_LOGS_BY_EVENT_TYPE, (start_date, end_date)
-            )
-
-            # 인기 음식점
-            top_diners = self._execute_query_all(
-                GET_TOP_CLICKED_DINERS, (start_date, end_date, 20)
+            result = self._execute_query(
+                GET_STATISTICS, (start_date, end_date, start_date, end_date, 20)
             )
 
             return {
                 "period": {"start": start_date, "end": end_date},
-                "event_counts": [dict(row) for row in event_counts],
-                "top_clicked_diners": [dict(row) for row in top_diners],
+                "event_counts": result["event_counts"],
+                "top_clicked_diners": result["top_clicked_diners"],
             }
 
         except Exception as e:
@@ -393,49 +596,64 @@ class ActivityLogService(
         except Exception as e:
             self._handle_exception("getting user preferences", e)
 
-    def _convert_to_response(self, row: dict) -> ActivityLogResponse:
-        """데이터베이스 행을 응답 모델로 변환"""
-        return ActivityLogResponse(
-            id=row["id"],
-            user_id=row["user_id"],
-            firebase_uid=row["firebase_uid"],
-            session_id=row["session_id"],
-            event_type=row["event_type"],
-            event_timestamp=row["event_timestamp"].isoformat(),
-            page=row.get("page"),
-            location_query=row.get("location_query"),
-            location_address=row.get("location_address"),
-            location_lat=row.get("location_lat"),
-            location_lon=row.get("location_lon"),
-            location_method=row.get("location_method"),
-            search_radius_km=row.get("search_radius_km"),
-            selected_large_categories=row.get("selected_large_categories"),
-            selected_middle_categories=row.get("selected_middle_categories"),
-            sort_by=row.get("sort_by"),
-            period=row.get("period"),
-            selected_city=row.get("selected_city"),
-            selected_region=row.get("selected_region"),
-            selected_grades=row.get("selected_grades"),
-            clicked_diner_idx=row.get("clicked_diner_idx"),
-            clicked_diner_name=row.get("clicked_diner_name"),
-            display_position=row.get("display_position"),
-            additional_data=row.get("additional_data"),
-            user_agent=row.get("user_agent"),
-            ip_address=row.get("ip_address"),
-        )
-
-    def _convert_to_csv(self, results: list[dict]) -> dict[str, Any]:
-        """결과를 CSV 형식으로 변환"""
-        if not results:
-            return {"data": "", "count": 0}
-
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=results[0].keys())
-        writer.writeheader()
-        writer.writerows([dict(row) for row in results])
+    # event_timestamp 외에는 변환 없이 행 값을 그대로 싣는 필드들
+    # (응답 모델 필드에서 event_timestamp를 제외한 전체)
+    _RESPONSE_PASSTHROUGH_FIELDS = tuple(
+        name for name in ActivityLogResponse.model_fields if name != "event_timestamp"
+    )
 
-        return {"data": output.getvalue(), "count": len(results), "format": "csv"}
+    def _convert_to_response(self, row: dict) -> ActivityLogResponse:
+        """데이터베이스 행을 응답 모델로 변환 (신뢰 데이터이므로 검증 생략)
+
+        이 변환은 우리 DB에서 읽은(또는 INSERT ... RETURNING으로 돌려받은)
+        행만 다루므로 필드별 제약 검사를 건너뛰는 model_construct로 모델을
+        조립합니다. 외부 입력 검증은 적재 경로의 ActivityLogCreate에서
+        이미 수행됩니다. 행에 없는 선택 필드는 model_construct가 기본값으로
+        채우므로 필드별 .get() 호출 대신 dict 컴프리헨션 한 번으로
+        행 값을 옮깁니다.
+        """
+        data = {
+            field: row[field]
+            for field in self._RESPONSE_PASSTHROUGH_FIELDS
+            if field in row
+        }
+        data["event_timestamp"] = row["event_timestamp"].isoformat()
+        return ActivityLogResponse.model_construct(**data)
+
+    # 서버 측 커서가 한 번에 가져오는 행 수
+    _EXPORT_FETCH_SIZE = 1000
+
+    def _iter_query_csv(self, query: str, params: tuple) -> Iterator[str]:
+        """쿼리 결과를 CSV 조각 단위로 생성
+
+        BaseService._iter_query의 서버 측 커서 스트림을 받아
+        _EXPORT_FETCH_SIZE 행 단위로 CSV 조각을 내보냅니다. 전체 결과를
+        메모리에 모으지 않으므로 대용량 추출에서도 메모리 사용량과
+        첫 바이트 지연이 일정합니다. 헤더는 첫 행의 컬럼 순서를
+        따릅니다 (결과가 없으면 빈 본문).
+        """
+        buffer = io.StringIO()
+        writer = None
+        buffered_rows = 0
+        for row in self._iter_query(query, params, itersize=self._EXPORT_FETCH_SIZE):
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(row.keys()))
+                writer.writeheader()
+            writer.writerow(row)
+            buffered_rows += 1
+            if buffered_rows >= self._EXPORT_FETCH_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                buffered_rows = 0
+
+        remainder = buffer.getvalue()
+        if remainder:
+            yield remainder
 
 
 # 서비스 인스턴스
 activity_log_service = ActivityLogService()
+
+# 배치 적재 버퍼 (POST /activity-logs 수집 경로에서 사용)
+activity_log_buffer = ActivityLogBuffer()
@@ -4,6 +4,7 @@
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any, Generic, TypeVar
 
 from fastapi import HTTPException, status
@@ -81,6 +82,25 @@ class BaseService(ABC, Generic[CreateSchema, UpdateSchema, ResponseSchema]):
         except Exception as e:
             self._handle_exception("executing query", e)
 
+    def _iter_query(
+        self, query: str, params: tuple = None, itersize: int = 1000
+    ) -> Iterator[dict]:
+        """서버 측(named) 커서로 결과를 행 단위로 생성
+
+        _execute_query_all과 달리 전체 결과를 클라이언트 메모리에 올리지
+        않고 itersize 행씩 가져오므로 대용량 추출 경로에 적합합니다.
+        소비가 끝날 때까지 커넥션을 점유하므로 스트리밍 응답처럼 결과를
+        바로 내보내는 경로에서만 사용합니다.
+        """
+        with db.get_connection() as conn:
+            cursor = conn.cursor(name=f"{self.table_name}_iter")
+            try:
+                cursor.itersize = itersize
+                cursor.execute(query, params or ())
+                yield from cursor
+            finally:
+                cursor.close()
+
     def _check_exists(
         self, check_query: str, params: tuple, dry_run: bool = False
     ) -> bool:
@@ -383,9 +383,9 @@ class KakaoDinerService(
         if not results:
             return []
 
-        # 4. Response 모델로 변환
+        # 4. Response 모델로 변환 (일괄 검증)
         logger.debug(f"results: {len(results)}")
-        return [self._convert_to_response(row) for row in results]
+        return self._convert_rows_to_responses(results)
 
     def get_list(
         self,
@@ -547,7 +547,7 @@ class KakaoDinerService(
         logger.debug(f"results: {len(results)}")
 
         return (
-            [self._convert_to_response(row) for row in results]
+            self._convert_rows_to_responses(results)
             if not use_dataframe
             else pd.DataFrame(results)
         )
@@ -749,9 +749,51 @@ class KakaoDinerService(
         """텍스트를 정규화합니다 (한글, 영문, 숫자만 남김)"""
         return re.sub(r"[^가-힣a-zA-Z0-9]", "", text.lower().strip())
 
+    # 좁은 프로젝션 쿼리에서 빠질 수 있는 선택 필드 (일괄 변환 시 None 보충)
+    _RESPONSE_OPTIONAL_FIELDS = (
+        "diner_tag",
+        "diner_menu_name",
+        "diner_menu_price",
+        "diner_blog_review_cnt",
+        "diner_review_tags",
+        "diner_road_address",
+        "diner_num_address",
+        "diner_phone",
+        "diner_category_large",
+        "diner_category_middle",
+        "diner_category_small",
+        "diner_category_detail",
+        "diner_grade",
+        "hidden_score",
+        "bayesian_score",
+        "distance",
+    )
+
+    def _convert_rows_to_responses(self, rows: list[dict]) -> list[KakaoDinerResponse]:
+        """행 목록을 응답 모델 리스트로 일괄 변환
+
+        행 데이터는 우리 DB에서 읽어 드라이버가 이미 타입을 맞춘 신뢰
+        가능한 값이므로, 필드별 제약 검사를 건너뛰는 model_construct로
+        모델을 조립합니다. 검증은 적재 경로(크롤러/업로드)에서 이미
+        수행되었다는 전제이며, 외부 입력이 이 경로로 들어와서는 안 됩니다.
+        timestamp는 드라이버가 돌려준 datetime을 그대로 싣고(직렬화 시
+        ISO 8601로 변환됨), 쿼리에 없던 선택 필드는 None으로 보충합니다
+        (model_construct는 누락 필수 필드를 채워 주지 않음).
+        """
+        optional_fields = self._RESPONSE_OPTIONAL_FIELDS
+        construct = KakaoDinerResponse.model_construct
+        responses = []
+        for row in rows:
+            item = dict(row)
+            for field in optional_fields:
+                if field not in item:
+                    item[field] = None
+            responses.append(construct(**item))
+        return responses
+
     def _convert_to_response(self, row: dict) -> KakaoDinerResponse:
-        """데이터베이스 행을 응답 모델로 변환"""
-        return KakaoDinerResponse(
+        """데이터베이스 행을 응답 모델로 변환 (신뢰 데이터이므로 검증 생략)"""
+        return KakaoDinerResponse.model_construct(
             id=row["id"],
             diner_idx=row["diner_idx"],
             diner_name=row["diner_name"],
@@ -775,6 +817,6 @@ class KakaoDinerService(
             hidden_score=row.get("hidden_score"),
             bayesian_score=row.get("bayesian_score"),
             distance=row.get("distance"),
-            crawled_at=row["crawled_at"].isoformat(),
-            updated_at=row["updated_at"].isoformat(),
+            crawled_at=row["crawled_at"],
+            updated_at=row["updated_at"],
         )
@@ -3,7 +3,6 @@
 """
 
 from datetime import datetime
-from typing import Optional
 
 import pandas as pd
 from fastapi import HTTPException, status
@@ -14,8 +13,11 @@ from app.database.kakao_queries import (
     CHECK_KAKAO_REVIEW_EXISTS,
     CHECK_KAKAO_REVIEWER_EXISTS,
     DELETE_KAKAO_REVIEW_BY_ID,
-    GET_ALL_KAKAO_REVIEWS,
+    GET_ALL_KAKAO_REVIEWS_PLAIN,
+    GET_ALL_KAKAO_REVIEWS_PLAIN_PAGINATED,
+    GET_KAKAO_DINERS_BY_IDX_IN,
     GET_KAKAO_REVIEW_BY_ID,
+    GET_KAKAO_REVIEWERS_BY_ID_IN,
     GET_KAKAO_REVIEWS_BASE_QUERY,
     INSERT_KAKAO_REVIEW,
     UPDATE_KAKAO_REVIEW_BY_ID,
@@ -94,14 +96,14 @@ class KakaoReviewService(
 
     def get_list(
         self,
-        skip: Optional[int] = None,
-        limit: Optional[int] = None,
-        diner_idx: Optional[int] = None,
-        reviewer_id: Optional[int] = None,
-        min_rating: Optional[float] = None,
-        lower_datetime: Optional[str] = None,
-        upper_datetime: Optional[str] = None,
-        use_dataframe: Optional[bool] = False,
+        skip: int | None = None,
+        limit: int | None = None,
+        diner_idx: int | None = None,
+        reviewer_id: int | None = None,
+        min_rating: float | None = None,
+        lower_datetime: str | None = None,
+        upper_datetime: str | None = None,
+        use_dataframe: bool | None = False,
     ) -> list[KakaoReviewWithDetails]:
         """카카오 리뷰 목록 조회 (상세 정보 포함)"""
         # Validate datetime format
@@ -159,15 +161,15 @@ class KakaoReviewService(
 
             results = self._execute_query_all(query, tuple(params))
         else:
+            # 필터가 없으면 3-테이블 JOIN 대신 리뷰만 먼저 가져온 뒤
+            # diner/reviewer 메타데이터를 배치 조회로 붙입니다 (selectin 패턴)
             if skip is None and limit is None:
-                results = self._execute_query_all(GET_ALL_KAKAO_REVIEWS, ())
+                results = self._execute_query_all(GET_ALL_KAKAO_REVIEWS_PLAIN, ())
             else:
-                # 페이지네이션이 필요한 경우
-                from app.database.kakao_queries import GET_ALL_KAKAO_REVIEWS_PAGINATED
-
                 results = self._execute_query_all(
-                    GET_ALL_KAKAO_REVIEWS_PAGINATED, (limit, skip)
+                    GET_ALL_KAKAO_REVIEWS_PLAIN_PAGINATED, (limit, skip)
                 )
+            results = self._attach_details(results)
 
         return (
             [self._convert_to_details_response(row) for row in results]
@@ -213,34 +215,64 @@ class KakaoReviewService(
 
         return {"message": "Kakao review deleted successfully"}
 
+    def _attach_details(self, rows: list[dict]) -> list[dict]:
+        """리뷰 행 목록에 diner/reviewer 메타데이터를 배치 조회로 결합"""
+        if not rows:
+            return rows
+
+        diner_idxs = list({row["diner_idx"] for row in rows})
+        reviewer_ids = list({row["reviewer_id"] for row in rows})
+
+        diners = {
+            row["diner_idx"]: row
+            for row in self._execute_query_all(
+                GET_KAKAO_DINERS_BY_IDX_IN, (diner_idxs,)
+            )
+        }
+        reviewers = {
+            row["reviewer_id"]: row
+            for row in self._execute_query_all(
+                GET_KAKAO_REVIEWERS_BY_ID_IN, (reviewer_ids,)
+            )
+        }
+
+        for row in rows:
+            diner = diners.get(row["diner_idx"])
+            reviewer = reviewers.get(row["reviewer_id"])
+            row["diner_name"] = diner["diner_name"] if diner else None
+            row["diner_tag"] = diner["diner_tag"] if diner else None
+            row["reviewer_user_name"] = (
+                reviewer["reviewer_user_name"] if reviewer else None
+            )
+
+        return rows
+
     def _convert_to_response(self, row: dict) -> KakaoReviewResponse:
-        """데이터베이스 행을 응답 모델로 변환"""
-        return KakaoReviewResponse(
+        """데이터베이스 행을 응답 모델로 변환 (신뢰 데이터이므로 검증 생략)"""
+        return KakaoReviewResponse.model_construct(
             id=row["id"],
-            kakao_review_id=row["review_id"],
             diner_idx=row["diner_idx"],
             reviewer_id=row["reviewer_id"],
             review_id=row["review_id"],
             reviewer_review=row.get("reviewer_review"),
             reviewer_review_date=row.get("reviewer_review_date"),
             reviewer_review_score=row["reviewer_review_score"],
-            crawled_at=row["crawled_at"].isoformat(),
-            updated_at=row["updated_at"].isoformat(),
+            crawled_at=row["crawled_at"],
+            updated_at=row["updated_at"],
         )
 
     def _convert_to_details_response(self, row: dict) -> KakaoReviewWithDetails:
-        """데이터베이스 행을 상세 응답 모델로 변환"""
-        return KakaoReviewWithDetails(
+        """데이터베이스 행을 상세 응답 모델로 변환 (신뢰 데이터이므로 검증 생략)"""
+        return KakaoReviewWithDetails.model_construct(
             id=row["id"],
-            kakao_review_id=row["review_id"],
             diner_idx=row["diner_idx"],
             reviewer_id=row["reviewer_id"],
             review_id=row["review_id"],
             reviewer_review=row.get("reviewer_review"),
             reviewer_review_date=row.get("reviewer_review_date"),
             reviewer_review_score=row["reviewer_review_score"],
-            crawled_at=row["crawled_at"].isoformat(),
-            updated_at=row["updated_at"].isoformat(),
+            crawled_at=row["crawled_at"],
+            updated_at=row["updated_at"],
             diner_name=row.get("diner_name"),
             diner_tag=row.get("diner_tag"),
             reviewer_user_name=row.get("reviewer_user_name"),
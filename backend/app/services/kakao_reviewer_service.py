@@ -11,6 +11,7 @@ from app.database.kakao_queries import (
     DELETE_KAKAO_REVIEWER_BY_ID,
     GET_ALL_KAKAO_REVIEWERS,
     GET_KAKAO_REVIEWER_BY_ID,
+    GET_TOP_REVIEWERS,
     INSERT_KAKAO_REVIEWER,
     UPDATE_KAKAO_REVIEWER_BY_ID,
 )
@@ -127,6 +128,16 @@ class KakaoReviewerService(
             else pd.DataFrame(results)
         )
 
+    def get_top_reviewers(self, limit: int = 100) -> list[KakaoReviewerResponse]:
+        """상위 리뷰어 리더보드 조회
+
+        구체화 뷰(mv_top_kakao_reviewers)에서 읽으므로 kakao_reviewer
+        전체 정렬 없이 상위 1000명 범위 내에서만 스캔합니다.
+        뷰 갱신은 main의 주기 태스크가 수행합니다.
+        """
+        results = self._execute_query_all(GET_TOP_REVIEWERS, (limit,))
+        return [self._convert_to_response(row) for row in results]
+
     def update(
         self, reviewer_id: int, data: KakaoReviewerUpdate
     ) -> KakaoReviewerResponse:
@@ -179,6 +190,6 @@ class KakaoReviewerService(
             reviewer_avg=row["reviewer_avg"],
             badge_grade=row["badge_grade"],
             badge_level=row["badge_level"],
-            crawled_at=row["crawled_at"].isoformat(),
-            updated_at=row["updated_at"].isoformat(),
+            crawled_at=row["crawled_at"],
+            updated_at=row["updated_at"],
         )
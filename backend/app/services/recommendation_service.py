@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import IO, Optional
+from typing import IO
 
 import pandas as pd
 from scipy.sparse import csr_matrix
@@ -38,10 +38,10 @@ class RecommendationService:
 
     def _init_models(
         self,
-        review_csv_file: Optional[IO],
-        diner_csv_file: Optional[IO],
-        reviewer_csv_file: Optional[IO],
-        diner_category_csv_file: Optional[IO],
+        review_csv_file: IO | None,
+        diner_csv_file: IO | None,
+        reviewer_csv_file: IO | None,
+        diner_category_csv_file: IO | None,
     ) -> None:
         """
         Initialize user_cf model. If already initialized, skip initialization.
@@ -208,7 +208,7 @@ class RecommendationService:
             filtering_ids=diner_ids,
         ).neighbors
 
-        logging.info("Sorted result")
-        logging.info("\n".join([f"{res.id}: {res.score}" for res in sorted_result]))
+        # 전체 결과를 문자열로 엮는 로그는 요청마다 O(n) 비용이라 요약만 남김
+        logging.info(f"Sorted result: {len(sorted_result)} diners")
 
         return [res.id for res in sorted_result], [res.score for res in sorted_result]
@@ -2,7 +2,16 @@ import json
 import logging
 import os
 import subprocess
-from typing import Any, Optional
+from collections.abc import Iterable
+from typing import IO, Any
+
+import ijson
+
+# similar_restaurants 적재용 MSET 배치 크기
+MSET_BATCH_SIZE = 1000
+
+# 적재 여부 판단용 샘플 키
+SIMILAR_DINER_SAMPLE_KEY = "diner:2411227:similar_diner_ids"
 
 
 class RedisService:
@@ -27,25 +36,33 @@ class RedisService:
                 )
                 return {"error": "missing_env"}
 
+            # 이미 적재된 경우 원격 fetch 자체를 생략
+            if await self._similar_data_already_loaded():
+                return {"loaded": 0, "skipped": 0, "already_exists": True}
+
             logging.info("Fetching similar restaurants JSON from remote server...")
             cmd = (
                 f"sshpass -p {pw} ssh -p 10103 "
                 f"-o StrictHostKeyChecking=no {user}@{host} cat {remote_path}"
             )
 
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, check=True
+            # 전체 JSON을 메모리에 올리지 않고 stdout 파이프를 스트리밍 파싱
+            proc = subprocess.Popen(
+                cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
-            similar_data = json.loads(result.stdout)
+            try:
+                result = await self.load_similar_restaurants_stream(proc.stdout)
+            finally:
+                proc.stdout.close()
 
-            # Load into Redis
-            return await self.load_similar_restaurants_data(
-                similar_data, from_memory=True
-            )
+            stderr = proc.stderr.read().decode(errors="ignore")
+            proc.stderr.close()
+            if proc.wait() != 0:
+                logging.error(f"Failed to fetch JSON from remote server: {stderr}")
+                return {"error": "fetch_failed"}
+
+            return result
 
-        except subprocess.CalledProcessError as e:
-            logging.error(f"Failed to fetch JSON from remote server: {e.stderr}")
-            return {"error": "fetch_failed"}
         except Exception as e:
             logging.error(f"Redis data initialization error: {e}")
             return {"error": "unexpected_error"}
@@ -477,21 +494,62 @@ class RedisService:
             logging.error(f"Redis bulk delete error: {e}")
             raise
 
+    async def _similar_data_already_loaded(self) -> bool:
+        """샘플 키 존재 여부로 similar_restaurants 적재 여부 확인"""
+        existing = await self.read([SIMILAR_DINER_SAMPLE_KEY])
+        return existing.get(SIMILAR_DINER_SAMPLE_KEY) is not None
+
+    async def _mset_batches(self, pairs: Iterable[tuple[str, Any]]) -> int:
+        """
+        (key, value) 쌍을 MSET_BATCH_SIZE 단위로 모아 MSET 한 번에 적재
+
+        키별 SET 왕복 대신 배치당 1회 왕복만 발생하므로
+        적재 시간이 (전체 키 수 / 배치 크기)에 비례해 줄어듭니다.
+        """
+        client = await self._get_client()
+        buffer: dict[str, str] = {}
+        loaded = 0
+
+        for key, value in pairs:
+            buffer[key] = json.dumps(value, ensure_ascii=False)
+            if len(buffer) >= MSET_BATCH_SIZE:
+                await client.mset(buffer)
+                loaded += len(buffer)
+                buffer.clear()
+                logging.info(f"Redis MSET: {loaded} keys loaded")
+
+        if buffer:
+            await client.mset(buffer)
+            loaded += len(buffer)
+
+        return loaded
+
+    async def load_similar_restaurants_stream(self, fileobj: IO[bytes]) -> dict:
+        """
+        similar_restaurants.json을 스트리밍 파싱하면서 MSET 배치로 적재
+
+        ijson으로 최상위 key-value 쌍을 순회하므로 전체 JSON을
+        메모리에 올리지 않습니다.
+        """
+        pairs = (
+            (f"diner:{rid}:similar_diner_ids", [v[0] for v in lst])
+            for rid, lst in ijson.kvitems(fileobj, "")
+        )
+        loaded = await self._mset_batches(pairs)
+        logging.info(f"Similar restaurants data loaded: {loaded} keys")
+        return {"loaded": loaded, "skipped": 0}
+
     async def load_similar_restaurants_data(
-        self, data: Optional[dict] = None, from_memory: bool = False
+        self, data: dict | None = None, from_memory: bool = False
     ) -> dict[str, Any]:
         if not from_memory or not data:
             return {"loaded": 0, "skipped": 0, "error": "No data provided"}
-        sample_key = "diner:2411227:similar_diner_ids"
-        existing = await self.read([sample_key])
-        if existing.get(sample_key) is not None:
+        if await self._similar_data_already_loaded():
             return {"loaded": 0, "skipped": 0, "already_exists": True}
 
-        items = {
-            f"diner:{rid}:similar_diner_ids": [v[0] for v in lst]
+        pairs = (
+            (f"diner:{rid}:similar_diner_ids", [v[0] for v in lst])
             for rid, lst in data.items()
-        }
-        results = await self.create(items, expire=None)
-        succeeded = sum(1 for v in results.values() if v)
-        failed = len(results) - succeeded
-        return {"loaded": succeeded, "skipped": failed}
+        )
+        loaded = await self._mset_batches(pairs)
+        return {"loaded": loaded, "skipped": 0}
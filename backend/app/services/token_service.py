@@ -162,9 +162,11 @@ class TokenService:
         firebase_uid = decoded_token.get("uid")
         email = decoded_token.get("email")
         logger.info(f"firebase_uid: {firebase_uid}, email: {email}")
-        # 사용자 조회
+        # 사용자 조회 (토큰 발급에는 id/email만 필요하므로 좁은 쿼리 사용)
         try:
-            user = self.user_service.get_by_firebase_uid(firebase_uid)
+            auth_row = self.user_service.get_auth_by_firebase_uid(firebase_uid)
+            user_id = auth_row["id"]
+            user_email = auth_row["email"]
         except HTTPException as e:
             if e.status_code == status.HTTP_404_NOT_FOUND:
                 # 사용자가 없으면 자동 생성
@@ -181,15 +183,17 @@ class TokenService:
                 )
 
                 user = self.user_service.create(user_data)
+                user_id = user.id
+                user_email = user.email
                 logger.info(f"새 사용자 자동 생성: {user.id}")
             else:
                 raise
 
         # JWT 토큰 생성
         return self.create_tokens(
-            user_id=user.id,
-            firebase_uid=user.firebase_uid,
-            email=user.email,
+            user_id=user_id,
+            firebase_uid=firebase_uid,
+            email=user_email,
         )
 
 
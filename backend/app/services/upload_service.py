@@ -5,6 +5,7 @@
 import logging
 import traceback
 
+import psycopg2.extras
 from fastapi import HTTPException, UploadFile, status
 
 from app.core.db import db
@@ -26,12 +27,31 @@ class UploadService:
             "diner_menus": kakao_queries.UPDATE_KAKAO_DINER_MENU,
             "diner_reviews": kakao_queries.UPDATE_KAKAO_DINER_REVIEW,
             "diner_tags": kakao_queries.UPDATE_KAKAO_DINER_TAGS,
-            "reviewers": kakao_queries.INSERT_KAKAO_REVIEWER,
-            "reviews": kakao_queries.INSERT_KAKAO_REVIEW,
+            # 업로드 경로는 결과 행을 읽지 않으므로 RETURNING 없는 변형 사용
+            "reviewers": kakao_queries.INSERT_KAKAO_REVIEWER_SILENT,
+            "reviews": kakao_queries.INSERT_KAKAO_REVIEW_SILENT,
             "diner_grade_bayesian": kakao_queries.UPDATE_KAKAO_DINER_GRADE_BAYESIAN,
             "diner_hidden_score": kakao_queries.UPDATE_KAKAO_DINER_HIDDEN_SCORE,
         }
 
+        # execute_values용 대량 템플릿 (VALUES %s 형태)
+        # executemany는 행마다 한 번씩 왕복하므로, INSERT 계열은 다중
+        # VALUES로, UPDATE 계열은 UPDATE ... FROM (VALUES %s)로 묶어
+        # 배치당 한 문장만 전송합니다.
+        self.bulk_query_mapping = {
+            "diner_basic": kakao_queries.INSERT_KAKAO_DINER_BASIC_BULK,
+            "reviewers": kakao_queries.INSERT_KAKAO_REVIEWER_BULK,
+            "reviews": kakao_queries.INSERT_KAKAO_REVIEW_BULK,
+            "diner_categories": kakao_queries.UPDATE_KAKAO_DINER_CATEGORY_BULK,
+            "diner_menus": kakao_queries.UPDATE_KAKAO_DINER_MENU_BULK,
+            "diner_reviews": kakao_queries.UPDATE_KAKAO_DINER_REVIEW_BULK,
+            "diner_tags": kakao_queries.UPDATE_KAKAO_DINER_TAGS_BULK,
+            "diner_grade_bayesian": (
+                kakao_queries.UPDATE_KAKAO_DINER_GRADE_BAYESIAN_BULK
+            ),
+            "diner_hidden_score": kakao_queries.UPDATE_KAKAO_DINER_HIDDEN_SCORE_BULK,
+        }
+
         # 설정 일관성 검증
         self._validate_all_configs()
 
@@ -82,6 +102,8 @@ class UploadService:
                 )
 
             df = FileProcessor.clean_data(df)
+            # dtype 축소 (pyarrow string/Int32): 전체 프레임 메모리 절감
+            df = KakaoDataProcessor.shrink_dtypes(file_type, df)
 
             # Dry run 모드인 경우 실제 DB 작업 없이 검증만 수행
             if dry_run:
@@ -120,7 +142,15 @@ class UploadService:
 
                     # 배치 전체 저장 시도
                     try:
-                        cursor.executemany(self.query_mapping[file_type], batch_data)
+                        bulk_query = self.bulk_query_mapping.get(file_type)
+                        if bulk_query:
+                            psycopg2.extras.execute_values(
+                                cursor, bulk_query, batch_data, page_size=500
+                            )
+                        else:
+                            cursor.executemany(
+                                self.query_mapping[file_type], batch_data
+                            )
                         conn.commit()
                         success_count += len(batch_data)
                         logger.info(f"배치 {batch_num} 저장 성공: {len(batch_data)}개")
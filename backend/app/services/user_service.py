@@ -11,6 +11,7 @@ from app.database.user_queries import (
     CHECK_USER_EXISTS_BY_ID,
     DELETE_USER_BY_ID,
     GET_ALL_USERS,
+    GET_USER_AUTH_BY_FIREBASE_UID,
     GET_USER_BY_FIREBASE_UID,
     GET_USER_BY_ID,
     GET_USER_ID_BY_FIREBASE_UID,
@@ -19,7 +20,9 @@ from app.database.user_queries import (
     INSERT_USER_FROM_FIREBASE,
     UPDATE_USER_BY_FIREBASE_UID,
     UPDATE_USER_BY_ID,
+    UPDATE_USER_FIREBASE_PROFILE,
     UPDATE_USER_ONBOARDING,
+    USER_UPDATE_FIELD_ORDER,
 )
 from app.schemas.user import (
     OnboardingDataCreate,
@@ -101,6 +104,21 @@ class UserService(BaseService[UserCreate, UserUpdate, UserResponse]):
 
         return self._convert_to_response(result)
 
+    def get_auth_by_firebase_uid(self, firebase_uid: str) -> dict:
+        """토큰 발급용 최소 사용자 정보 조회 (id, firebase_uid, name, email)
+
+        전체 프로필 행(온보딩 JSON/배열 컬럼 포함)을 읽지 않아
+        TOAST 접근과 전송 바이트를 줄입니다.
+        """
+        result = self._execute_query(GET_USER_AUTH_BY_FIREBASE_UID, (firebase_uid,))
+        if not result:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다.",
+            )
+
+        return result
+
     def get_list(
         self, skip: int = 0, limit: int = 100, **filters
     ) -> list[UserResponse]:
@@ -112,13 +130,15 @@ class UserService(BaseService[UserCreate, UserUpdate, UserResponse]):
         self, user_id: str, data: UserUpdate, user_id_type: UserIdType = UserIdType.ID
     ) -> UserResponse:
         """사용자 정보 업데이트 (PostgreSQL DB에서 직접 업데이트)"""
+        from psycopg2.extras import Json
+
         # Choose the correct existence check and update query based on user_id_type
         if user_id_type == UserIdType.ID:
             exists_query = CHECK_USER_EXISTS_BY_ID
-            update_query_template = UPDATE_USER_BY_ID
+            update_query = UPDATE_USER_BY_ID
         else:  # firebase_uid
             exists_query = CHECK_USER_EXISTS
-            update_query_template = UPDATE_USER_BY_FIREBASE_UID
+            update_query = UPDATE_USER_BY_FIREBASE_UID
 
         # 사용자 존재 확인
         if not self._check_exists(exists_query, (user_id,)):
@@ -127,25 +147,23 @@ class UserService(BaseService[UserCreate, UserUpdate, UserResponse]):
                 detail="사용자를 찾을 수 없습니다.",
             )
 
-        # 업데이트할 필드와 값 구성 (None이 아닌 값만)
-        update_fields = []
-        update_values = []
-
-        for field, value in data.model_dump(exclude_unset=True).items():
-            if value is not None:
-                update_fields.append(f"{field} = %s")
-                update_values.append(value)
+        payload = data.model_dump(exclude_unset=True)
 
         # 업데이트할 필드가 없으면 에러
-        if not update_fields:
+        if not any(value is not None for value in payload.values()):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="업데이트할 필드가 없습니다.",
             )
 
-        # 동적으로 쿼리 생성
-        fields_str = ", ".join(update_fields) + ","
-        update_query = update_query_template.format(fields=fields_str)
+        # 고정 SET 절(COALESCE)에 맞춰 전체 필드를 순서대로 바인딩
+        # (None이면 기존 값 유지 - 쿼리 텍스트가 항상 동일해 플랜이 재사용됨)
+        update_values = []
+        for field in USER_UPDATE_FIELD_ORDER:
+            value = payload.get(field)
+            if isinstance(value, dict):
+                value = Json(value)
+            update_values.append(value)
 
         # user_id를 마지막에 추가
         update_values.append(user_id)
@@ -235,7 +253,7 @@ class UserService(BaseService[UserCreate, UserUpdate, UserResponse]):
                         if existing_user:
                             # Firebase 정보로 업데이트
                             cursor.execute(
-                                UPDATE_USER_BY_FIREBASE_UID,
+                                UPDATE_USER_FIREBASE_PROFILE,
                                 (name, email, display_name, photo_url, firebase_uid),
                             )
                             updated_count += 1
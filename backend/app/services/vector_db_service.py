@@ -220,11 +220,16 @@ class VectorDBService:
     def _store_embeddings(
         self, vector_type: VectorType, embeddings: torch.Tensor, id_mapping: dict
     ) -> int:
-        """Helper function to convert embeddings to vectors and store them"""
+        """Helper function to convert embeddings to vectors and store them
+
+        학습 산출물에서 바로 만든 신뢰 데이터이므로 요소별 검증을 건너뛰는
+        model_construct로 벡터 모델을 조립합니다.
+        """
+        construct = Vector.model_construct
         vectors = []
         for entity_id, idx in id_mapping.items():
-            embedding = embeddings[idx].detach().cpu().numpy().tolist()
-            vectors.append(Vector(id=str(int(entity_id)), embedding=embedding))
+            embedding = embeddings[idx].detach().cpu().numpy()
+            vectors.append(construct(id=str(int(entity_id)), embedding=embedding))
 
         self.store_vectors(
             vector_type=vector_type,
@@ -245,8 +250,8 @@ class VectorDBService:
         """입력받은 ID와 점수 벡터를 기반으로 FAISS 인덱스에서 내적 기반 유사 벡터 검색"""
         artifacts = self._ensure_index(vector_type)
 
-        # 입력 점수를 numpy 배열로 변환
-        query_vec = np.array(query_vec, dtype=np.float32)
+        # 입력 점수를 numpy 배열로 변환 (이미 float32 ndarray면 복사 없음)
+        query_vec = np.asarray(query_vec, dtype=np.float32)
 
         if query_vec.sum() == 0:
             raise ValueError("Input query vector cannot be zero vector")
@@ -314,8 +319,9 @@ class VectorDBService:
             raise ValueError("vectors cannot be empty")
 
         # Extract IDs and embeddings from Vector objects
+        # (embedding은 이미 float32 ndarray이므로 stack은 버퍼 복사만 수행)
         ids = [vec.id for vec in vectors]
-        vectors = np.array([vec.embedding for vec in vectors], dtype=np.float32)
+        vectors = np.stack([vec.embedding for vec in vectors])
 
         if vectors.ndim != 2:
             raise ValueError("Vectors must be 2-dimensional")
@@ -372,7 +378,7 @@ class VectorDBService:
             )
 
         # Get the embedding at that index
-        embedding = artifacts.embeddings[idx].tolist()
+        embedding = artifacts.embeddings[idx]
 
         return SearchVectorResponse(id=id, embedding=embedding, vector_type=vector_type)
 